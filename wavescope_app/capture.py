@@ -4,22 +4,47 @@ Contains monitor/managed capture dialogs, interface helpers,
 and process orchestration for packet capture flows.
 """
 
+import codecs
+
 from .core import *
 
+try:  # optional: QtDBus is packaged separately on some distributions
+    from PyQt6.QtDBus import QDBus, QDBusConnection, QDBusMessage
+except ImportError:
+    QDBusConnection = None
 
-def _detect_wifi_interfaces() -> List[Dict[str, str]]:
+
+# Last `iw dev` result, reused while the wireless links look the same in
+# sysfs; the TTL only bounds how stale a connected SSID label can get.
+_IFACE_CACHE_TTL = 60.0  # seconds
+_iface_cache: Optional[Tuple[float, tuple, List[Dict[str, str]]]] = None
+
+
+def _wireless_link_state() -> tuple:
+    """(name, type, operstate) of each wireless netdev, read from sysfs."""
+    state = []
+    try:
+        for name in sorted(os.listdir("/sys/class/net")):
+            base = f"/sys/class/net/{name}"
+            if not (
+                os.path.exists(f"{base}/wireless") or os.path.exists(f"{base}/phy80211")
+            ):
+                continue
+            with open(f"{base}/type") as fh:
+                ltype = fh.read().strip()
+            with open(f"{base}/operstate") as fh:
+                state.append((name, ltype, fh.read().strip()))
+    except OSError:
+        return ()
+    return tuple(state)
+
+
+def _parse_iw_dev(out: str) -> List[Dict[str, str]]:
     """
     Parse `iw dev` output and return a list of dicts:
       { name, phy, type, connected_ssid }
     connected_ssid is "" when the interface is not associated.
     """
-    try:
-        out = subprocess.run(
-            ["iw", "dev"], capture_output=True, text=True, timeout=4
-        ).stdout
-    except Exception:
-        return []
-
     interfaces: List[Dict[str, str]] = []
     current_phy = ""
     current_if: Dict[str, str] = {}
@@ -45,6 +70,103 @@ def _detect_wifi_interfaces() -> List[Dict[str, str]]:
     return [i for i in interfaces if i["type"] in ("managed", "AP", "")]
 
 
+def _cached_wifi_interfaces() -> Optional[List[Dict[str, str]]]:
+    if _iface_cache is None:
+        return None
+    stamp, links, ifaces = _iface_cache
+    if time.monotonic() - stamp >= _IFACE_CACHE_TTL:
+        return None
+    # Interfaces added/removed, switched to monitor, or (dis)associated
+    if not links or links != _wireless_link_state():
+        return None
+    return ifaces
+
+
+def _store_wifi_interfaces(out: str) -> List[Dict[str, str]]:
+    global _iface_cache
+    ifaces = _parse_iw_dev(out)
+    _iface_cache = (time.monotonic(), _wireless_link_state(), ifaces)
+    return ifaces
+
+
+def _detect_wifi_interfaces() -> List[Dict[str, str]]:
+    """Blocking `iw dev` lookup (cached until the wireless links change)."""
+    cached = _cached_wifi_interfaces()
+    if cached is not None:
+        return cached
+    try:
+        out = subprocess.run(
+            ["iw", "dev"], capture_output=True, text=True, timeout=4, check=False
+        ).stdout
+    except Exception:
+        return []
+    return _store_wifi_interfaces(out)
+
+
+def _detect_wifi_interfaces_async(parent, on_done) -> None:
+    """
+    Like _detect_wifi_interfaces(), but runs `iw dev` through a QProcess so
+    the GUI thread never waits on it.  *on_done* receives the interface list
+    (immediately when the cache is fresh).
+    """
+    cached = _cached_wifi_interfaces()
+    if cached is not None:
+        on_done(cached)
+        return
+    proc = QProcess(parent)
+
+    def _finished(_code=0, _status=None):
+        out = bytes(proc.readAllStandardOutput()).decode(errors="replace")
+        proc.deleteLater()
+        on_done(_store_wifi_interfaces(out))
+
+    def _failed(err):
+        if err == QProcess.ProcessError.FailedToStart:
+            proc.deleteLater()
+            on_done([])
+
+    proc.finished.connect(_finished)
+    proc.errorOccurred.connect(_failed)
+    # Same 4 s budget as the blocking path; the timer dies with the process
+    watchdog = QTimer(proc)
+    watchdog.setSingleShot(True)
+    watchdog.timeout.connect(proc.kill)
+    proc.start("iw", ["dev"])
+    watchdog.start(4000)
+
+
+def _nm_is_active() -> bool:
+    """
+    Whether NetworkManager.service is active.  Reads the unit's ActiveState
+    over systemd's D-Bus API (one round-trip on the open system bus) and only
+    falls back to spawning `systemctl is-active` when D-Bus is unavailable.
+    """
+    if QDBusConnection is not None:
+        try:
+            msg = QDBusMessage.createMethodCall(
+                "org.freedesktop.systemd1",
+                "/org/freedesktop/systemd1/unit/NetworkManager_2eservice",
+                "org.freedesktop.DBus.Properties",
+                "Get",
+            )
+            msg.setArguments(["org.freedesktop.systemd1.Unit", "ActiveState"])
+            reply = QDBusConnection.systemBus().call(msg, QDBus.CallMode.Block, 1000)
+            if reply.type() == QDBusMessage.MessageType.ReplyMessage:
+                state = reply.arguments()[0]
+                if hasattr(state, "variant"):
+                    state = state.variant()
+                return state == "active"
+        except Exception:
+            pass
+    try:
+        nm_check = subprocess.run(
+            ["systemctl", "is-active", "NetworkManager"], capture_output=True, text=True
+        )
+    except Exception:
+        return False
+    return nm_check.returncode == 0
+
+
 def _iw_chan_arg(channel: int, band: str) -> List[str]:
     """
     Return the `iw set channel` argument list for the given channel.
@@ -57,25 +179,156 @@ def _iw_chan_arg(channel: int, band: str) -> List[str]:
     return [str(channel)]
 
 
+# `iw set channel` arguments for every selectable (band, channel)
+_CHAN_ARGS: Dict[Tuple[str, int], List[str]] = {
+    (band, ch): _iw_chan_arg(ch, band)
+    for band, src in (("2.4 GHz", CH24), ("5 GHz", CH5), ("6 GHz", CH6))
+    for ch in src
+}
+
+
+class _LineDecoder:
+    """
+    Turns a process's output chunks into complete text lines.  UTF-8 is
+    decoded incrementally, so a multi-byte character or a line split across
+    two reads comes out whole; the unterminated tail waits for the next feed.
+    """
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._partial = ""
+
+    def feed(self, data: bytes) -> List[str]:
+        lines = (self._partial + self._decoder.decode(data)).split("\n")
+        self._partial = lines.pop()
+        return lines
+
+    def flush(self) -> List[str]:
+        """Whatever is left once the stream has ended."""
+        text = self._partial + self._decoder.decode(b"", final=True)
+        self._partial = ""
+        return text.splitlines()
+
+
+class _OutputChangeWatcher:
+    """
+    Tells the capture windows' 1 s tick whether the pcap changed since the
+    last look, from inotify events (QFileSystemWatcher) rather than a stat()
+    per tick.  The directory is watched too so the file is picked up once
+    tcpdump creates it; anything unwatchable simply reports "changed".
+    """
+
+    def __init__(self, parent):
+        self._watcher = QFileSystemWatcher(parent)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        self._watcher.directoryChanged.connect(self._on_dir_changed)
+        self._path = ""
+        self._changed = True
+
+    def watch(self, path: str) -> None:
+        self.stop()
+        self._path = path
+        self._changed = True
+        self._watcher.addPath(os.path.dirname(os.path.abspath(path)))
+        if os.path.exists(path):
+            self._watcher.addPath(path)
+
+    def stop(self) -> None:
+        paths = self._watcher.files() + self._watcher.directories()
+        if paths:
+            self._watcher.removePaths(paths)
+        self._path = ""
+
+    def take_changed(self) -> bool:
+        changed = self._changed or self._path not in self._watcher.files()
+        self._changed = False
+        return changed
+
+    def _on_file_changed(self, path: str) -> None:
+        self._changed = True
+        # Replaced or deleted files drop out of the watch list
+        if path not in self._watcher.files() and os.path.exists(path):
+            self._watcher.addPath(path)
+
+    def _on_dir_changed(self, _path: str) -> None:
+        if self._path and self._path not in self._watcher.files():
+            if os.path.exists(self._path):
+                self._watcher.addPath(self._path)
+                self._changed = True
+
+
+_MMSS_FMT = "%02d:%02d"  # elapsed-time label
+
+# Start/Stop button styles, swapped on every state change
+_QSS_BTN_START = (
+    f"QPushButton {{ background:{CAPTURE_BTN_START_BG}; color:{CAPTURE_BTN_START_FG}; border:none;"
+    " border-radius:5px; font-size:11pt; font-weight:bold; }"
+    f"QPushButton:hover {{ background:{CAPTURE_BTN_START_HOVER}; }}"
+    f"QPushButton:disabled {{ background:{CAPTURE_BTN_DIS_BG}; color:{CAPTURE_BTN_DIS_FG}; }}"
+)
+_QSS_BTN_STOP = (
+    f"QPushButton {{ background:{CAPTURE_BTN_STOP_BG}; color:{CAPTURE_BTN_STOP_FG}; border:none;"
+    " border-radius:5px; font-size:11pt; font-weight:bold; }"
+    f"QPushButton:hover {{ background:{CAPTURE_BTN_STOP_HOVER}; }}"
+)
+
+
+def _format_size(sz: int) -> str:
+    """Pcap size as shown in the capture windows' stats row."""
+    if sz < 1024 * 1024:
+        return f"{sz / 1024:.1f} KB"
+    return f"{sz / 1024 / 1024:.2f} MB"
+
+
+# tcpdump options shared by both capture modes.  Receive-side batching is
+# libpcap's job: with a TPACKET_V3 ring it wakes once per retired block of
+# frames, not once per packet, so the knob that matters here is the ring
+# size (-B, in KiB).  No -U: the pcap is written through stdio's buffer,
+# one write() per filled block rather than per packet; tcpdump flushes it
+# on the SIGINT the stop path sends.
+#
+# Nothing on the scripts' stdout/stderr pipes sits in a stdio buffer, so
+# no stdbuf wrapper is needed: the WAVESCOPE_* markers come from bash's
+# builtin echo (one write() each), and with -w tcpdump prints nothing to
+# stdout while its status lines go to stderr, which libc never buffers.
+_TCPDUMP_OPTS = "-B 65536 -e -nn"
+
+# The capture scripts are fixed text: per-capture values arrive as
+# positional arguments (pkexec does not pass the environment through), so
+# each script is written once to CAPTURE_SCRIPT_DIR and reused.
+CAPTURE_SCRIPT_DIR = Path.home() / ".cache" / "wavescope"
+
+# Args: IFACE OUTPUT PID_FILE NM(1 = stop/restart NetworkManager) CHAN_ARGS…
 _MONITOR_MASTER_TMPL = """\
 #!/bin/bash
-IFACE={iface}
+IFACE="$1"
+OUTPUT="$2"
+PID_FILE="$3"
+NM="$4"
+shift 4  # the rest are `iw set channel` arguments
 MON=mon0
-OUTPUT={output}
-PID_FILE={pid_file}
 
 # ── SETUP ──────────────────────────────────────────────
-{nm_stop}ip link set "$IFACE" down
+[[ "$NM" == 1 ]] && systemctl stop NetworkManager
+ip link set "$IFACE" down
 iw dev "$IFACE" interface add "$MON" type monitor 2>/dev/null || true
 ip link set "$MON" up
-iw dev "$MON" set channel {chan_args}
+iw dev "$MON" set channel "$@"
 echo "WAVESCOPE_SETUP_OK"
 
 # ── CAPTURE ─────────────────────────────────────────
-tcpdump -i "$MON" -e -nn -U -w "$OUTPUT" &
+tcpdump -i "$MON" {tcpdump_opts} -w "$OUTPUT" &
 TDPID=$!
 echo "$TDPID" > "$PID_FILE"
+# "STOP" on stdin ends the capture, so stopping needs no second pkexec.
+# (Background jobs get /dev/null as stdin, hence the copy on fd 3.)
+exec 3<&0
+while read -r CMD <&3; do
+    if [[ "$CMD" == STOP ]]; then kill -INT "$TDPID" 2>/dev/null; break; fi
+done &
+READER=$!
 wait "$TDPID"
+kill "$READER" 2>/dev/null
 rm -f "$PID_FILE" 2>/dev/null
 echo "WAVESCOPE_CAPTURE_DONE"
 
@@ -83,61 +336,118 @@ echo "WAVESCOPE_CAPTURE_DONE"
 ip link set "$MON" down 2>/dev/null || true
 iw dev "$MON" del 2>/dev/null || true
 ip link set "$IFACE" up 2>/dev/null || true
-{nm_start}echo "WAVESCOPE_TEARDOWN_OK"
+[[ "$NM" == 1 ]] && systemctl start NetworkManager
+echo "WAVESCOPE_TEARDOWN_OK"
 """
 
+# Args: IFACE PID_FILE NM
 _MONITOR_CLEANUP_TMPL = """\
 #!/bin/bash
 # Emergency cleanup — kills tcpdump by saved PID, tears down mon0, restores wifi
-IFACE={iface}
+IFACE="$1"
+PID_FILE="$2"
+NM="$3"
 MON=mon0
-PID_FILE={pid_file}
 
 if [[ -f "$PID_FILE" ]]; then
     TDPID=$(cat "$PID_FILE")
-    kill -INT "$TDPID" 2>/dev/null || true
-    sleep 1
-    kill -KILL "$TDPID" 2>/dev/null || true
+    # Signal only if the PID still belongs to tcpdump (it may have been reused)
+    if [[ "$(cat "/proc/$TDPID/comm" 2>/dev/null)" == "tcpdump" ]]; then
+        kill -INT "$TDPID" 2>/dev/null || true
+        # Returns the moment tcpdump exits; force-kill only if it outlives 2 s
+        if ! timeout 2 tail --pid="$TDPID" -f /dev/null 2>/dev/null; then
+            kill -KILL "$TDPID" 2>/dev/null || true
+        fi
+    fi
     rm -f "$PID_FILE"
 fi
 ip link set "$MON" down 2>/dev/null || true
 iw dev "$MON" del 2>/dev/null || true
 ip link set "$IFACE" up 2>/dev/null || true
-{nm_start}echo "WAVESCOPE_CLEANUP_OK"
+[[ "$NM" == 1 ]] && systemctl start NetworkManager
+echo "WAVESCOPE_CLEANUP_OK"
 """
 
+# Args: IFACE OUTPUT PID_FILE
 _MANAGED_CAPTURE_TMPL = """\
 #!/bin/bash
 # Managed-mode capture — WiFi stays connected; only your machine's traffic.
-IFACE={iface}
-OUTPUT={output}
-PID_FILE={pid_file}
+IFACE="$1"
+OUTPUT="$2"
+PID_FILE="$3"
 
-tcpdump -i "$IFACE" -e -nn -U -w "$OUTPUT" &
+tcpdump -i "$IFACE" {tcpdump_opts} -w "$OUTPUT" &
 TDPID=$!
 echo "$TDPID" > "$PID_FILE"
 echo "WAVESCOPE_CAPTURE_OK"
+# "STOP" on stdin ends the capture, so stopping needs no second pkexec.
+# (Background jobs get /dev/null as stdin, hence the copy on fd 3.)
+exec 3<&0
+while read -r CMD <&3; do
+    if [[ "$CMD" == STOP ]]; then kill -INT "$TDPID" 2>/dev/null; break; fi
+done &
+READER=$!
 wait "$TDPID"
+kill "$READER" 2>/dev/null
 rm -f "$PID_FILE" 2>/dev/null
 echo "WAVESCOPE_CAPTURE_DONE"
 """
 
+# Args: PID_FILE
 _MANAGED_CLEANUP_TMPL = """\
 #!/bin/bash
 # Clean stop — sends SIGINT to tcpdump so it flushes the pcap properly.
-PID_FILE={pid_file}
+PID_FILE="$1"
 
 if [[ -f "$PID_FILE" ]]; then
     TDPID=$(cat "$PID_FILE")
-    kill -INT "$TDPID" 2>/dev/null || true
-    sleep 1
-    kill -KILL "$TDPID" 2>/dev/null || true
+    # Signal only if the PID still belongs to tcpdump (it may have been reused)
+    if [[ "$(cat "/proc/$TDPID/comm" 2>/dev/null)" == "tcpdump" ]]; then
+        kill -INT "$TDPID" 2>/dev/null || true
+        # Returns the moment tcpdump exits; force-kill only if it outlives 2 s
+        if ! timeout 2 tail --pid="$TDPID" -f /dev/null 2>/dev/null; then
+            kill -KILL "$TDPID" 2>/dev/null || true
+        fi
+    fi
     rm -f "$PID_FILE"
 fi
 echo "WAVESCOPE_CLEANUP_OK"
 """
 
 
+# Script bytes, rendered once at import: nothing in them varies per capture
+_CAPTURE_SCRIPTS: Dict[str, bytes] = {
+    name: tmpl.format(tcpdump_opts=_TCPDUMP_OPTS).encode()
+    for name, tmpl in (
+        ("monitor_master.sh", _MONITOR_MASTER_TMPL),
+        ("monitor_cleanup.sh", _MONITOR_CLEANUP_TMPL),
+        ("managed_capture.sh", _MANAGED_CAPTURE_TMPL),
+        ("managed_cleanup.sh", _MANAGED_CLEANUP_TMPL),
+    )
+}
+
+
+def _capture_script(name: str) -> str:
+    """
+    Path of capture script *name* in CAPTURE_SCRIPT_DIR, (re)written only when
+    missing or not byte-identical to _CAPTURE_SCRIPTS[name] — the check also
+    keeps pkexec from running a script that was altered on disk.
+    """
+    path = CAPTURE_SCRIPT_DIR / name
+    data = _CAPTURE_SCRIPTS[name]
+    try:
+        if path.read_bytes() == data:
+            return str(path)
+    except OSError:
+        pass
+    CAPTURE_SCRIPT_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.chmod(tmp, stat.S_IRWXU)
+    os.replace(tmp, path)
+    return str(path)
+
+
 class CaptureTypeDialog(QDialog):
     """Small picker — user chooses between Monitor Mode and Managed Mode capture."""
 
@@ -210,23 +520,27 @@ class CaptureTypeDialog(QDialog):
 
             def __init__(self, bg, hover):
                 super().__init__()
-                self._bg = bg
-                self._hover = hover
                 self.setCursor(Qt.CursorShape.PointingHandCursor)
                 self.setMinimumHeight(110)
-                self._apply_style(bg)
-
-            def _apply_style(self, color):
+                # Both states parsed once; hovering only flips a property
+                self.setObjectName("captureCard")
+                self.setProperty("hover", False)
                 self.setStyleSheet(
-                    f"QFrame {{ background:{color}; border:1px solid {CAPTURE_CARD_BORDER};"
-                    f" border-radius:8px; }}"
+                    f"QFrame#captureCard {{ background:{bg};"
+                    f" border:1px solid {CAPTURE_CARD_BORDER}; border-radius:8px; }}"
+                    f'QFrame#captureCard[hover="true"] {{ background:{hover}; }}'
                 )
 
+            def _set_hover(self, on: bool):
+                self.setProperty("hover", on)
+                self.style().unpolish(self)
+                self.style().polish(self)
+
             def enterEvent(self, _e):
-                self._apply_style(self._hover)
+                self._set_hover(True)
 
             def leaveEvent(self, _e):
-                self._apply_style(self._bg)
+                self._set_hover(False)
 
             def mousePressEvent(self, e):
                 if e.button() == Qt.MouseButton.LeftButton:
@@ -283,15 +597,31 @@ class MonitorModeWindow(QDialog):
         self.setModal(False)
 
         self._state = self._ST_IDLE
+        self._state_label = "Idle"  # text shown in _lbl_state
         self._proc = None
         self._cleanup_proc = None  # second pkexec for stop/teardown
-        self._master_script = ""  # path to single temp script
+        self._cleanup_out = _LineDecoder()
+        self._cleanup_err = _LineDecoder()
         self._pid_file = ""  # tcpdump PID written here by master script
-        self._stdout_buf = ""  # partial-line buffer for stdout
+        self._stderr_lines = _LineDecoder()
         self._start_time = 0.0
+        self._close_when_idle = False  # set by closeEvent during a capture
         self._timer = QTimer(self)
         self._timer.setInterval(1000)
         self._timer.timeout.connect(self._tick)
+        self._output_watch = _OutputChangeWatcher(self)
+        self._last_size_str = ""
+        # Last-resort force-kill if cleanup pkexec itself hangs
+        self._force_kill_timer = QTimer(self)
+        self._force_kill_timer.setSingleShot(True)
+        self._force_kill_timer.setInterval(20000)
+        self._force_kill_timer.timeout.connect(self._force_kill_capture)
+        # Log lines are queued and appended in one batch per 50 ms
+        self._log_pending: List[str] = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_log)
         self._nm_was_running = False
 
         self._build_ui()
@@ -361,12 +691,7 @@ class MonitorModeWindow(QDialog):
         # ── Start / Stop button ───────────────────────────────────────────
         self._btn_start = QPushButton("▶  Start Capture")
         self._btn_start.setMinimumHeight(38)
-        self._btn_start.setStyleSheet(
-            f"QPushButton {{ background:{CAPTURE_BTN_START_BG}; color:{CAPTURE_BTN_START_FG}; border:none;"
-            " border-radius:5px; font-size:11pt; font-weight:bold; }"
-            f"QPushButton:hover {{ background:{CAPTURE_BTN_START_HOVER}; }}"
-            f"QPushButton:disabled {{ background:{CAPTURE_BTN_DIS_BG}; color:{CAPTURE_BTN_DIS_FG}; }}"
-        )
+        self._btn_start.setStyleSheet(_QSS_BTN_START)
         self._btn_start.clicked.connect(self._on_start_stop)
         layout.addWidget(self._btn_start)
 
@@ -389,8 +714,6 @@ class MonitorModeWindow(QDialog):
         layout.addLayout(stats_row)
 
         # ── Log area ──────────────────────────────────────────────────────
-        from PyQt6.QtWidgets import QPlainTextEdit
-
         self._log = QPlainTextEdit()
         self._log.setReadOnly(True)
         self._log.setMaximumBlockCount(500)
@@ -400,14 +723,27 @@ class MonitorModeWindow(QDialog):
         )
         layout.addWidget(self._log)
 
+        # Channel lists per band, built once and swapped in on band change
+        self._chan_models = {
+            "2.4 GHz": self._build_chan_model(CH24),
+            "5 GHz": self._build_chan_model(CH5),
+            "6 GHz": self._build_chan_model(CH6),
+        }
         # Populate band → channel on start
         self._on_band_sel(self._band_sel.currentText())
 
     # ── Populate helpers ──────────────────────────────────────────────────
 
     def _populate_interfaces(self):
-        self._ifaces = _detect_wifi_interfaces()
         self._iface_combo.clear()
+        self._iface_combo.addItem("Detecting WiFi interfaces…")
+        self._btn_start.setEnabled(False)
+        _detect_wifi_interfaces_async(self, self._fill_interfaces)
+
+    def _fill_interfaces(self, ifaces: List[Dict[str, str]]):
+        self._ifaces = ifaces
+        self._iface_combo.clear()
+        self._btn_start.setEnabled(True)
         if not self._ifaces:
             self._iface_combo.addItem("No WiFi interfaces found")
             self._btn_start.setEnabled(False)
@@ -421,20 +757,20 @@ class MonitorModeWindow(QDialog):
     def _on_iface_change(self, _idx):
         pass  # could refresh band capabilities in future
 
-    def _on_band_sel(self, band: str):
-        self._chan_combo.clear()
-        if band == "2.4 GHz":
-            src = CH24
-        elif band == "5 GHz":
-            src = CH5
-        else:
-            src = CH6
+    def _build_chan_model(self, src: Dict[int, int]) -> QStandardItemModel:
+        model = QStandardItemModel(self)
         for ch, freq in sorted(src.items(), key=lambda x: x[1]):
-            self._chan_combo.addItem(f"Ch {ch}  ({freq} MHz)", ch)
+            item = QStandardItem(f"Ch {ch}  ({freq} MHz)")
+            item.setData(ch, Qt.ItemDataRole.UserRole)
+            model.appendRow(item)
+        return model
 
-    def _on_browse(self):
-        from PyQt6.QtWidgets import QFileDialog
+    def _on_band_sel(self, band: str):
+        model = self._chan_models.get(band, self._chan_models["6 GHz"])
+        self._chan_combo.setModel(model)
+        self._chan_combo.setCurrentIndex(0)
 
+    def _on_browse(self):
         path, _ = QFileDialog.getSaveFileName(
             self,
             "Choose output file",
@@ -467,6 +803,9 @@ class MonitorModeWindow(QDialog):
         if not output:
             self._log_line("⚠  No output file specified.")
             return
+        if not os.path.isdir(os.path.dirname(os.path.abspath(output))):
+            self._log_line("⚠  Output folder does not exist.")
+            return
 
         band = self._band_sel.currentText()
         self._iface_name = iface
@@ -475,10 +814,7 @@ class MonitorModeWindow(QDialog):
         self._band = band
 
         # Check & record if NetworkManager is running so we restore it
-        nm_check = subprocess.run(
-            ["systemctl", "is-active", "NetworkManager"], capture_output=True, text=True
-        )
-        self._nm_was_running = nm_check.returncode == 0
+        self._nm_was_running = _nm_is_active()
 
         self._log_line(f"Interface : {iface}")
         self._log_line(f"Band/Chan : {band}  ch {channel}")
@@ -489,51 +825,47 @@ class MonitorModeWindow(QDialog):
         self._run_master()
 
     def _run_master(self):
-        """Build and launch the single combined pkexec script."""
+        """Launch the combined setup/capture/teardown script via pkexec."""
         self._set_state(self._ST_SETUP, "Setting up monitor interface…")
 
-        chan_args = " ".join(_iw_chan_arg(self._channel, self._band))
-        nm_stop = "systemctl stop NetworkManager\n" if self._nm_was_running else ""
-        nm_start = "systemctl start NetworkManager\n" if self._nm_was_running else ""
-
-        import tempfile as _tf
-
-        self._pid_file = _tf.mktemp(prefix="wavescope_tdpid_", suffix=".pid")
-        script_body = _MONITOR_MASTER_TMPL.format(
-            iface=self._iface_name,
-            output=self._output_path,
-            chan_args=chan_args,
-            nm_stop=nm_stop,
-            nm_start=nm_start,
-            pid_file=self._pid_file,
-        )
-        self._master_script = self._write_temp_script(script_body)
-        self._stdout_buf = ""
+        self._pid_file = tempfile.mktemp(prefix="wavescope_tdpid_", suffix=".pid")
+        script = _capture_script("monitor_master.sh")
 
+        self._stderr_lines = _LineDecoder()
         self._proc = self._make_process()
         self._proc.readyReadStandardOutput.connect(self._on_stdout)
         self._proc.readyReadStandardError.connect(self._on_stderr)
         self._proc.finished.connect(self._on_proc_finished)
-        self._proc.start("pkexec", ["bash", self._master_script])
+        self._proc.start(
+            "pkexec",
+            [
+                "bash",
+                script,
+                self._iface_name,
+                self._output_path,
+                self._pid_file,
+                "1" if self._nm_was_running else "0",
+            ]
+            + _CHAN_ARGS[(self._band, self._channel)],
+        )
         self._log_line("▶  Starting (Polkit authentication may appear…)")
 
     def _on_stdout(self):
-        self._stdout_buf += bytes(self._proc.readAllStandardOutput()).decode(
-            errors="replace"
-        )
-        while "\n" in self._stdout_buf:
-            line, self._stdout_buf = self._stdout_buf.split("\n", 1)
-            line = line.strip()
+        # QProcess keeps the partial-line buffer; only whole lines come out
+        while self._proc.canReadLine():
+            line = bytes(self._proc.readLine()).decode(errors="replace").strip()
             if not line:
                 continue
             if line == "WAVESCOPE_SETUP_OK":
                 self._log_line("✓  Monitor interface mon0 ready.")
                 self._set_state(self._ST_CAPTURE, "Capturing…")
                 self._start_time = time.monotonic()
+                self._output_watch.watch(self._output_path)
                 self._timer.start()
                 self._log_line("▶  tcpdump running — click Stop to end capture.")
             elif line == "WAVESCOPE_CAPTURE_DONE":
                 self._timer.stop()
+                self._output_watch.stop()
                 self._set_state(self._ST_TEARDOWN, "Restoring interface…")
                 self._log_line("▶  Restoring interface and NetworkManager…")
             elif line == "WAVESCOPE_TEARDOWN_OK":
@@ -542,22 +874,22 @@ class MonitorModeWindow(QDialog):
                 self._log_line(f"  {line}")
 
     def _on_stderr(self):
-        data = bytes(self._proc.readAllStandardError()).decode(errors="replace")
-        for line in data.splitlines():
+        data = bytes(self._proc.readAllStandardError())
+        for line in self._stderr_lines.feed(data):
             s = line.strip()
             if s:
                 self._log_line(f"  {s}")
 
     def _on_proc_finished(self, exit_code: int, _exit_status):
         self._timer.stop()
-        self._stdout_buf += bytes(self._proc.readAllStandardOutput()).decode(
-            errors="replace"
-        )
-        for line in self._stdout_buf.splitlines():
+        self._force_kill_timer.stop()
+        self._output_watch.stop()
+        tail = bytes(self._proc.readAllStandardOutput()).decode(errors="replace")
+        self._on_stderr()
+        for line in tail.splitlines() + self._stderr_lines.flush():
             ln = line.strip()
             if ln and not ln.startswith("WAVESCOPE_"):
                 self._log_line(f"  {ln}")
-        self._stdout_buf = ""
 
         if exit_code != 0 and self._state == self._ST_SETUP:
             self._log_line(
@@ -574,12 +906,6 @@ class MonitorModeWindow(QDialog):
         # Only reset UI if cleanup hasn't already done it
         if self._state != self._ST_IDLE:
             self._reset_ui_to_idle("Idle — capture complete")
-        try:
-            if self._master_script:
-                os.unlink(self._master_script)
-                self._master_script = ""
-        except OSError:
-            pass
         try:
             if self._pid_file and os.path.exists(self._pid_file):
                 os.unlink(self._pid_file)
@@ -589,13 +915,12 @@ class MonitorModeWindow(QDialog):
 
     def _reset_ui_to_idle(self, label: str = "Idle"):
         self._set_state(self._ST_IDLE, label)
+        if self._close_when_idle:
+            # Finish the close the user asked for while capture was running
+            self._close_when_idle = False
+            QTimer.singleShot(0, self.close)
         self._btn_start.setText("▶  Start Capture")
-        self._btn_start.setStyleSheet(
-            f"QPushButton {{ background:{CAPTURE_BTN_START_BG}; color:{CAPTURE_BTN_START_FG}; border:none;"
-            " border-radius:5px; font-size:11pt; font-weight:bold; }"
-            f"QPushButton:hover {{ background:{CAPTURE_BTN_START_HOVER}; }}"
-            f"QPushButton:disabled {{ background:{CAPTURE_BTN_DIS_BG}; color:{CAPTURE_BTN_DIS_FG}; }}"
-        )
+        self._btn_start.setStyleSheet(_QSS_BTN_START)
         self._btn_start.setEnabled(True)
         try:
             sz = os.path.getsize(self._output_path)
@@ -607,36 +932,50 @@ class MonitorModeWindow(QDialog):
         if self._state in (self._ST_CAPTURE, self._ST_SETUP) and self._proc:
             self._btn_start.setEnabled(False)
             self._btn_start.setText("⏳  Stopping…")
-            self._log_line(
-                "⏹  Stopping — launching cleanup (a password prompt may appear)…"
-            )
             self._set_state(self._ST_TEARDOWN, "Stopping…")
-            self._run_cleanup()
-            # Last-resort force-kill if cleanup pkexec itself hangs
-            QTimer.singleShot(20000, self._force_kill_capture)
+            if self._send_stop():
+                self._log_line("⏹  Stopping…")
+            else:
+                self._log_line(
+                    "⏹  Stopping — launching cleanup (a password prompt may appear)…"
+                )
+                self._run_cleanup()
+            self._force_kill_timer.start()
+
+    def _send_stop(self) -> bool:
+        """Ask the running capture script, already root, to stop tcpdump."""
+        if self._proc.state() != QProcess.ProcessState.Running:
+            return False
+        return self._proc.write(b"STOP\n") > 0
 
     def _run_cleanup(self):
-        nm_start = "systemctl start NetworkManager\n" if self._nm_was_running else ""
-        script_body = _MONITOR_CLEANUP_TMPL.format(
-            iface=self._iface_name,
-            pid_file=self._pid_file,
-            nm_start=nm_start,
-        )
-        cleanup_path = self._write_temp_script(script_body)
+        script = _capture_script("monitor_cleanup.sh")
         self._cleanup_proc = self._make_process()
+        self._cleanup_out = _LineDecoder()
+        self._cleanup_err = _LineDecoder()
         self._cleanup_proc.readyReadStandardOutput.connect(self._on_cleanup_stdout)
         self._cleanup_proc.readyReadStandardError.connect(self._on_cleanup_stderr)
         self._cleanup_proc.finished.connect(
-            lambda code, _s, p=cleanup_path: self._on_cleanup_finished(code, p)
+            lambda code, _s: self._on_cleanup_finished(code)
+        )
+        self._cleanup_proc.start(
+            "pkexec",
+            [
+                "bash",
+                script,
+                self._iface_name,
+                self._pid_file,
+                "1" if self._nm_was_running else "0",
+            ],
         )
-        self._cleanup_proc.start("pkexec", ["bash", cleanup_path])
         self._log_line("▶  Cleanup running…")
 
     def _on_cleanup_stdout(self):
-        data = bytes(self._cleanup_proc.readAllStandardOutput()).decode(
-            errors="replace"
-        )
-        for line in data.splitlines():
+        data = bytes(self._cleanup_proc.readAllStandardOutput())
+        self._log_cleanup_stdout(self._cleanup_out.feed(data))
+
+    def _log_cleanup_stdout(self, lines: List[str]):
+        for line in lines:
             ln = line.strip()
             if ln == "WAVESCOPE_CLEANUP_OK":
                 self._log_line("✓  Interface and NetworkManager restored.")
@@ -644,18 +983,27 @@ class MonitorModeWindow(QDialog):
                 self._log_line(f"  {ln}")
 
     def _on_cleanup_stderr(self):
-        data = bytes(self._cleanup_proc.readAllStandardError()).decode(errors="replace")
-        for line in data.splitlines():
+        data = bytes(self._cleanup_proc.readAllStandardError())
+        self._log_cleanup_stderr(self._cleanup_err.feed(data))
+
+    def _log_cleanup_stderr(self, lines: List[str]):
+        for line in lines:
             s = line.strip()
             if s:
                 self._log_line(f"  {s}")
 
-    def _on_cleanup_finished(self, exit_code: int, cleanup_path: str):
-        try:
-            os.unlink(cleanup_path)
-        except OSError:
-            pass
-        self._cleanup_proc = None
+    def _on_cleanup_finished(self, exit_code: int):
+        proc, self._cleanup_proc = self._cleanup_proc, None
+        # Drain what arrived after the last readyRead, then any unterminated tail
+        self._log_cleanup_stdout(
+            self._cleanup_out.feed(bytes(proc.readAllStandardOutput()))
+            + self._cleanup_out.flush()
+        )
+        self._log_cleanup_stderr(
+            self._cleanup_err.feed(bytes(proc.readAllStandardError()))
+            + self._cleanup_err.flush()
+        )
+        self._force_kill_timer.stop()
         if exit_code != 0:
             self._log_line(f"⚠  Cleanup exited with code {exit_code}.")
         # Reset UI — master process may still be exiting but that's fine
@@ -663,8 +1011,6 @@ class MonitorModeWindow(QDialog):
             self._reset_ui_to_idle("Idle — capture stopped")
 
     def _force_kill_capture(self):
-        from PyQt6.QtCore import QProcess
-
         if (
             self._state != self._ST_IDLE
             and self._proc
@@ -677,38 +1023,28 @@ class MonitorModeWindow(QDialog):
 
     # ── Helpers ───────────────────────────────────────────────────────────
 
-    def _make_process(self) -> "QProcess":
-        from PyQt6.QtCore import QProcess
-
+    def _make_process(self) -> QProcess:
         p = QProcess(self)
         p.setProcessChannelMode(QProcess.ProcessChannelMode.SeparateChannels)
         return p
 
-    def _write_temp_script(self, body: str) -> str:
-        fd, path = tempfile.mkstemp(suffix=".sh", prefix="wavescope_")
-        with os.fdopen(fd, "w") as fh:
-            fh.write(body)
-        os.chmod(
-            path,
-            stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH,
-        )
-        return path
-
     def _set_state(self, state: str, label: str):
+        if label != self._state_label:
+            self._state_label = label
+            self._lbl_state.setText(label)
+        if state == self._state:
+            return
+        was_idle = self._state == self._ST_IDLE
         self._state = state
-        self._lbl_state.setText(label)
         idle = state == self._ST_IDLE
-        self._iface_combo.setEnabled(idle)
-        self._band_sel.setEnabled(idle)
-        self._chan_combo.setEnabled(idle)
-        self._out_edit.setEnabled(idle)
+        if idle != was_idle:
+            self._iface_combo.setEnabled(idle)
+            self._band_sel.setEnabled(idle)
+            self._chan_combo.setEnabled(idle)
+            self._out_edit.setEnabled(idle)
         if state == self._ST_CAPTURE:
             self._btn_start.setText("⏹  Stop Capture")
-            self._btn_start.setStyleSheet(
-                f"QPushButton {{ background:{CAPTURE_BTN_STOP_BG}; color:{CAPTURE_BTN_STOP_FG}; border:none;"
-                " border-radius:5px; font-size:11pt; font-weight:bold; }"
-                f"QPushButton:hover {{ background:{CAPTURE_BTN_STOP_HOVER}; }}"
-            )
+            self._btn_start.setStyleSheet(_QSS_BTN_STOP)
             self._btn_start.setEnabled(True)
         elif state in (self._ST_SETUP, self._ST_TEARDOWN):
             self._btn_start.setText("⏹  Stop Capture")
@@ -718,26 +1054,33 @@ class MonitorModeWindow(QDialog):
 
     def _tick(self):
         elapsed = int(time.monotonic() - self._start_time)
-        m, s = divmod(elapsed, 60)
-        self._lbl_elapsed.setText(f"{m:02d}:{s:02d}")
+        self._lbl_elapsed.setText(_MMSS_FMT % divmod(elapsed, 60))
+        if not self._output_watch.take_changed():
+            return
         try:
-            sz = os.path.getsize(self._output_path)
-            if sz < 1024 * 1024:
-                self._lbl_size.setText(f"{sz / 1024:.1f} KB")
-            else:
-                self._lbl_size.setText(f"{sz / 1024 / 1024:.2f} MB")
+            text = _format_size(os.stat(self._output_path).st_size)
         except OSError:
-            self._lbl_size.setText("—")
+            text = "—"
+        # Growth below the displayed precision leaves the label alone
+        if text != self._last_size_str:
+            self._last_size_str = text
+            self._lbl_size.setText(text)
 
     def _log_line(self, text: str):
-        self._log.appendPlainText(text)
+        self._log_pending.append(text)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self):
+        if not self._log_pending:
+            return
+        self._log.appendPlainText("\n".join(self._log_pending))
+        self._log_pending.clear()
         sb = self._log.verticalScrollBar()
         sb.setValue(sb.maximum())
 
     def closeEvent(self, event):
         if self._state != self._ST_IDLE:
-            from PyQt6.QtWidgets import QMessageBox
-
             r = QMessageBox.question(
                 self,
                 "Capture in progress",
@@ -745,9 +1088,9 @@ class MonitorModeWindow(QDialog):
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             )
             if r == QMessageBox.StandardButton.Yes:
+                self._close_when_idle = True  # re-close after teardown finishes
                 self._request_stop()
-                event.ignore()  # re-close after teardown finishes
-                # Reconnect to close after teardown
+                event.ignore()
                 return
             else:
                 event.ignore()
@@ -771,15 +1114,31 @@ class ManagedCaptureWindow(QDialog):
         self.setModal(False)
 
         self._state = self._ST_IDLE
+        self._state_label = "Idle"  # text shown in _lbl_state
         self._proc = None
         self._cleanup_proc = None
-        self._capture_script = ""
+        self._cleanup_out = _LineDecoder()
+        self._cleanup_err = _LineDecoder()
         self._pid_file = ""
-        self._stdout_buf = ""
+        self._stdout_lines = _LineDecoder()
+        self._stderr_lines = _LineDecoder()
         self._start_time = 0.0
+        self._close_when_idle = False  # set by closeEvent during a capture
         self._timer = QTimer(self)
         self._timer.setInterval(1000)
         self._timer.timeout.connect(self._tick)
+        self._output_watch = _OutputChangeWatcher(self)
+        self._last_size_str = ""
+        self._force_kill_timer = QTimer(self)
+        self._force_kill_timer.setSingleShot(True)
+        self._force_kill_timer.setInterval(20000)
+        self._force_kill_timer.timeout.connect(self._force_kill)
+        # Log lines are queued and appended in one batch per 50 ms
+        self._log_pending: List[str] = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_log)
         self._iface_name = ""
         self._output_path = ""
 
@@ -837,28 +1196,29 @@ class ManagedCaptureWindow(QDialog):
         status_row.addWidget(self._lbl_size)
         layout.addLayout(status_row)
 
-        self._log = QTextEdit()
+        self._log = QPlainTextEdit()
         self._log.setReadOnly(True)
         self._log.setStyleSheet(
-            f"background:{CAPTURE_MGD_LOG_BG}; color:{CAPTURE_MGD_LOG_FG}; font-family:monospace;"
-            " font-size:9pt; border-radius:4px;"
+            f"QPlainTextEdit {{ background:{CAPTURE_MGD_LOG_BG}; color:{CAPTURE_MGD_LOG_FG};"
+            " font-family:monospace; font-size:9pt; border-radius:4px; }"
         )
         layout.addWidget(self._log, 1)
 
         self._btn_start = QPushButton("\u25b6  Start Capture")
         self._btn_start.setMinimumHeight(42)
-        self._btn_start.setStyleSheet(
-            f"QPushButton {{ background:{CAPTURE_BTN_START_BG}; color:{CAPTURE_BTN_START_FG}; border:none;"
-            " border-radius:5px; font-size:11pt; font-weight:bold; }"
-            f"QPushButton:hover {{ background:{CAPTURE_BTN_START_HOVER}; }}"
-            f"QPushButton:disabled {{ background:{CAPTURE_BTN_DIS_BG}; color:{CAPTURE_BTN_DIS_FG}; }}"
-        )
+        self._btn_start.setStyleSheet(_QSS_BTN_START)
         self._btn_start.clicked.connect(self._on_btn)
         layout.addWidget(self._btn_start)
 
     def _populate_interfaces(self):
-        ifaces = _detect_wifi_interfaces()
         self._iface_combo.clear()
+        self._iface_combo.addItem("Detecting WiFi interfaces\u2026")
+        self._btn_start.setEnabled(False)
+        _detect_wifi_interfaces_async(self, self._fill_interfaces)
+
+    def _fill_interfaces(self, ifaces: List[Dict[str, str]]):
+        self._iface_combo.clear()
+        self._btn_start.setEnabled(True)
         if not ifaces:
             self._iface_combo.addItem("No WiFi interfaces found")
             self._btn_start.setEnabled(False)
@@ -898,8 +1258,12 @@ class ManagedCaptureWindow(QDialog):
         if not output:
             QMessageBox.warning(self, "No Output", "Choose an output file.")
             return
+        if not os.path.isdir(os.path.dirname(os.path.abspath(output))):
+            QMessageBox.warning(self, "No Output", "The output folder does not exist.")
+            return
         self._iface_name = iface
         self._output_path = output
+        self._log_pending.clear()
         self._log.clear()
         self._log_line(f"Interface : {iface}")
         self._log_line(f"Output    : {output}")
@@ -907,36 +1271,26 @@ class ManagedCaptureWindow(QDialog):
         self._run_capture()
 
     def _run_capture(self):
-        import tempfile as _tf
-
-        self._pid_file = _tf.mktemp(prefix="wavescope_tdpid_", suffix=".pid")
-        script_body = _MANAGED_CAPTURE_TMPL.format(
-            iface=self._iface_name,
-            output=self._output_path,
-            pid_file=self._pid_file,
-        )
-        self._capture_script = self._write_temp_script(script_body)
-        self._stdout_buf = ""
+        self._pid_file = tempfile.mktemp(prefix="wavescope_tdpid_", suffix=".pid")
+        script = _capture_script("managed_capture.sh")
+        self._stdout_lines = _LineDecoder()
+        self._stderr_lines = _LineDecoder()
         self._proc = self._make_process()
         self._proc.readyReadStandardOutput.connect(self._on_stdout)
         self._proc.readyReadStandardError.connect(self._on_stderr)
         self._proc.finished.connect(self._on_proc_finished)
-        self._proc.start("pkexec", ["bash", self._capture_script])
+        self._proc.start(
+            "pkexec",
+            ["bash", script, self._iface_name, self._output_path, self._pid_file],
+        )
         self._set_state(self._ST_CAPTURE, "Starting\u2026")
         self._btn_start.setText("\u23f9  Stop Capture")
-        self._btn_start.setStyleSheet(
-            f"QPushButton {{ background:{CAPTURE_BTN_STOP_BG}; color:{CAPTURE_BTN_STOP_FG}; border:none;"
-            " border-radius:5px; font-size:11pt; font-weight:bold; }"
-            f"QPushButton:hover {{ background:{CAPTURE_BTN_STOP_HOVER}; }}"
-        )
+        self._btn_start.setStyleSheet(_QSS_BTN_STOP)
         self._log_line("\u25b6  Starting (Polkit authentication may appear\u2026)")
 
     def _on_stdout(self):
-        self._stdout_buf += bytes(self._proc.readAllStandardOutput()).decode(
-            errors="replace"
-        )
-        while "\n" in self._stdout_buf:
-            line, self._stdout_buf = self._stdout_buf.split("\n", 1)
+        data = bytes(self._proc.readAllStandardOutput())
+        for line in self._stdout_lines.feed(data):
             line = line.strip()
             if not line:
                 continue
@@ -946,6 +1300,7 @@ class ManagedCaptureWindow(QDialog):
                 )
                 self._set_state(self._ST_CAPTURE, "Capturing\u2026")
                 self._start_time = time.monotonic()
+                self._output_watch.watch(self._output_path)
                 self._timer.start()
                 self._log_line("\u25b6  Click Stop to end capture.")
             elif line == "WAVESCOPE_CAPTURE_DONE":
@@ -954,22 +1309,23 @@ class ManagedCaptureWindow(QDialog):
                 self._log_line(f"  {line}")
 
     def _on_stderr(self):
-        data = bytes(self._proc.readAllStandardError()).decode(errors="replace")
-        for line in data.splitlines():
+        data = bytes(self._proc.readAllStandardError())
+        for line in self._stderr_lines.feed(data):
             s = line.strip()
             if s:
                 self._log_line(f"  {s}")
 
     def _on_proc_finished(self, exit_code: int, _exit_status):
         self._timer.stop()
-        self._stdout_buf += bytes(self._proc.readAllStandardOutput()).decode(
-            errors="replace"
-        )
-        for line in self._stdout_buf.splitlines():
+        self._force_kill_timer.stop()
+        self._output_watch.stop()
+        tail = self._stdout_lines.feed(bytes(self._proc.readAllStandardOutput()))
+        self._on_stderr()
+        tail += self._stdout_lines.flush() + self._stderr_lines.flush()
+        for line in tail:
             ln = line.strip()
             if ln and not ln.startswith("WAVESCOPE_"):
                 self._log_line(f"  {ln}")
-        self._stdout_buf = ""
         if exit_code != 0 and self._state == self._ST_CAPTURE:
             self._log_line(
                 f"\u2717  Capture failed (exit {exit_code}). Check pkexec is available."
@@ -982,29 +1338,40 @@ class ManagedCaptureWindow(QDialog):
         if self._state == self._ST_CAPTURE and self._proc:
             self._btn_start.setEnabled(False)
             self._btn_start.setText("\u23f3  Stopping\u2026")
-            self._log_line(
-                "\u23f9  Stopping \u2014 launching cleanup (a password prompt may appear)\u2026"
-            )
-            self._run_cleanup()
-            QTimer.singleShot(20000, self._force_kill)
+            if self._send_stop():
+                self._log_line("\u23f9  Stopping\u2026")
+            else:
+                self._log_line(
+                    "\u23f9  Stopping \u2014 launching cleanup (a password prompt may appear)\u2026"
+                )
+                self._run_cleanup()
+            self._force_kill_timer.start()
+
+    def _send_stop(self) -> bool:
+        """Ask the running capture script, already root, to stop tcpdump."""
+        if self._proc.state() != QProcess.ProcessState.Running:
+            return False
+        return self._proc.write(b"STOP\n") > 0
 
     def _run_cleanup(self):
-        script_body = _MANAGED_CLEANUP_TMPL.format(pid_file=self._pid_file)
-        cleanup_path = self._write_temp_script(script_body)
+        script = _capture_script("managed_cleanup.sh")
         self._cleanup_proc = self._make_process()
+        self._cleanup_out = _LineDecoder()
+        self._cleanup_err = _LineDecoder()
         self._cleanup_proc.readyReadStandardOutput.connect(self._on_cleanup_stdout)
         self._cleanup_proc.readyReadStandardError.connect(self._on_cleanup_stderr)
         self._cleanup_proc.finished.connect(
-            lambda code, _s, p=cleanup_path: self._on_cleanup_finished(code, p)
+            lambda code, _s: self._on_cleanup_finished(code)
         )
-        self._cleanup_proc.start("pkexec", ["bash", cleanup_path])
+        self._cleanup_proc.start("pkexec", ["bash", script, self._pid_file])
         self._log_line("\u25b6  Cleanup running\u2026")
 
     def _on_cleanup_stdout(self):
-        data = bytes(self._cleanup_proc.readAllStandardOutput()).decode(
-            errors="replace"
-        )
-        for line in data.splitlines():
+        data = bytes(self._cleanup_proc.readAllStandardOutput())
+        self._log_cleanup_stdout(self._cleanup_out.feed(data))
+
+    def _log_cleanup_stdout(self, lines: List[str]):
+        for line in lines:
             ln = line.strip()
             if ln == "WAVESCOPE_CLEANUP_OK":
                 self._log_line("\u2713  Capture stopped cleanly.")
@@ -1012,18 +1379,27 @@ class ManagedCaptureWindow(QDialog):
                 self._log_line(f"  {ln}")
 
     def _on_cleanup_stderr(self):
-        data = bytes(self._cleanup_proc.readAllStandardError()).decode(errors="replace")
-        for line in data.splitlines():
+        data = bytes(self._cleanup_proc.readAllStandardError())
+        self._log_cleanup_stderr(self._cleanup_err.feed(data))
+
+    def _log_cleanup_stderr(self, lines: List[str]):
+        for line in lines:
             s = line.strip()
             if s:
                 self._log_line(f"  {s}")
 
-    def _on_cleanup_finished(self, exit_code: int, cleanup_path: str):
-        try:
-            os.unlink(cleanup_path)
-        except OSError:
-            pass
-        self._cleanup_proc = None
+    def _on_cleanup_finished(self, exit_code: int):
+        proc, self._cleanup_proc = self._cleanup_proc, None
+        # Drain what arrived after the last readyRead, then any unterminated tail
+        self._log_cleanup_stdout(
+            self._cleanup_out.feed(bytes(proc.readAllStandardOutput()))
+            + self._cleanup_out.flush()
+        )
+        self._log_cleanup_stderr(
+            self._cleanup_err.feed(bytes(proc.readAllStandardError()))
+            + self._cleanup_err.flush()
+        )
+        self._force_kill_timer.stop()
         if exit_code != 0:
             self._log_line(f"\u26a0  Cleanup exited with code {exit_code}.")
         if self._state != self._ST_IDLE:
@@ -1031,8 +1407,6 @@ class ManagedCaptureWindow(QDialog):
         self._cleanup_temps()
 
     def _force_kill(self):
-        from PyQt6.QtCore import QProcess
-
         if (
             self._state != self._ST_IDLE
             and self._proc
@@ -1047,13 +1421,12 @@ class ManagedCaptureWindow(QDialog):
 
     def _reset_ui_to_idle(self, label: str = "Idle"):
         self._set_state(self._ST_IDLE, label)
+        if self._close_when_idle:
+            # Finish the close the user asked for while capture was running
+            self._close_when_idle = False
+            QTimer.singleShot(0, self.close)
         self._btn_start.setText("\u25b6  Start Capture")
-        self._btn_start.setStyleSheet(
-            f"QPushButton {{ background:{CAPTURE_BTN_START_BG}; color:{CAPTURE_BTN_START_FG}; border:none;"
-            " border-radius:5px; font-size:11pt; font-weight:bold; }"
-            f"QPushButton:hover {{ background:{CAPTURE_BTN_START_HOVER}; }}"
-            f"QPushButton:disabled {{ background:{CAPTURE_BTN_DIS_BG}; color:{CAPTURE_BTN_DIS_FG}; }}"
-        )
+        self._btn_start.setStyleSheet(_QSS_BTN_START)
         self._btn_start.setEnabled(True)
         try:
             sz = os.path.getsize(self._output_path)
@@ -1064,37 +1437,50 @@ class ManagedCaptureWindow(QDialog):
             pass
 
     def _cleanup_temps(self):
-        for attr in ("_capture_script", "_pid_file"):
-            path = getattr(self, attr, "")
-            if path:
-                try:
-                    os.unlink(path)
-                except OSError:
-                    pass
-                setattr(self, attr, "")
+        if self._pid_file:
+            try:
+                os.unlink(self._pid_file)
+            except OSError:
+                pass
+            self._pid_file = ""
 
     def _set_state(self, state: str, label: str):
+        if label != self._state_label:
+            self._state_label = label
+            self._lbl_state.setText(label)
+        if state == self._state:
+            return
+        was_idle = self._state == self._ST_IDLE
         self._state = state
-        self._lbl_state.setText(label)
         idle = state == self._ST_IDLE
-        self._iface_combo.setEnabled(idle)
-        self._out_edit.setEnabled(idle)
+        if idle != was_idle:
+            self._iface_combo.setEnabled(idle)
+            self._out_edit.setEnabled(idle)
 
     def _tick(self):
         elapsed = int(time.monotonic() - self._start_time)
-        m, s = divmod(elapsed, 60)
-        self._lbl_elapsed.setText(f"{m:02d}:{s:02d}")
+        self._lbl_elapsed.setText(_MMSS_FMT % divmod(elapsed, 60))
+        if not self._output_watch.take_changed():
+            return
         try:
-            sz = os.path.getsize(self._output_path)
-            if sz < 1024 * 1024:
-                self._lbl_size.setText(f"File:  {sz / 1024:.1f} KB")
-            else:
-                self._lbl_size.setText(f"File:  {sz / 1024 / 1024:.2f} MB")
+            text = "File:  " + _format_size(os.stat(self._output_path).st_size)
         except OSError:
-            pass
+            return
+        # Growth below the displayed precision leaves the label alone
+        if text != self._last_size_str:
+            self._last_size_str = text
+            self._lbl_size.setText(text)
 
     def _log_line(self, text: str):
-        self._log.append(text)
+        self._log_pending.append(text)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self):
+        if not self._log_pending:
+            return
+        self._log.appendPlainText("\n".join(self._log_pending))
+        self._log_pending.clear()
         sb = self._log.verticalScrollBar()
         sb.setValue(sb.maximum())
 
@@ -1103,18 +1489,9 @@ class ManagedCaptureWindow(QDialog):
         p.setProcessChannelMode(QProcess.ProcessChannelMode.SeparateChannels)
         return p
 
-    def _write_temp_script(self, body: str) -> str:
-        fd, path = tempfile.mkstemp(suffix=".sh", prefix="wavescope_")
-        with os.fdopen(fd, "w") as fh:
-            fh.write(body)
-        os.chmod(
-            path,
-            stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH,
-        )
-        return path
-
     def closeEvent(self, event):
         if self._state != self._ST_IDLE:
+            self._close_when_idle = True  # re-close after the capture stops
             self._request_stop()
             event.ignore()
         else:
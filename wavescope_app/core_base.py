@@ -10,23 +10,36 @@ Contains constants, channel math, vendor/OUI resolution, AP model,
 scan parsers/enrichment, scanner worker thread, and table/proxy models.
 """
 
+import io
 import sys
+import array
+import bisect
 import os
 import re
 import math
+import mmap
 import time
 import json
 import stat
+import sqlite3
+import hashlib
 import tempfile
+import threading
 import urllib.request
 import subprocess
 from pathlib import Path
-from collections import defaultdict, deque
-from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Tuple
+from collections import ChainMap, defaultdict, deque
+from functools import lru_cache
+from dataclasses import InitVar, dataclass, field
+from typing import Callable, Optional, List, Dict, Tuple, Mapping, ItemsView
 
 import numpy as np
 
+try:  # optional: faster JSON decoding for the large OUI databases
+    import orjson
+except ImportError:
+    orjson = None
+
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -63,6 +76,7 @@ from PyQt6.QtWidgets import (
     QListWidget,
     QListWidgetItem,
     QSpinBox,
+    QStyledItemDelegate,
 )
 from PyQt6.QtCore import (
     Qt,
@@ -71,6 +85,7 @@ from PyQt6.QtCore import (
     QThread,
     QItemSelectionModel,
     QProcess,
+    QFileSystemWatcher,
     pyqtSignal,
     QSortFilterProxyModel,
     QAbstractTableModel,
@@ -96,10 +111,10 @@ from PyQt6.QtGui import (
     QFontMetrics,
     QAction,
     QCursor,
+    QStandardItem,
+    QStandardItemModel,
 )
 
-import pyqtgraph as pg
-from pyqtgraph import PlotWidget, mkPen, mkBrush
 from .theme import (
     SSID_COLORS,
     IW_GEN_COLORS,
@@ -373,16 +388,46 @@ _5GHZ_GROUPS_160: List[Tuple[List[int], int]] = [
     ([149, 153, 157, 161, 165, 169, 173, 177], 5815),
 ]
 
-# Fast lookup: (primary_chan, bw_mhz) → (center_freq_MHz, sorted_channels_list)
-_5GHZ_BONDED: Dict[Tuple[int, int], Tuple[int, List[int]]] = {}
-for _bw, _grps in [
-    (40, _5GHZ_GROUPS_40),
-    (80, _5GHZ_GROUPS_80),
-    (160, _5GHZ_GROUPS_160),
-]:
-    for _chans, _cf in _grps:
-        for _c in _chans:
-            _5GHZ_BONDED[(_c, _bw)] = (_cf, _chans)
+# Flat lookup tables indexed by [primary_chan, _BONDED_BW_IDX[bw_mhz]].
+# A center of 0 means "not part of a standard block at this width".
+_BONDED_BW_IDX: Dict[int, int] = {20: 0, 40: 1, 80: 2, 160: 3}
+_BONDED_MAX_CHAN = 256
+
+
+def _build_bonded_tables(
+    groups_by_bw: List[Tuple[int, List[Tuple[List[int], int]]]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (center_freq[chan, bw_idx], chans[chan, bw_idx]) lookup arrays."""
+    centers = np.zeros((_BONDED_MAX_CHAN, len(_BONDED_BW_IDX)), dtype=np.int32)
+    chans_tbl = np.empty(centers.shape, dtype=object)
+    for bw, grps in groups_by_bw:
+        col = _BONDED_BW_IDX[bw]
+        for chans, cf in grps:
+            for c in chans:
+                centers[c, col] = cf
+                chans_tbl[c, col] = chans
+    return centers, chans_tbl
+
+
+_5GHZ_BONDED_CENTER, _5GHZ_BONDED_CHANS = _build_bonded_tables(
+    [
+        (40, _5GHZ_GROUPS_40),
+        (80, _5GHZ_GROUPS_80),
+        (160, _5GHZ_GROUPS_160),
+    ]
+)
+
+
+def _bonded_lookup(
+    centers: np.ndarray, chans_tbl: np.ndarray, primary_chan: int, bw_mhz: int
+) -> Tuple[int, Optional[List[int]]]:
+    col = _BONDED_BW_IDX.get(bw_mhz)
+    if col is None or not 0 <= primary_chan < _BONDED_MAX_CHAN:
+        return 0, None
+    cf = int(centers[primary_chan, col])
+    if not cf:
+        return 0, None
+    return cf, chans_tbl[primary_chan, col]
 
 
 def get_5ghz_bonded_info(primary_chan: int, bw_mhz: int) -> Tuple[int, List[int]]:
@@ -391,9 +436,11 @@ def get_5ghz_bonded_info(primary_chan: int, bw_mhz: int) -> Tuple[int, List[int]
     at the given bandwidth.  Falls back to primary channel's own freq if the
     combination is not in the standard block table.
     """
-    key = (primary_chan, bw_mhz)
-    if key in _5GHZ_BONDED:
-        return _5GHZ_BONDED[key]
+    cf, chans = _bonded_lookup(
+        _5GHZ_BONDED_CENTER, _5GHZ_BONDED_CHANS, primary_chan, bw_mhz
+    )
+    if chans is not None:
+        return cf, chans
     # Fallback: primary channel is both center and only member
     return CH5.get(primary_chan, chan_to_freq(primary_chan)), [primary_chan]
 
@@ -408,34 +455,29 @@ def get_5ghz_bonded_info(primary_chan: int, bw_mhz: int) -> Tuple[int, List[int]
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-def _make_6ghz_group(center_chan: int, bw_mhz: int) -> Tuple[List[int], int]:
+def _make_6ghz_groups(center_chans: range, bw_mhz: int) -> List[Tuple[List[int], int]]:
+    """Build all (channels, center_freq) blocks for the given center channels."""
     n_20mhz = bw_mhz // 20
-    start = center_chan - 2 * (n_20mhz - 1)
-    chans = [start + 4 * i for i in range(n_20mhz)]
-    center_freq = 5950 + center_chan * 5
-    return chans, center_freq
+    centers = np.asarray(center_chans, dtype=np.int32)
+    starts = centers - 2 * (n_20mhz - 1)
+    chans = starts[:, None] + 4 * np.arange(n_20mhz, dtype=np.int32)[None, :]
+    freqs = 5950 + centers * 5
+    return list(zip(chans.tolist(), freqs.tolist()))
 
 
-_6GHZ_GROUPS_40: List[Tuple[List[int], int]] = [
-    _make_6ghz_group(c, 40) for c in range(3, 180, 8)
-]
-_6GHZ_GROUPS_80: List[Tuple[List[int], int]] = [
-    _make_6ghz_group(c, 80) for c in range(7, 168, 16)
-]
-_6GHZ_GROUPS_160: List[Tuple[List[int], int]] = [
-    _make_6ghz_group(c, 160) for c in range(15, 144, 32)
-]
+_6GHZ_GROUPS_40: List[Tuple[List[int], int]] = _make_6ghz_groups(range(3, 180, 8), 40)
+_6GHZ_GROUPS_80: List[Tuple[List[int], int]] = _make_6ghz_groups(range(7, 168, 16), 80)
+_6GHZ_GROUPS_160: List[Tuple[List[int], int]] = _make_6ghz_groups(
+    range(15, 144, 32), 160
+)
 
-# Fast lookup: (primary_chan, bw_mhz) → (center_freq_MHz, sorted_channels_list)
-_6GHZ_BONDED: Dict[Tuple[int, int], Tuple[int, List[int]]] = {}
-for _bw, _grps in [
-    (40, _6GHZ_GROUPS_40),
-    (80, _6GHZ_GROUPS_80),
-    (160, _6GHZ_GROUPS_160),
-]:
-    for _chans, _cf in _grps:
-        for _c in _chans:
-            _6GHZ_BONDED[(_c, _bw)] = (_cf, _chans)
+_6GHZ_BONDED_CENTER, _6GHZ_BONDED_CHANS = _build_bonded_tables(
+    [
+        (40, _6GHZ_GROUPS_40),
+        (80, _6GHZ_GROUPS_80),
+        (160, _6GHZ_GROUPS_160),
+    ]
+)
 
 
 def get_6ghz_bonded_info(primary_chan: int, bw_mhz: int) -> Tuple[int, List[int]]:
@@ -444,14 +486,29 @@ def get_6ghz_bonded_info(primary_chan: int, bw_mhz: int) -> Tuple[int, List[int]
     at the given bandwidth, based on the standard 6 GHz bonded block tables.
     Falls back to primary channel's own freq if not in table.
     """
-    key = (primary_chan, bw_mhz)
-    if key in _6GHZ_BONDED:
-        return _6GHZ_BONDED[key]
+    cf, chans = _bonded_lookup(
+        _6GHZ_BONDED_CENTER, _6GHZ_BONDED_CHANS, primary_chan, bw_mhz
+    )
+    if chans is not None:
+        return cf, chans
     return CH6.get(primary_chan, chan_to_freq(primary_chan)), [primary_chan]
 
 
+def _chan_freq_arrays(chan_dict: Dict[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (channels, freqs) arrays sorted by frequency for range queries."""
+    items = sorted(chan_dict.items(), key=lambda kv: kv[1])
+    chans = np.array([c for c, _ in items], dtype=np.int16)
+    freqs = np.array([f for _, f in items], dtype=np.int32)
+    return chans, freqs
+
+
+_CH24_ARR = _chan_freq_arrays(CH24)
+_CH5_ARR = _chan_freq_arrays(CH5)
+_CH6_ARR = _chan_freq_arrays(CH6)
+
+
 def _block_channel_range(
-    center_freq: int, bw_mhz: int, chan_dict: Dict[int, int]
+    center_freq: int, bw_mhz: int, chan_arr: Tuple[np.ndarray, np.ndarray]
 ) -> Tuple[Optional[int], Optional[int]]:
     """
     Return (lo_chan, hi_chan) — the outermost primary channels that fall inside
@@ -464,10 +521,12 @@ def _block_channel_range(
     half = bw_mhz // 2 - 10
     lo = center_freq - half
     hi = center_freq + half
-    in_range = [c for c, f in chan_dict.items() if lo <= f <= hi]
-    if not in_range:
+    chans, freqs = chan_arr
+    i0 = int(np.searchsorted(freqs, lo, side="left"))
+    i1 = int(np.searchsorted(freqs, hi, side="right"))
+    if i0 >= i1:
         return None, None
-    return min(in_range), max(in_range)
+    return int(chans[i0]), int(chans[i1 - 1])
 
 
 def get_ap_draw_center(ap: "AccessPoint") -> float:
@@ -476,21 +535,34 @@ def get_ap_draw_center(ap: "AccessPoint") -> float:
     5/6 GHz: uses bonded block lookup tables.
     2.4 GHz: uses iw_center_freq when available, else primary channel freq.
     """
-    if ap.bandwidth_mhz > 20:
+    return _draw_center_cached(
+        ap.band, ap.channel, ap.bandwidth_mhz, ap.iw_center_freq, ap.freq_mhz
+    )
+
+
+@lru_cache(maxsize=4096)
+def _draw_center_cached(
+    band: str,
+    channel: int,
+    bw_mhz: int,
+    iw_center_freq: Optional[int],
+    freq_mhz: int,
+) -> float:
+    if bw_mhz > 20:
         # 5 GHz: IEEE block lookup table
-        if ap.band == "5 GHz" and ap.channel:
-            center, _ = get_5ghz_bonded_info(ap.channel, ap.bandwidth_mhz)
+        if band == "5 GHz" and channel:
+            center, _ = get_5ghz_bonded_info(channel, bw_mhz)
             if center:
                 return float(center)
         # 6 GHz: FCC/US 6 GHz bonded block lookup table
-        if ap.band == "6 GHz" and ap.channel:
-            center, chans = get_6ghz_bonded_info(ap.channel, ap.bandwidth_mhz)
+        if band == "6 GHz" and channel:
+            center, chans = get_6ghz_bonded_info(channel, bw_mhz)
             if center and len(chans) > 1:
                 return float(center)
         # 2.4 GHz (or unknown): use iw-reported bonded block center when available
-        if ap.iw_center_freq:
-            return float(ap.iw_center_freq)
-    return float(ap.freq_mhz)
+        if iw_center_freq:
+            return float(iw_center_freq)
+    return float(freq_mhz)
 
 
 def get_ap_channel_span(ap: "AccessPoint") -> str:
@@ -500,47 +572,70 @@ def get_ap_channel_span(ap: "AccessPoint") -> str:
     2.4 GHz: "6–10" (40 MHz HT40+), "2–6" (40 MHz HT40-).
     6 GHz:   "1–13" (80 MHz), "1–29" (160 MHz), "1–61" (320 MHz).
     """
-    if ap.band == "5 GHz" and ap.channel:
+    return _channel_span_cached(
+        ap.band, ap.channel, ap.bandwidth_mhz, ap.iw_center_freq
+    )
+
+
+@lru_cache(maxsize=4096)
+def _channel_span_cached(
+    band: str, channel: int, bw_mhz: int, iw_center_freq: Optional[int]
+) -> str:
+    if band == "5 GHz" and channel:
         # Prefer iw center + formula; fall back to IEEE lookup table
-        if ap.iw_center_freq and ap.bandwidth_mhz > 20:
-            lo, hi = _block_channel_range(ap.iw_center_freq, ap.bandwidth_mhz, CH5)
+        if iw_center_freq and bw_mhz > 20:
+            lo, hi = _block_channel_range(iw_center_freq, bw_mhz, _CH5_ARR)
             if lo is not None and lo != hi:
                 return f"{lo}–{hi}"
-        _, chans = get_5ghz_bonded_info(ap.channel, ap.bandwidth_mhz)
+        _, chans = get_5ghz_bonded_info(channel, bw_mhz)
         if len(chans) > 1:
             return f"{chans[0]}–{chans[-1]}"
-        return str(ap.channel)
+        return str(channel)
 
-    if ap.band == "2.4 GHz" and ap.channel:
-        if ap.iw_center_freq and ap.bandwidth_mhz == 40:
-            lo, hi = _block_channel_range(ap.iw_center_freq, 40, CH24)
+    if band == "2.4 GHz" and channel:
+        if iw_center_freq and bw_mhz == 40:
+            lo, hi = _block_channel_range(iw_center_freq, 40, _CH24_ARR)
             if lo is not None and lo != hi:
                 return f"{lo}–{hi}"
-        return str(ap.channel)
+        return str(channel)
 
-    if ap.band == "6 GHz" and ap.channel:
-        if ap.bandwidth_mhz > 20:
-            _cf, chans = get_6ghz_bonded_info(ap.channel, ap.bandwidth_mhz)
+    if band == "6 GHz" and channel:
+        if bw_mhz > 20:
+            _cf, chans = get_6ghz_bonded_info(channel, bw_mhz)
             if len(chans) > 1:
                 return f"{chans[0]}–{chans[-1]}"
-            if ap.iw_center_freq:
-                lo, hi = _block_channel_range(ap.iw_center_freq, ap.bandwidth_mhz, CH6)
+            if iw_center_freq:
+                lo, hi = _block_channel_range(iw_center_freq, bw_mhz, _CH6_ARR)
                 if lo is not None and lo != hi:
                     return f"{lo}–{hi}"
-        return str(ap.channel)
+        return str(channel)
 
-    return str(ap.channel) if ap.channel else "?"
+    return str(channel) if channel else "?"
+
+
+# signal // 10 → color; thresholds at 30 / 50 / 70 fall on decade boundaries
+_SIGNAL_COLOR_LUT: List[QColor] = (
+    [QColor(SIG_POOR_NM)] * 3
+    + [QColor(SIG_WEAK_NM)] * 2
+    + [QColor(SIG_FAIR_NM)] * 2
+    + [QColor(SIG_EXCELLENT)] * 4
+)
 
 
 def signal_color(signal: int) -> QColor:
-    """Map 0-100 signal to red→yellow→green."""
-    if signal >= 70:
-        return QColor(SIG_EXCELLENT)
-    if signal >= 50:
-        return QColor(SIG_FAIR_NM)
-    if signal >= 30:
-        return QColor(SIG_WEAK_NM)
-    return QColor(SIG_POOR_NM)
+    """Map 0-100 signal to red→yellow→green.
+
+    Returns a shared QColor; copy it before modifying.
+    """
+    return _SIGNAL_COLOR_LUT[min(max(signal, 0), 100) // 10]
+
+
+_SIGNAL_BRUSH_LUT: List[QBrush] = [QBrush(c) for c in _SIGNAL_COLOR_LUT]
+
+
+def signal_brush(signal: int) -> QBrush:
+    """Shared QBrush counterpart of signal_color() for model ForegroundRole."""
+    return _SIGNAL_BRUSH_LUT[min(max(signal, 0), 100) // 10]
 
 
 def signal_to_dbm(signal: int) -> int:
@@ -548,6 +643,12 @@ def signal_to_dbm(signal: int) -> int:
     return int((signal / 2) - 100)
 
 
+def signals_to_dbm_array(signals: np.ndarray) -> np.ndarray:
+    """Vectorised signal_to_dbm() for a whole column of 0-100 SIGNAL values."""
+    # int() truncates toward zero, i.e. rounds the negative half-step up.
+    return -((200 - signals.astype(np.int16)) // 2)
+
+
 def ap_group_key(bssid: str) -> str:
     """Compute the AP-group key for a BSSID.
 
@@ -7,7 +7,81 @@ related computed properties.
 from .core_vendor import *
 
 
-@dataclass
+_GEN_PROTO = {
+    "WiFi 7": "BE  (802.11be)",
+    "WiFi 6E": "AX  (802.11ax)",
+    "WiFi 6": "AX  (802.11ax)",
+    "WiFi 5": "AC  (802.11ac)",
+    "WiFi 4": "N   (802.11n)",
+}
+
+
+# security_short() classifies an AP by a bitmask of these features and reads
+# the label from a table built once from the original decision cascade.
+_SEC_WEP = 1 << 0
+_SEC_SAE = 1 << 1
+_SEC_PSK = 1 << 2
+_SEC_EAP = 1 << 3
+_SEC_OWE = 1 << 4
+_SEC_WPA_IE = 1 << 5
+_SEC_RSN_IE = 1 << 6
+_SEC_BLANK = 1 << 7  # neither a SECURITY string nor an AKM
+_SEC_TXT_WPA3 = 1 << 8  # substrings of the nmcli SECURITY column
+_SEC_TXT_WPA2 = 1 << 9
+_SEC_TXT_WPA = 1 << 10
+
+
+def _security_label(mask: int) -> str:
+    has_wpa_ie = bool(mask & _SEC_WPA_IE)
+    has_rsn_ie = bool(mask & _SEC_RSN_IE)
+    has_sae = bool(mask & _SEC_SAE)
+    has_psk = bool(mask & _SEC_PSK)
+
+    if mask & _SEC_BLANK and not has_wpa_ie and not has_rsn_ie:
+        return "Open"
+    if mask & _SEC_WEP:
+        return "WEP"
+    if mask & _SEC_OWE:
+        return "OWE"
+
+    if has_sae and has_psk:
+        return "WPA2/WPA3 (PSK/SAE)"
+    if has_sae:
+        return "WPA3 (SAE)"
+
+    if mask & _SEC_EAP:
+        if has_wpa_ie and has_rsn_ie:
+            return "WPA/WPA2 (802.1X)"
+        if has_rsn_ie:
+            return "WPA2 (802.1X)"
+        return "Enterprise (802.1X)"
+
+    if has_wpa_ie and has_rsn_ie:
+        return "WPA/WPA2 (PSK)"
+    if has_rsn_ie:
+        return "WPA2 (PSK)"
+    if has_wpa_ie:
+        return "WPA (PSK)"
+
+    if mask & _SEC_TXT_WPA3 and mask & _SEC_TXT_WPA2:
+        return "WPA2/WPA3 (PSK/SAE)"
+    if mask & _SEC_TXT_WPA3:
+        return "WPA3"
+    if mask & _SEC_TXT_WPA2 and mask & _SEC_TXT_WPA:
+        return "WPA/WPA2"
+    if mask & _SEC_TXT_WPA2:
+        return "WPA2"
+    if mask & _SEC_TXT_WPA:
+        return "WPA"
+    return "Open"
+
+
+_SEC_SHORT_LABELS: Tuple[str, ...] = tuple(
+    _security_label(m) for m in range(_SEC_TXT_WPA << 1)
+)
+
+
+@dataclass(slots=True)
 class AccessPoint:
     # ── Required fields (nmcli) ─────────────────────────────────────────────
     ssid: str
@@ -72,16 +146,45 @@ class AccessPoint:
     conn_survey_noise_dbm: Optional[int] = None
     # ── Linger state (set by WiFiScanner, never from nmcli) ─────────────────
     is_lingering: bool = False  # True while AP is in the linger grace period
+    # Precomputed get_manufacturer() result (batched by the nmcli parser)
+    manufacturer_hint: InitVar[Optional[str]] = None
     # ── Computed in __post_init__ ────────────────────────────────────────────
     band: str = field(init=False)
     manufacturer: str = field(init=False)
     manufacturer_source: str = field(init=False)
+    # Derived once from bssid: the lowercase dict key used by iw/linger/UI
+    # caches, and the locally-administered (U/L) bit of the first octet
+    bssid_lower: str = field(init=False, repr=False, compare=False)
+    bssid_laa: bool = field(init=False, repr=False, compare=False)
+    # Memoized display strings (see _cached); cleared by invalidate_derived()
+    _derived: Dict[str, str] = field(
+        init=False, default_factory=dict, repr=False, compare=False
+    )
 
-    def __post_init__(self):
+    def __post_init__(self, manufacturer_hint: Optional[str]):
         self.band = freq_to_band(self.freq_mhz)
-        self.manufacturer = get_manufacturer(self.bssid)
+        self.bssid_lower = self.bssid.lower()
+        try:
+            self.bssid_laa = bool(int(self.bssid[:2], 16) & 0x02)
+        except ValueError:
+            self.bssid_laa = False
+        self.manufacturer = (
+            manufacturer_hint
+            if manufacturer_hint is not None
+            else get_manufacturer(self.bssid)
+        )
         self.manufacturer_source = "OUI database" if self.manufacturer else "Unknown"
 
+    def invalidate_derived(self) -> None:
+        """Drop memoized display strings after mutating scan/enrichment fields."""
+        self._derived.clear()
+
+    def _cached(self, key: str, compute) -> str:
+        v = self._derived.get(key)
+        if v is None:
+            v = self._derived[key] = compute()
+        return v
+
     @property
     def dbm(self) -> int:
         """Prefer exact iw dBm; fall back to nmcli signal approximation."""
@@ -99,6 +202,9 @@ class AccessPoint:
     @property
     def kvr_flags(self) -> str:
         """Compact 802.11k/v/r roaming-feature badge, e.g. 'k v r' or ''."""
+        return self._cached("kvr_flags", self._compute_kvr_flags)
+
+    def _compute_kvr_flags(self) -> str:
         flags = []
         if self.rrm:
             flags.append("k")
@@ -111,15 +217,9 @@ class AccessPoint:
     @property
     def protocol(self) -> str:
         """IEEE 802.11 amendment letter(s) — e.g. 'AX', 'AC', 'N', 'A/B/G'."""
-        _GEN_PROTO = {
-            "WiFi 7": "BE  (802.11be)",
-            "WiFi 6E": "AX  (802.11ax)",
-            "WiFi 6": "AX  (802.11ax)",
-            "WiFi 5": "AC  (802.11ac)",
-            "WiFi 4": "N   (802.11n)",
-        }
-        if self.wifi_gen in _GEN_PROTO:
-            return _GEN_PROTO[self.wifi_gen]
+        proto = _GEN_PROTO.get(self.wifi_gen)
+        if proto is not None:
+            return proto
         # Legacy — infer from band
         if self.freq_mhz >= 5000:
             return "A   (802.11a)"
@@ -128,6 +228,9 @@ class AccessPoint:
     @property
     def phy_mode(self) -> str:
         """Compact 802.11 PHY mode for table display (e.g. B/G, A, A/N, AX)."""
+        return self._cached("phy_mode", self._compute_phy_mode)
+
+    def _compute_phy_mode(self) -> str:
         if self.wifi_gen == "WiFi 7":
             return "BE"
         if self.wifi_gen in ("WiFi 6", "WiFi 6E"):
@@ -140,12 +243,24 @@ class AccessPoint:
 
     @property
     def display_ssid(self) -> str:
-        return self.ssid if self.ssid else f"<hidden> ({self.bssid})"
+        if self.ssid:
+            return self.ssid
+        return self._cached("display_ssid", lambda: f"<hidden> ({self.bssid})")
+
+    @property
+    def search_key(self) -> str:
+        """Lowercased text the table's free-text filter matches against."""
+        return self._cached("search_key", self._compute_search_key)
+
+    def _compute_search_key(self) -> str:
+        return f"{self.display_ssid} {self.bssid} {self.manufacturer} {self.band}".lower()
 
     @property
     def security_short(self) -> str:
         """Compact canonical security label for table/dashboard display."""
+        return self._cached("security_short", self._compute_security_short)
 
+    def _compute_security_short(self) -> str:
         def _nz(v: str) -> str:
             return (v or "").strip()
 
@@ -154,62 +269,43 @@ class AccessPoint:
         rsn = _nz(self.rsn_flags).upper()
         akm = _nz(getattr(self, "akm_raw", "") or self.akm).upper()
 
-        has_wpa_ie = wpa not in ("", "--", "(NONE)")
-        has_rsn_ie = rsn not in ("", "--", "(NONE)")
-        has_wep = "WEP" in sec
-        has_sae = "SAE" in akm
-        has_psk = "PSK" in akm or "PSK" in sec or "PSK" in wpa or "PSK" in rsn
-        has_eap = (
+        mask = 0
+        if wpa not in ("", "--", "(NONE)"):
+            mask |= _SEC_WPA_IE
+        if rsn not in ("", "--", "(NONE)"):
+            mask |= _SEC_RSN_IE
+        if not sec and not akm:
+            mask |= _SEC_BLANK
+        if "WEP" in sec:
+            mask |= _SEC_WEP
+        if "SAE" in akm:
+            mask |= _SEC_SAE
+        if "PSK" in akm or "PSK" in sec or "PSK" in wpa or "PSK" in rsn:
+            mask |= _SEC_PSK
+        if (
             "EAP" in akm
             or "802.1X" in akm
             or "8021X" in akm
             or "ENTERPRISE" in akm
             or "EAP" in sec
-        )
-        has_owe = "OWE" in akm or "OWE" in sec
-
-        if not sec and not has_wpa_ie and not has_rsn_ie and not akm:
-            return "Open"
-        if has_wep:
-            return "WEP"
-        if has_owe:
-            return "OWE"
-
-        if has_sae and has_psk:
-            return "WPA2/WPA3 (PSK/SAE)"
-        if has_sae:
-            return "WPA3 (SAE)"
-
-        if has_eap:
-            if has_wpa_ie and has_rsn_ie:
-                return "WPA/WPA2 (802.1X)"
-            if has_rsn_ie:
-                return "WPA2 (802.1X)"
-            return "Enterprise (802.1X)"
-
-        if has_wpa_ie and has_rsn_ie:
-            return "WPA/WPA2 (PSK)"
-        if has_rsn_ie:
-            return "WPA2 (PSK)"
-        if has_wpa_ie:
-            return "WPA (PSK)"
-
-        if "WPA3" in sec and "WPA2" in sec:
-            return "WPA2/WPA3 (PSK/SAE)"
+        ):
+            mask |= _SEC_EAP
+        if "OWE" in akm or "OWE" in sec:
+            mask |= _SEC_OWE
         if "WPA3" in sec:
-            return "WPA3"
-        if "WPA2" in sec and "WPA" in sec:
-            return "WPA/WPA2"
+            mask |= _SEC_TXT_WPA3
         if "WPA2" in sec:
-            return "WPA2"
+            mask |= _SEC_TXT_WPA2
         if "WPA" in sec:
-            return "WPA"
-        return "Open"
+            mask |= _SEC_TXT_WPA
+        return _SEC_SHORT_LABELS[mask]
 
     @property
     def security_tooltip(self) -> str:
         """Detailed security info for table tooltip."""
+        return self._cached("security_tooltip", self._compute_security_tooltip)
 
+    def _compute_security_tooltip(self) -> str:
         def _nz(v: str) -> str:
             s = (v or "").strip()
             return s if s else "—"
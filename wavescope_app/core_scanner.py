@@ -10,30 +10,62 @@ from .vendor_beacon import parse_vendor_ies
 
 def _split_terse(line: str) -> List[str]:
     """Split a nmcli terse line on unescaped ':' characters."""
-    fields: List[str] = []
-    cur: List[str] = []
-    i = 0
-    while i < len(line):
-        if line[i] == "\\" and i + 1 < len(line) and line[i + 1] == ":":
-            cur.append(":")
-            i += 2
-        elif line[i] == ":":
-            fields.append("".join(cur))
-            cur = []
-            i += 1
-        else:
-            cur.append(line[i])
-            i += 1
-    fields.append("".join(cur))
-    return fields
+    if "\\" not in line:
+        return line.split(":")
+    # Park escaped colons on a NUL sentinel (never present in nmcli output) so
+    # the split itself runs in C rather than a per-character Python loop.
+    return [f.replace("\x00", ":") for f in line.replace("\\:", "\x00").split(":")]
+
+
+def _split_unescaped(line: str) -> List[str]:
+    """Split a `nmcli -t -e no` line into the NMCLI_FIELDS columns.
+
+    Colons are left verbatim, so the SSID is isolated by peeling the
+    fixed-arity fields off both ends: IN-USE on the left, then BSSID
+    (six octets) plus nine plain fields on the right.
+    """
+    head, sep, rest = line.partition(":")
+    if not sep:
+        return []
+    tail = rest.rsplit(":", 15)
+    if len(tail) != 16:
+        return []
+    return [head, tail[0], ":".join(tail[1:7])] + tail[7:]
+
+
+_NMCLI_ESCAPE_NO: Optional[bool] = None
+
+
+def _nmcli_escape_no() -> bool:
+    """Whether this nmcli accepts `--escape no` (probed once, then cached)."""
+    global _NMCLI_ESCAPE_NO
+    if _NMCLI_ESCAPE_NO is None:
+        try:
+            res = subprocess.run(
+                ["nmcli", "-t", "--escape", "no", "-f", "DEVICE", "dev", "status"],
+                capture_output=True,
+                text=True,
+                timeout=3,
+            )
+            _NMCLI_ESCAPE_NO = res.returncode == 0
+        except Exception:
+            _NMCLI_ESCAPE_NO = False
+    return _NMCLI_ESCAPE_NO
 
 
 def _parse_freq(freq_str: str) -> int:
+    # nmcli prints "<n> MHz": take the leading token without the regex engine
+    head = freq_str.lstrip().partition(" ")[0]
+    if head.isdigit():
+        return int(head)
     m = re.search(r"(\d+)", freq_str)
     return int(m.group(1)) if m else 0
 
 
 def _parse_rate(rate_str: str) -> float:
+    head = rate_str.lstrip().partition(" ")[0]
+    if head.isdigit():
+        return float(head)
     m = re.search(r"([\d.]+)", rate_str)
     return float(m.group(1)) if m else 0.0
 
@@ -66,57 +98,102 @@ def _he_rate_mbps(bw_mhz: int, nss: int, max_mcs: int) -> int:
 
 
 def _parse_bw(bw_str: str) -> int:
+    head = bw_str.lstrip().partition(" ")[0]
+    if head.isdigit():
+        return int(head)
     m = re.search(r"(\d+)", bw_str)
     return int(m.group(1)) if m else 20
 
 
-def parse_nmcli(output: str) -> List[AccessPoint]:
-    aps: List[AccessPoint] = []
+def _parse_nmcli_line(
+    line: str, split: Callable[[str], List[str]] = _split_terse
+) -> Optional[dict]:
+    """Parse one nmcli terse row into AccessPoint kwargs (None if malformed)."""
+    line = line.rstrip("\n")
+    if not line.strip():
+        return None
+    parts = split(line)
+    if len(parts) < 12:
+        return None
+    try:
+        in_use = parts[0].strip() == "*"
+        ssid = parts[1].strip()
+        bssid = parts[2].strip()
+        mode = parts[3].strip()
+        chan = int(parts[4]) if parts[4].strip().isdigit() else 0
+        freq = _parse_freq(parts[5])
+        rate = _parse_rate(parts[6])
+        signal = int(parts[7]) if parts[7].strip().isdigit() else 0
+        security = parts[8].strip()
+        wpa = parts[9].strip()
+        rsn = parts[10].strip()
+        bw = _parse_bw(parts[11])
+        # Fallback: nmcli sometimes returns CHAN=0 for certain channels.
+        # When freq is available, derive the channel from it instead.
+        if chan == 0 and freq:
+            chan = freq_to_chan(freq)
+        # Derive freq from channel if not provided
+        if freq == 0 and chan:
+            freq = chan_to_freq(chan)
+        return dict(
+            ssid=ssid,
+            bssid=bssid,
+            mode=mode,
+            channel=chan,
+            freq_mhz=freq,
+            rate_mbps=rate,
+            signal=signal,
+            security=security,
+            wpa_flags=wpa,
+            rsn_flags=rsn,
+            bandwidth_mhz=bw,
+            in_use=in_use,
+        )
+    except Exception:
+        return None
+
+
+def _build_aps(rows: List[dict]) -> List[AccessPoint]:
+    """Materialize parsed rows, resolving each distinct OUI block only once.
+
+    A vendor lookup depends on at most the first nine hex digits (MA-S
+    /36), i.e. ``bssid[:13]``, so radios and virtual BSSIDs of the same AP
+    share a single get_manufacturer() call.
+    """
+    manuf = {k: get_manufacturer(k) for k in {r["bssid"][:13].upper() for r in rows}}
+    return [
+        AccessPoint(**r, manufacturer_hint=manuf[r["bssid"][:13].upper()])
+        for r in rows
+    ]
+
+
+def parse_nmcli(output: str, escaped: bool = True) -> List[AccessPoint]:
+    split = _split_terse if escaped else _split_unescaped
+    rows: List[dict] = []
     for line in output.splitlines():
-        if not line.strip():
-            continue
-        parts = _split_terse(line)
-        if len(parts) < 12:
-            continue
-        try:
-            in_use = parts[0].strip() == "*"
-            ssid = parts[1].strip()
-            bssid = parts[2].strip()
-            mode = parts[3].strip()
-            chan = int(parts[4]) if parts[4].strip().isdigit() else 0
-            freq = _parse_freq(parts[5])
-            rate = _parse_rate(parts[6])
-            signal = int(parts[7]) if parts[7].strip().isdigit() else 0
-            security = parts[8].strip()
-            wpa = parts[9].strip()
-            rsn = parts[10].strip()
-            bw = _parse_bw(parts[11])
-            # Fallback: nmcli sometimes returns CHAN=0 for certain channels.
-            # When freq is available, derive the channel from it instead.
-            if chan == 0 and freq:
-                chan = freq_to_chan(freq)
-            # Derive freq from channel if not provided
-            if freq == 0 and chan:
-                freq = chan_to_freq(chan)
-            aps.append(
-                AccessPoint(
-                    ssid=ssid,
-                    bssid=bssid,
-                    mode=mode,
-                    channel=chan,
-                    freq_mhz=freq,
-                    rate_mbps=rate,
-                    signal=signal,
-                    security=security,
-                    wpa_flags=wpa,
-                    rsn_flags=rsn,
-                    bandwidth_mhz=bw,
-                    in_use=in_use,
-                )
-            )
-        except Exception:
-            continue
-    return aps
+        row = _parse_nmcli_line(line, split)
+        if row is not None:
+            rows.append(row)
+    return _build_aps(rows)
+
+
+def _stream_nmcli(
+    cmd: List[str], timeout: float, escaped: bool = True
+) -> Tuple[int, List[AccessPoint], str]:
+    """Streaming parse_nmcli(): rows are parsed while nmcli is still writing.
+
+    *escaped* must match the command: False when it asks for `--escape no`.
+    """
+    split = _split_terse if escaped else _split_unescaped
+    rows: List[dict] = []
+
+    def _on_line(line: str) -> None:
+        row = _parse_nmcli_line(line, split)
+        if row is not None:
+            rows.append(row)
+
+    rc, stderr = _run_streamed(cmd, timeout, _on_line)
+    return rc, _build_aps(rows), stderr
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -127,10 +204,35 @@ _IW_IFACE: Optional[str] = None
 
 
 def _detect_wifi_iface() -> Optional[str]:
-    """Return the first 'managed' wireless interface found by `iw dev`."""
+    """Return the 'managed' wireless interface.
+
+    A lone wireless netdev in sysfs is taken as-is; otherwise the first
+    interface `iw dev` reports as 'type managed'.
+    """
     global _IW_IFACE
     if _IW_IFACE:
         return _IW_IFACE
+    # sysfs first: no fork and no parsing.  Wireless netdevs carry a
+    # 'wireless' (or 'phy80211') entry; ARPHRD type 1 rules out monitor
+    # interfaces (803) but not AP, mesh or IBSS ones, so sysfs is trusted
+    # only when it finds exactly one candidate.  Otherwise `iw dev` tells
+    # the managed interface apart.
+    try:
+        candidates = []
+        for name in sorted(os.listdir("/sys/class/net")):
+            base = f"/sys/class/net/{name}"
+            if not (
+                os.path.exists(f"{base}/wireless") or os.path.exists(f"{base}/phy80211")
+            ):
+                continue
+            with open(f"{base}/type") as fh:
+                if fh.read().strip() == "1":
+                    candidates.append(name)
+        if len(candidates) == 1:
+            _IW_IFACE = candidates[0]
+            return _IW_IFACE
+    except Exception:
+        pass
     try:
         out = subprocess.run(
             ["iw", "dev"], capture_output=True, text=True, timeout=3
@@ -219,6 +321,247 @@ def _decode_rsn_capabilities(raw_caps: str) -> str:
     return ", ".join(decoded)
 
 
+# Patterns for parse_iw_scan(), compiled once instead of per BSS block
+_IW_BSS_SPLIT_RE = re.compile(r"(?m)^BSS ")
+_IW_BSSID_HEAD_RE = re.compile(r"([0-9a-f:]{17})", re.IGNORECASE)
+# Single-valued "key: number" fields, fused so a block is scanned once; the
+# group name of each alternative is the field it yields (see _iw_scalars)
+_IW_SCALARS_RE = re.compile(
+    r"signal:\s*(?P<dbm_exact>[-\d.]+)\s*dBm"
+    r"|freq:\s*(?P<freq>[\d.]+)"
+    r"|station count:\s*(?P<station_count>\d+)"
+    r"|channel utilis[ae]tion:\s*(?P<chan_util>\d+)/255"
+    r"|(?i:TPC report:\s*TX power:\s*(?P<tpc_tx_power_dbm>\d+)\s*dBm)"
+    r"|Country:\s+(?P<country>[A-Z]{2})"
+    r"|(?i:beacon\s+interval:\s*(?P<beacon_interval_tu>\d+)\s*TU)"
+    r"|(?i:DTIM\s+period:\s*(?P<dtim_period>\d+))"
+)
+_IW_WIDTH_RE = re.compile(r"\b(20|40|80|160|320)\s*MHz\b", re.IGNORECASE)
+_IW_NSS_MCS_RE = re.compile(r"(\d+)\s+streams?\s*:\s*MCS\s+0-(\d+)", re.IGNORECASE)
+_IW_BSS_COLOR_RE = re.compile(r"BSS\s+color:\s*(\d+)", re.IGNORECASE)
+_IW_TWT_RE = re.compile(r"\bTWT\b", re.IGNORECASE)
+_IW_SPATIAL_REUSE_RE = re.compile(r"Spatial\s+Reuse", re.IGNORECASE)
+_IW_MFP_RE = re.compile(r"Capabilities:.*?MFP-(capable|required)", re.IGNORECASE)
+_IW_WPS_MANUF_RE = re.compile(r"(?im)^\s*\*\s*Manufacturer:\s*(.+?)\s*$")
+_IW_RSN_CAPS_RE = re.compile(r"(?im)^\s*Capabilities:\s*(.+?)\s*$")
+_IW_VENDOR_OUI_RE = re.compile(
+    r"Vendor\s+specific:\s*OUI\s*([0-9a-f:]{8})", re.IGNORECASE
+)
+_IW_CENTER_FREQ1_RE = re.compile(r"\*\s*center freq(?:\s+segment)?\s*1\s*:\s*(\d+)")
+_IW_SEC_OFFSET_RE = re.compile(r"\*\s*secondary channel offset:\s*(above|below)")
+_IW_OPER_BW_RE = re.compile(
+    r"\*\s*channel\s+width\s*:\s*(?:\d+\s+\()?(\d+)\s*MHz", re.IGNORECASE
+)
+_IW_VHT_OPER_RE = re.compile(r"VHT\s+operation", re.IGNORECASE)
+_IW_VHT_WIDTH_CODE_RE = re.compile(r"\*\s*channel\s+width:\s*(\d+)", re.IGNORECASE)
+
+
+def _iw_scalars(text: str) -> Dict[str, str]:
+    """First match of every _IW_SCALARS_RE field, collected in one pass."""
+    found: Dict[str, str] = {}
+    for m in _IW_SCALARS_RE.finditer(text):
+        key = m.lastgroup
+        if key not in found:
+            found[key] = m.group(key)
+    return found
+
+
+def _parse_iw_block(block: str) -> Optional[Tuple[str, dict]]:
+    """Parse one 'BSS …' block (header prefix stripped) into (bssid, fields)."""
+    lines = block.splitlines()
+    if not lines:
+        return None
+    m = _IW_BSSID_HEAD_RE.match(lines[0])
+    if not m:
+        return None
+    bssid = m.group(1).lower()
+    text = "\n".join(lines)
+    d: dict = {}
+    sc = _iw_scalars(text)
+
+    # ── Exact dBm ────────────────────────────────────────────────────
+    if "dbm_exact" in sc:
+        d["dbm_exact"] = float(sc["dbm_exact"])
+
+    # ── WiFi generation ──────────────────────────────────────────────
+    has_eht = "EHT capabilities" in text
+    has_he = "HE capabilities" in text
+    has_vht = "VHT capabilities" in text
+    has_ht = "HT capabilities" in text
+    freq_val = float(sc["freq"]) if "freq" in sc else 0
+    if has_eht:
+        d["wifi_gen"] = "WiFi 7"
+    elif has_he:
+        d["wifi_gen"] = "WiFi 6E" if freq_val >= 5925 else "WiFi 6"
+    elif has_vht:
+        d["wifi_gen"] = "WiFi 5"
+    elif has_ht:
+        d["wifi_gen"] = "WiFi 4"
+    else:
+        d["wifi_gen"] = ""
+
+    fam: List[str] = []
+    if has_ht:
+        fam.append("HT")
+    if has_vht:
+        fam.append("VHT")
+    if has_he:
+        fam.append("HE")
+    if has_eht:
+        fam.append("EHT")
+    width_vals = [
+        int(x)
+        for x in _IW_WIDTH_RE.findall(text)
+    ]
+    cap_bits: List[str] = []
+    if fam:
+        cap_bits.append("/".join(fam))
+    if width_vals:
+        cap_bits.append(f"max width {max(width_vals)} MHz")
+        d["iw_cap_max_bw"] = max(width_vals)
+    if cap_bits:
+        d["phy_cap_summary"] = " · ".join(cap_bits)
+
+    # ── HE/EHT max spatial streams & max MCS index ──────────────────
+    # iw reports "N streams: MCS 0-M" for each supported NSS; count how
+    # many have a valid MCS range before hitting "not supported".
+    he_nss_m = _IW_NSS_MCS_RE.findall(text)
+    if he_nss_m:
+        d["iw_max_nss"] = max(int(n) for n, _ in he_nss_m)
+        d["iw_max_mcs"] = max(int(m) for _, m in he_nss_m)
+
+    he_feats: List[str] = []
+    bss_color_m = _IW_BSS_COLOR_RE.search(text)
+    if bss_color_m:
+        he_feats.append(f"BSS color {bss_color_m.group(1)}")
+    if _IW_TWT_RE.search(text):
+        he_feats.append("TWT")
+    if _IW_SPATIAL_REUSE_RE.search(text):
+        he_feats.append("Spatial reuse")
+    if he_feats:
+        d["he_eht_features"] = ", ".join(he_feats)
+
+    # ── BSS Load ─────────────────────────────────────────────────────
+    if "station_count" in sc:
+        d["station_count"] = int(sc["station_count"])
+    if "chan_util" in sc:
+        d["chan_util"] = int(sc["chan_util"])
+
+    # ── RSN / AKM / PMF ──────────────────────────────────────────────
+    akm_at = text.find("Authentication suites:")
+    if akm_at >= 0:
+        # Rest of that line (what r"Authentication suites:(.*)" captured)
+        start = akm_at + 22
+        end = text.find("\n", start)
+        raw = text[start:] if end < 0 else text[start:end]
+        d["akm_raw"] = raw.strip()
+        has_sae = "SAE" in raw
+        has_psk = "PSK" in raw and "FT/PSK" not in raw or "PSK" in raw
+        has_eap = "EAP" in raw or "802.1X" in raw
+        has_owe = "OWE" in raw
+        d["ft"] = "FT/" in raw
+        if has_owe:
+            label = "OWE (Enhanced Open)"
+        elif has_eap:
+            label = "Enterprise (EAP)"
+        elif has_sae and has_psk:
+            label = "WPA2+WPA3"
+        elif has_sae:
+            label = "WPA3-SAE"
+        elif has_psk:
+            label = "WPA2-PSK"
+        else:
+            label = raw.strip()
+        if d["ft"]:
+            label += " +FT"
+        d["akm"] = label
+
+    caps_m = _IW_MFP_RE.search(text)
+    if caps_m:
+        d["pmf"] = (
+            "Required" if "required" in caps_m.group(1).lower() else "Optional"
+        )
+    else:
+        d["pmf"] = "No"
+
+    # ── 802.11h TPC Report IE (standard, iw already decodes it) ─────────
+    if "tpc_tx_power_dbm" in sc:
+        d["tpc_tx_power_dbm"] = int(sc["tpc_tx_power_dbm"])
+
+    # ── Vendor-specific IE parsers (AP name, TX power, …) ─────────────
+    parse_vendor_ies(text, d)
+
+    # ── WPS manufacturer hint (often reveals branded vendor on LAA MACs) ──
+    wps_manuf_m = _IW_WPS_MANUF_RE.search(text)
+    if wps_manuf_m:
+        wps_name = wps_manuf_m.group(1).strip().strip('"')
+        if wps_name and wps_name.lower() not in {"unknown", "private", "n/a"}:
+            d["wps_manufacturer"] = wps_name
+
+    # ── 802.11k / 802.11v ────────────────────────────────────────────
+    d["rrm"] = "Neighbor Report" in text
+    d["btm"] = "BSS Transition" in text
+
+    # ── Country code ─────────────────────────────────────────────────
+    if "country" in sc:
+        d["country"] = sc["country"]
+
+    # ── Beacon / TIM / RSN capabilities / Vendor IEs ────────────────
+    if "beacon_interval_tu" in sc:
+        d["beacon_interval_tu"] = int(sc["beacon_interval_tu"])
+
+    if "dtim_period" in sc:
+        d["dtim_period"] = int(sc["dtim_period"])
+
+    rsn_caps_m = _IW_RSN_CAPS_RE.search(text)
+    if rsn_caps_m:
+        decoded_caps = _decode_rsn_capabilities(rsn_caps_m.group(1))
+        if decoded_caps:
+            d["rsn_capabilities"] = decoded_caps
+
+    vendor_ouis = sorted(
+        {
+            x.upper()
+            for x in _IW_VENDOR_OUI_RE.findall(text)
+        }
+    )
+    if vendor_ouis:
+        d["vendor_ie_ouis"] = ", ".join(vendor_ouis)
+
+    # ── Bonded-block center frequency ─────────────────────────────────
+    # VHT (5 GHz 80/160) and HE/EHT (6 GHz) report "center freq 1: XXXX"
+    cf1_m = _IW_CENTER_FREQ1_RE.search(text)
+    if cf1_m:
+        cf = int(cf1_m.group(1))
+        if cf > 0:
+            d["iw_center_freq"] = cf
+    # HT 40 MHz (2.4 GHz) reports secondary channel offset; compute center
+    if "iw_center_freq" not in d and freq_val > 0:
+        sec_m = _IW_SEC_OFFSET_RE.search(text)
+        if sec_m:
+            offset = +10 if sec_m.group(1) == "above" else -10
+            d["iw_center_freq"] = int(freq_val) + offset
+
+    # ── Operational channel width (from HE/VHT Operation IE) ─────────
+    # HE operation (6 GHz):  "* channel width: 160 MHz"
+    # VHT operation (5 GHz): "* channel width: N" (numeric code 0-3)
+    oper_bw_m = _IW_OPER_BW_RE.search(text)
+    if oper_bw_m:
+        cw = int(oper_bw_m.group(1))
+        if cw in (20, 40, 80, 160, 320):
+            d["iw_oper_bw"] = cw
+    if "iw_oper_bw" not in d and _IW_VHT_OPER_RE.search(text):
+        vht_code_m = _IW_VHT_WIDTH_CODE_RE.search(text)
+        if vht_code_m:
+            _vht_bw = {0: 40, 1: 80, 2: 160, 3: 160}
+            code = int(vht_code_m.group(1))
+            bw_val = _vht_bw.get(code, 0)
+            if bw_val:
+                d["iw_oper_bw"] = bw_val
+
+    return bssid, d
+
+
 def parse_iw_scan(output: str) -> Dict[str, dict]:
     """
     Parse the text output of 'iw dev <iface> scan dump' into a dict
@@ -226,219 +569,82 @@ def parse_iw_scan(output: str) -> Dict[str, dict]:
     """
     result: Dict[str, dict] = {}
     # Split on BSS-header lines
-    blocks = re.split(r"(?m)^BSS ", output)
+    blocks = _IW_BSS_SPLIT_RE.split(output)
     for block in blocks[1:]:
-        lines = block.splitlines()
-        if not lines:
-            continue
-        m = re.match(r"([0-9a-f:]{17})", lines[0], re.IGNORECASE)
-        if not m:
-            continue
-        bssid = m.group(1).lower()
-        text = "\n".join(lines)
-        d: dict = {}
-
-        # ── Exact dBm ────────────────────────────────────────────────────
-        sig_m = re.search(r"signal:\s*([-\d.]+)\s*dBm", text)
-        if sig_m:
-            d["dbm_exact"] = float(sig_m.group(1))
-
-        # ── WiFi generation ──────────────────────────────────────────────
-        has_eht = "EHT capabilities" in text
-        has_he = "HE capabilities" in text
-        has_vht = "VHT capabilities" in text
-        has_ht = "HT capabilities" in text
-        freq_m = re.search(r"freq:\s*([\d.]+)", text)
-        freq_val = float(freq_m.group(1)) if freq_m else 0
-        if has_eht:
-            d["wifi_gen"] = "WiFi 7"
-        elif has_he:
-            d["wifi_gen"] = "WiFi 6E" if freq_val >= 5925 else "WiFi 6"
-        elif has_vht:
-            d["wifi_gen"] = "WiFi 5"
-        elif has_ht:
-            d["wifi_gen"] = "WiFi 4"
-        else:
-            d["wifi_gen"] = ""
-
-        fam: List[str] = []
-        if has_ht:
-            fam.append("HT")
-        if has_vht:
-            fam.append("VHT")
-        if has_he:
-            fam.append("HE")
-        if has_eht:
-            fam.append("EHT")
-        width_vals = [
-            int(x)
-            for x in re.findall(r"\b(20|40|80|160|320)\s*MHz\b", text, re.IGNORECASE)
-        ]
-        cap_bits: List[str] = []
-        if fam:
-            cap_bits.append("/".join(fam))
-        if width_vals:
-            cap_bits.append(f"max width {max(width_vals)} MHz")
-            d["iw_cap_max_bw"] = max(width_vals)
-        if cap_bits:
-            d["phy_cap_summary"] = " · ".join(cap_bits)
-
-        # ── HE/EHT max spatial streams & max MCS index ──────────────────
-        # iw reports "N streams: MCS 0-M" for each supported NSS; count how
-        # many have a valid MCS range before hitting "not supported".
-        he_nss_m = re.findall(
-            r"(\d+)\s+streams?\s*:\s*MCS\s+0-(\d+)", text, re.IGNORECASE
-        )
-        if he_nss_m:
-            d["iw_max_nss"] = max(int(n) for n, _ in he_nss_m)
-            d["iw_max_mcs"] = max(int(m) for _, m in he_nss_m)
-
-        he_feats: List[str] = []
-        bss_color_m = re.search(r"BSS\s+color:\s*(\d+)", text, re.IGNORECASE)
-        if bss_color_m:
-            he_feats.append(f"BSS color {bss_color_m.group(1)}")
-        if re.search(r"\bTWT\b", text, re.IGNORECASE):
-            he_feats.append("TWT")
-        if re.search(r"Spatial\s+Reuse", text, re.IGNORECASE):
-            he_feats.append("Spatial reuse")
-        if he_feats:
-            d["he_eht_features"] = ", ".join(he_feats)
-
-        # ── BSS Load ─────────────────────────────────────────────────────
-        sc_m = re.search(r"station count:\s*(\d+)", text)
-        cu_m = re.search(r"channel utilis[ae]tion:\s*(\d+)/255", text)
-        if sc_m:
-            d["station_count"] = int(sc_m.group(1))
-        if cu_m:
-            d["chan_util"] = int(cu_m.group(1))
-
-        # ── RSN / AKM / PMF ──────────────────────────────────────────────
-        akm_m = re.search(r"Authentication suites:(.*)", text)
-        if akm_m:
-            raw = akm_m.group(1)
-            d["akm_raw"] = raw.strip()
-            has_sae = "SAE" in raw
-            has_psk = "PSK" in raw and "FT/PSK" not in raw or "PSK" in raw
-            has_eap = "EAP" in raw or "802.1X" in raw
-            has_owe = "OWE" in raw
-            d["ft"] = "FT/" in raw
-            if has_owe:
-                label = "OWE (Enhanced Open)"
-            elif has_eap:
-                label = "Enterprise (EAP)"
-            elif has_sae and has_psk:
-                label = "WPA2+WPA3"
-            elif has_sae:
-                label = "WPA3-SAE"
-            elif has_psk:
-                label = "WPA2-PSK"
-            else:
-                label = raw.strip()
-            if d["ft"]:
-                label += " +FT"
-            d["akm"] = label
-
-        caps_m = re.search(
-            r"Capabilities:.*?MFP-(capable|required)", text, re.IGNORECASE
-        )
-        if caps_m:
-            d["pmf"] = (
-                "Required" if "required" in caps_m.group(1).lower() else "Optional"
-            )
-        else:
-            d["pmf"] = "No"
-
-        # ── 802.11h TPC Report IE (standard, iw already decodes it) ─────────
-        tpc_m = re.search(r"TPC report:\s*TX power:\s*(\d+)\s*dBm", text, re.IGNORECASE)
-        if tpc_m:
-            d["tpc_tx_power_dbm"] = int(tpc_m.group(1))
-
-        # ── Vendor-specific IE parsers (AP name, TX power, …) ─────────────
-        parse_vendor_ies(text, d)
-
-        # ── WPS manufacturer hint (often reveals branded vendor on LAA MACs) ──
-        wps_manuf_m = re.search(r"(?im)^\s*\*\s*Manufacturer:\s*(.+?)\s*$", text)
-        if wps_manuf_m:
-            wps_name = wps_manuf_m.group(1).strip().strip('"')
-            if wps_name and wps_name.lower() not in {"unknown", "private", "n/a"}:
-                d["wps_manufacturer"] = wps_name
-
-        # ── 802.11k / 802.11v ────────────────────────────────────────────
-        d["rrm"] = "Neighbor Report" in text
-        d["btm"] = "BSS Transition" in text
-
-        # ── Country code ─────────────────────────────────────────────────
-        cc_m = re.search(r"Country:\s+([A-Z]{2})", text)
-        if cc_m:
-            d["country"] = cc_m.group(1)
-
-        # ── Beacon / TIM / RSN capabilities / Vendor IEs ────────────────
-        bi_m = re.search(r"beacon\s+interval:\s*(\d+)\s*TU", text, re.IGNORECASE)
-        if bi_m:
-            d["beacon_interval_tu"] = int(bi_m.group(1))
-
-        dtim_m = re.search(r"DTIM\s+period:\s*(\d+)", text, re.IGNORECASE)
-        if dtim_m:
-            d["dtim_period"] = int(dtim_m.group(1))
-
-        rsn_caps_m = re.search(r"(?im)^\s*Capabilities:\s*(.+?)\s*$", text)
-        if rsn_caps_m:
-            decoded_caps = _decode_rsn_capabilities(rsn_caps_m.group(1))
-            if decoded_caps:
-                d["rsn_capabilities"] = decoded_caps
-
-        vendor_ouis = sorted(
-            {
-                x.upper()
-                for x in re.findall(
-                    r"Vendor\s+specific:\s*OUI\s*([0-9a-f:]{8})", text, re.IGNORECASE
-                )
-            }
-        )
-        if vendor_ouis:
-            d["vendor_ie_ouis"] = ", ".join(vendor_ouis)
-
-        # ── Bonded-block center frequency ─────────────────────────────────
-        # VHT (5 GHz 80/160) and HE/EHT (6 GHz) report "center freq 1: XXXX"
-        cf1_m = re.search(r"\*\s*center freq(?:\s+segment)?\s*1\s*:\s*(\d+)", text)
-        if cf1_m:
-            cf = int(cf1_m.group(1))
-            if cf > 0:
-                d["iw_center_freq"] = cf
-        # HT 40 MHz (2.4 GHz) reports secondary channel offset; compute center
-        if "iw_center_freq" not in d and freq_val > 0:
-            sec_m = re.search(r"\*\s*secondary channel offset:\s*(above|below)", text)
-            if sec_m:
-                offset = +10 if sec_m.group(1) == "above" else -10
-                d["iw_center_freq"] = int(freq_val) + offset
-
-        # ── Operational channel width (from HE/VHT Operation IE) ─────────
-        # HE operation (6 GHz):  "* channel width: 160 MHz"
-        # VHT operation (5 GHz): "* channel width: N" (numeric code 0-3)
-        oper_bw_m = re.search(
-            r"\*\s*channel\s+width\s*:\s*(?:\d+\s+\()?(\d+)\s*MHz",
-            text,
-            re.IGNORECASE,
-        )
-        if oper_bw_m:
-            cw = int(oper_bw_m.group(1))
-            if cw in (20, 40, 80, 160, 320):
-                d["iw_oper_bw"] = cw
-        if "iw_oper_bw" not in d and re.search(r"VHT\s+operation", text, re.IGNORECASE):
-            vht_code_m = re.search(
-                r"\*\s*channel\s+width:\s*(\d+)", text, re.IGNORECASE
-            )
-            if vht_code_m:
-                _vht_bw = {0: 40, 1: 80, 2: 160, 3: 160}
-                code = int(vht_code_m.group(1))
-                bw_val = _vht_bw.get(code, 0)
-                if bw_val:
-                    d["iw_oper_bw"] = bw_val
-
-        result[bssid] = d
+        parsed = _parse_iw_block(block)
+        if parsed:
+            result[parsed[0]] = parsed[1]
     return result
 
 
+def _run_streamed(
+    cmd: List[str], timeout: float, on_line: Callable[[str], None]
+) -> Tuple[int, str]:
+    """Run *cmd*, feeding each stdout line to *on_line* as it arrives.
+
+    Parsing overlaps with the child still producing output instead of
+    waiting for the whole buffer.  Returns (returncode, stderr) and raises
+    subprocess.TimeoutExpired like subprocess.run when *timeout* elapses.
+    """
+    # stderr goes to a temp file rather than a second pipe: a child that
+    # fills a pipe buffer with warnings while we block on stdout would
+    # otherwise stall until the timer kills it.
+    err_file = tempfile.TemporaryFile()
+    try:
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=err_file, text=True
+        )
+    except BaseException:
+        err_file.close()
+        raise
+    expired = threading.Event()
+
+    def _kill() -> None:
+        expired.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, _kill)
+    timer.start()
+    try:
+        for line in proc.stdout:
+            on_line(line)
+        rc = proc.wait()
+        err_file.seek(0)
+        stderr = err_file.read().decode(errors="replace")
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+        err_file.close()
+    if expired.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return rc, stderr
+
+
+def _stream_iw_scan(cmd: List[str], timeout: float) -> Tuple[int, Dict[str, dict]]:
+    """Streaming parse_iw_scan(): each BSS block is parsed once the next starts."""
+    result: Dict[str, dict] = {}
+    buf: List[str] = []
+
+    def _flush() -> None:
+        if buf and buf[0].startswith("BSS "):
+            parsed = _parse_iw_block("".join(buf)[4:])
+            if parsed:
+                result[parsed[0]] = parsed[1]
+        buf.clear()
+
+    def _on_line(line: str) -> None:
+        if line.startswith("BSS "):
+            _flush()
+        buf.append(line)
+
+    rc, _ = _run_streamed(cmd, timeout, _on_line)
+    _flush()
+    return rc, result
+
+
 def _parse_iw_station_dump(output: str, target_bssid: str = "") -> Dict[str, object]:
     """Parse `iw dev <iface> station dump` for a station block (usually current AP)."""
 
@@ -633,33 +839,80 @@ def _get_connected_link_metrics(iface: str) -> Dict[str, object]:
     return d
 
 
+# AccessPoint fields copied verbatim from parse_iw_scan() results
+_IW_ENRICH_ATTRS = frozenset(
+    {
+        "dbm_exact",
+        "wifi_gen",
+        "chan_util",
+        "station_count",
+        "pmf",
+        "akm",
+        "akm_raw",
+        "wps_manufacturer",
+        "rrm",
+        "btm",
+        "ft",
+        "country",
+        "iw_center_freq",
+        "beacon_interval_tu",
+        "dtim_period",
+        "rsn_capabilities",
+        "vendor_ie_ouis",
+        "phy_cap_summary",
+        "he_eht_features",
+        "ap_name",
+        "cisco_tx_power_dbm",
+        "ruckus_tx_power_dbm",
+        "tpc_tx_power_dbm",
+    }
+)
+
+# AccessPoint fields copied from _get_connected_link_metrics() for the joined AP
+_CONN_ENRICH_ATTRS = frozenset(
+    {
+        "conn_iface",
+        "conn_link_ssid",
+        "conn_link_freq_mhz",
+        "conn_link_signal_dbm",
+        "conn_rx_bitrate",
+        "conn_tx_bitrate",
+        "conn_expected_tp",
+        "conn_signal_avg_dbm",
+        "conn_tx_retries",
+        "conn_tx_failed",
+        "conn_inactive_ms",
+        "conn_connected_time_s",
+        "conn_tx_packets",
+        "conn_tx_bytes",
+        "conn_rx_packets",
+        "conn_rx_bytes",
+        "conn_rx_drop_misc",
+        "conn_rx_phy",
+        "conn_tx_phy",
+        "conn_survey_busy_pct",
+        "conn_survey_noise_dbm",
+    }
+)
+
+
 def enrich_with_iw(aps: List[AccessPoint]) -> None:
     """Run 'iw dev scan dump' and merge extra fields into each AccessPoint."""
     iface = _detect_wifi_iface()
     if not iface:
         return
     try:
-        res = subprocess.run(
-            ["iw", "dev", iface, "scan", "dump"],
-            capture_output=True,
-            text=True,
-            timeout=6,
-        )
-        if res.returncode != 0:
+        rc, iw_data = _stream_iw_scan(["iw", "dev", iface, "scan", "dump"], 6)
+        if rc != 0:
             return
-        iw_data = parse_iw_scan(res.stdout)
 
         # Second pass with -u to get undecoded IEs (e.g. Cisco IE 133 AP name).
         # Run separately because -u suppresses some decoded output (e.g. BSS Load).
         # Note: -u must come after the subcommands: iw dev <iface> scan dump -u
-        res_u = subprocess.run(
-            ["iw", "dev", iface, "scan", "dump", "-u"],
-            capture_output=True,
-            text=True,
-            timeout=6,
+        rc_u, iw_data_u = _stream_iw_scan(
+            ["iw", "dev", iface, "scan", "dump", "-u"], 6
         )
-        if res_u.returncode == 0:
-            iw_data_u = parse_iw_scan(res_u.stdout)
+        if rc_u == 0:
             for bssid, d_u in iw_data_u.items():
                 if "ap_name" in d_u:
                     iw_data.setdefault(bssid, {})["ap_name"] = d_u["ap_name"]
@@ -674,52 +927,23 @@ def enrich_with_iw(aps: List[AccessPoint]) -> None:
         conn_data = _get_connected_link_metrics(iface)
         conn_bssid = str(conn_data.get("conn_bssid", "")).lower()
         for ap in aps:
-            d = iw_data.get(ap.bssid.lower())
+            d = iw_data.get(ap.bssid_lower)
             if not d:
                 d = {}
 
-            for attr in (
-                "dbm_exact",
-                "wifi_gen",
-                "chan_util",
-                "station_count",
-                "pmf",
-                "akm",
-                "akm_raw",
-                "wps_manufacturer",
-                "rrm",
-                "btm",
-                "ft",
-                "country",
-                "iw_center_freq",
-                "beacon_interval_tu",
-                "dtim_period",
-                "rsn_capabilities",
-                "vendor_ie_ouis",
-                "phy_cap_summary",
-                "he_eht_features",
-                "ap_name",
-                "cisco_tx_power_dbm",
-                "ruckus_tx_power_dbm",
-                "tpc_tx_power_dbm",
-            ):
-                if attr in d:
-                    setattr(ap, attr, d[attr])
+            # Slotted dataclass: no __dict__ to merge into, so assign only
+            # the keys this block actually produced (set intersection in C)
+            for attr in _IW_ENRICH_ATTRS.intersection(d):
+                setattr(ap, attr, d[attr])
 
             # Prefer WPS-advertised manufacturer when OUI lookup is missing
             # or when BSSID is locally-administered (common synthetic radio MAC).
             wps_vendor = d.get("wps_manufacturer", "")
             if wps_vendor:
-                use_wps = not ap.manufacturer
-                try:
-                    first_octet = int(ap.bssid[:2], 16)
-                    if first_octet & 0x02:
-                        use_wps = True
-                except Exception:
-                    pass
-                if use_wps:
+                if not ap.manufacturer or ap.bssid_laa:
                     ap.manufacturer = wps_vendor
                     ap.manufacturer_source = "WPS (iw scan)"
+            ap.invalidate_derived()
 
             # ── Fix bandwidth=0 (nmcli doesn't populate BANDWIDTH for 6 GHz) ─
             if ap.bandwidth_mhz == 0:
@@ -750,32 +974,9 @@ def enrich_with_iw(aps: List[AccessPoint]) -> None:
                 mcs = d.get("iw_max_mcs", 11)
                 if nss > 0:
                     ap.rate_mbps = float(_he_rate_mbps(ap.bandwidth_mhz, nss, mcs))
-            if conn_bssid and ap.bssid.lower() == conn_bssid:
-                for attr in (
-                    "conn_iface",
-                    "conn_link_ssid",
-                    "conn_link_freq_mhz",
-                    "conn_link_signal_dbm",
-                    "conn_rx_bitrate",
-                    "conn_tx_bitrate",
-                    "conn_expected_tp",
-                    "conn_signal_avg_dbm",
-                    "conn_tx_retries",
-                    "conn_tx_failed",
-                    "conn_inactive_ms",
-                    "conn_connected_time_s",
-                    "conn_tx_packets",
-                    "conn_tx_bytes",
-                    "conn_rx_packets",
-                    "conn_rx_bytes",
-                    "conn_rx_drop_misc",
-                    "conn_rx_phy",
-                    "conn_tx_phy",
-                    "conn_survey_busy_pct",
-                    "conn_survey_noise_dbm",
-                ):
-                    if attr in conn_data:
-                        setattr(ap, attr, conn_data[attr])
+            if conn_bssid and ap.bssid_lower == conn_bssid:
+                for attr in _CONN_ENRICH_ATTRS.intersection(conn_data):
+                    setattr(ap, attr, conn_data[attr])
 
         # ── Frequency-based wifi_gen fallback ─────────────────────────────
         # If iw scan dump missed the AP (no scan cache for 6 GHz radio),
@@ -783,6 +984,7 @@ def enrich_with_iw(aps: List[AccessPoint]) -> None:
         for ap in aps:
             if not ap.wifi_gen and ap.freq_mhz >= 5925:
                 ap.wifi_gen = "WiFi 6E"
+                ap.invalidate_derived()
 
         # ── LAA BSSID vendor inference from UAA sibling MACs ──────────────
         # MLO / multi-radio APs derive per-radio MACs from the same OUI base.
@@ -792,25 +994,37 @@ def enrich_with_iw(aps: List[AccessPoint]) -> None:
         # apply it to the LAA counterpart.
         tail_to_vendor: Dict[str, str] = {}
         for ap in aps:
-            try:
-                if ap.manufacturer and not (int(ap.bssid[:2], 16) & 0x02):
-                    tail_to_vendor[ap.bssid[3:]] = ap.manufacturer
-            except Exception:
-                pass
+            if ap.manufacturer and not ap.bssid_laa:
+                tail_to_vendor[ap.bssid[3:]] = ap.manufacturer
         for ap in aps:
-            try:
-                if not ap.manufacturer and (int(ap.bssid[:2], 16) & 0x02):
-                    vendor = tail_to_vendor.get(ap.bssid[3:], "")
-                    if vendor:
-                        ap.manufacturer = vendor
-                        ap.manufacturer_source = "LAA sibling OUI"
-            except Exception:
-                pass
+            if not ap.manufacturer and ap.bssid_laa:
+                vendor = tail_to_vendor.get(ap.bssid[3:], "")
+                if vendor:
+                    ap.manufacturer = vendor
+                    ap.manufacturer_source = "LAA sibling OUI"
+                    ap.invalidate_derived()
 
     except Exception:
         pass
 
 
+def _nmcli_list_cmd(rescan: str) -> List[str]:
+    # Unescaped output lets rows be split with str.split/rsplit in C
+    escape = ["--escape", "no"] if _nmcli_escape_no() else []
+    return [
+        "nmcli",
+        "-t",
+        *escape,
+        "-f",
+        NMCLI_FIELDS,
+        "dev",
+        "wifi",
+        "list",
+        "--rescan",
+        rescan,
+    ]
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 class WiFiScanner(QThread):
     """Background thread: periodically calls nmcli and emits fresh AP list."""
@@ -818,12 +1032,21 @@ class WiFiScanner(QThread):
     data_ready = pyqtSignal(list)  # list[AccessPoint]
     scan_error = pyqtSignal(str)
 
-    # How many poll cycles between active NM rescans.
+    # How many poll intervals between active NM rescans, measured in wall
+    # time so a backed-off poll wait cannot delay them.
     # NM rate-limits rescans to roughly one per 10 s; at the default 2 s
-    # interval, every 5 cycles ≈ 10 s sits right at NM's minimum window,
+    # interval, every 5 intervals ≈ 10 s sits right at NM's minimum window,
     # keeping data fresh while staying within the rate limit.
     _RESCAN_EVERY = 5
 
+    # While `iw event` reports no completed scans, the wait before a
+    # `--rescan no` poll doubles per quiet cycle up to this multiple of the
+    # interval, but never past _MAX_BACKOFF_SECS (or the interval itself, if
+    # longer) nor the next rescan; a scan event or an interval change resets
+    # it.
+    _MAX_BACKOFF = 4
+    _MAX_BACKOFF_SECS = 10
+
     def __init__(self, interval_sec: int = 2, linger_secs: float = 120.0):
         super().__init__()
         self._interval = interval_sec
@@ -831,17 +1054,90 @@ class WiFiScanner(QThread):
         # bssid_lower → (AccessPoint, last_seen_monotonic)
         self._seen_cache: Dict[str, Tuple["AccessPoint", float]] = {}
         self._running = False
+        # Set by the `iw event` reader whenever the kernel finishes a scan
+        self._wake = threading.Event()
+        self._event_proc: Optional[subprocess.Popen] = None
+        self._backoff = 1  # current multiple of the interval between polls
+        self._last_rescan = 0.0  # monotonic time of the last active rescan
 
     def set_interval(self, secs: int):
+        """Update the poll interval; wakes a pending wait so it applies now."""
         self._interval = secs
+        self._backoff = 1
+        self._wake.set()
 
     def set_linger_secs(self, secs: float):
         """Update the linger window.  Thread-safe (single float assignment)."""
         self._linger_secs = secs
 
+    def _start_event_watch(self) -> None:
+        """Spawn `iw event` and flag each "scan finished" on self._wake."""
+        try:
+            proc = subprocess.Popen(
+                ["iw", "event"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+        except Exception:
+            return  # no iw: plain fixed-interval polling
+        self._event_proc = proc
+
+        def _read() -> None:
+            try:
+                for line in proc.stdout:
+                    if "scan finished" in line:
+                        self._wake.set()
+            except Exception:
+                pass
+
+        threading.Thread(target=_read, daemon=True).start()
+
+    def _stop_event_watch(self) -> None:
+        proc, self._event_proc = self._event_proc, None
+        if proc is not None and proc.poll() is None:
+            try:
+                proc.terminate()
+                proc.wait(1)
+            except Exception:
+                pass
+
+    def _wait_next_cycle(self) -> None:
+        """Sleep until the next poll and set the backoff for the one after.
+
+        With an `iw event` watcher alive, a completed kernel scan wakes the
+        loop right away (repeat events coalesce on the flag) and quiet
+        periods stretch the wait; without one, poll at the fixed interval.
+        set_interval() and stop() wake the wait in either case.
+        """
+        interval = self._interval
+        proc = self._event_proc
+        if proc is None or proc.poll() is not None:
+            self._wake.wait(interval)
+            self._wake.clear()
+            self._backoff = 1
+            return
+        timeout = min(
+            interval * self._backoff, max(interval, self._MAX_BACKOFF_SECS)
+        )
+        # Never sleep past the next active rescan
+        timeout = max(0.0, min(timeout, self._rescan_due() - time.monotonic()))
+        if self._wake.wait(timeout):
+            self._backoff = 1
+        else:
+            self._backoff = min(self._backoff * 2, self._MAX_BACKOFF)
+
+    def _rescan_due(self) -> float:
+        """Monotonic time at which the next active rescan is due."""
+        return self._last_rescan + self._RESCAN_EVERY * self._interval
+
     def run(self):
         self._running = True
         _cycle = 0
+        self._backoff = 1
+        self._last_rescan = 0.0
+        self._wake.clear()
+        self._start_event_watch()
 
         while self._running:
             # Hidden APs require two consecutive scans to reliably appear:
@@ -851,71 +1147,42 @@ class WiFiScanner(QThread):
             # This matches observed NM behaviour: back-to-back --rescan yes
             # finds hidden APs that a single call misses.
             # On non-rescan cycles --rescan no returns cached data instantly.
-            do_rescan = _cycle % self._RESCAN_EVERY == 0 or _cycle == 2
+            do_rescan = (
+                _cycle in (0, 2) or time.monotonic() >= self._rescan_due()
+            )
+            if do_rescan:
+                self._last_rescan = time.monotonic()
             cmd_timeout = 30 if do_rescan else 8
+            # Same cached probe _nmcli_list_cmd() uses for `--escape no`
+            escaped = not _nmcli_escape_no()
 
             try:
                 if do_rescan:
                     # First sweep — triggers probe requests on all channels
                     subprocess.run(
-                        [
-                            "nmcli",
-                            "-t",
-                            "-f",
-                            NMCLI_FIELDS,
-                            "dev",
-                            "wifi",
-                            "list",
-                            "--rescan",
-                            "yes",
-                        ],
+                        _nmcli_list_cmd("yes"),
                         capture_output=True,
                         text=True,
                         timeout=cmd_timeout,
                     )
                     # Second sweep — picks up probe responses from hidden APs
-                    result = subprocess.run(
-                        [
-                            "nmcli",
-                            "-t",
-                            "-f",
-                            NMCLI_FIELDS,
-                            "dev",
-                            "wifi",
-                            "list",
-                            "--rescan",
-                            "yes",
-                        ],
-                        capture_output=True,
-                        text=True,
-                        timeout=cmd_timeout,
+                    rc, aps, stderr = _stream_nmcli(
+                        _nmcli_list_cmd("yes"), cmd_timeout, escaped
                     )
                 else:
-                    result = subprocess.run(
-                        [
-                            "nmcli",
-                            "-t",
-                            "-f",
-                            NMCLI_FIELDS,
-                            "dev",
-                            "wifi",
-                            "list",
-                            "--rescan",
-                            "no",
-                        ],
-                        capture_output=True,
-                        text=True,
-                        timeout=cmd_timeout,
+                    rc, aps, stderr = _stream_nmcli(
+                        _nmcli_list_cmd("no"), cmd_timeout, escaped
                     )
-                if result.returncode == 0:
-                    aps = parse_nmcli(result.stdout)
+                # Scan events raised up to here are already in this result
+                self._wake.clear()
+                if rc == 0:
                     enrich_with_iw(aps)  # merge iw BSS-Load / WiFi-gen / k-v-r data
 
                     # ── Linger merge ────────────────────────────────────────
                     now = time.monotonic()
                     fresh: set[str] = set()
                     for ap in aps:
-                        key = ap.bssid.lower()
+                        key = ap.bssid_lower
                         ap.is_lingering = False
                         self._seen_cache[key] = (ap, now)
                         fresh.add(key)
@@ -938,7 +1205,7 @@ class WiFiScanner(QThread):
 
                     self.data_ready.emit(aps)
                 else:
-                    self.scan_error.emit(result.stderr.strip())
+                    self.scan_error.emit(stderr.strip())
             except FileNotFoundError:
                 self.scan_error.emit("nmcli not found — is NetworkManager installed?")
                 break
@@ -948,10 +1215,14 @@ class WiFiScanner(QThread):
                 self.scan_error.emit(str(e))
 
             _cycle += 1
-            time.sleep(self._interval)
+            if self._running:
+                self._wait_next_cycle()
+
+        self._stop_event_watch()
 
     def stop(self):
         self._running = False
+        self._wake.set()
         self.wait(2000)
 
 
@@ -6,36 +6,150 @@ Contains table headers/columns plus Qt table and filter proxy models.
 from .core_scanner import *
 from .theme import IW_GEN_COLORS
 
+# Shared ForegroundRole brushes — data() runs per cell per repaint, so avoid
+# re-parsing color strings and allocating brushes on every call.
+_BRUSH_LINGER = QBrush(QColor(TABLE_LINGER_FG))
+_BRUSH_EXCELLENT = QBrush(QColor(SIG_EXCELLENT))
+_BRUSH_FAIR = QBrush(QColor(SIG_FAIR))
+_BRUSH_WEAK = QBrush(QColor(SIG_WEAK))
+_BRUSH_POOR = QBrush(QColor(SIG_POOR))
+_BRUSH_GEN: Dict[str, QBrush] = {
+    gen: QBrush(QColor(c)) for gen, c in IW_GEN_COLORS.items() if c
+}
+
+# Proxy sort role: native sort keys for columns that have one (else None)
+SORT_ROLE = Qt.ItemDataRole.UserRole + 1
+
+# Strips units/labels from numeric cells when building sort keys
+# Every byte except digits, "." and "-": deleted to leave a float literal
+_NON_NUMERIC = bytes(b for b in range(256) if b not in b"0123456789.-")
+
+# Columns sorted by value rather than by display string
+_NUMERIC_COLS = frozenset(
+    {
+        COL_CHAN,
+        COL_FREQ,
+        COL_BW,
+        COL_SIG,
+        COL_DBM,
+        COL_RATE,
+        COL_UTIL,
+        COL_CLIENTS,
+        COL_CISCO_PWR,
+    }
+)
+
+
+class _SsidColorMap(dict):
+    """SSID → QColor map that assigns the next palette color on first lookup.
+
+    get() allocates too, so graph widgets holding this map never need it
+    pre-seeded; the empty (hidden) SSID still falls back to *default*.
+    """
+
+    def __missing__(self, ssid: str) -> QColor:
+        c = self[ssid] = QColor(SSID_COLORS[len(self) % len(SSID_COLORS)])
+        return c
+
+    def get(self, ssid, default=None):
+        return self[ssid] if ssid else default
+
 
 class APTableModel(QAbstractTableModel):
     def __init__(self):
         super().__init__()
         self._aps: List[AccessPoint] = []
-        self._ssid_colors: Dict[str, QColor] = {}
-        self._color_idx = 0
+        self._dbm: List[int] = []  # per-row dBm, parallel to _aps
+        # column → per-row numeric sort key (None = unparsable); built lazily
+        # by sort_key() and dropped whenever rows change
+        self._sort_keys: Dict[int, List[Optional[float]]] = {}
+        self._ssid_colors: Dict[str, QColor] = _SsidColorMap()
+        self._ssid_brushes: Dict[str, QBrush] = {}
+
+    def _brush_for_ssid(self, ssid: str) -> QBrush:
+        key = ssid if ssid else "__hidden__"
+        brush = self._ssid_brushes.get(key)
+        if brush is None:
+            c = QColor(self._color_for_ssid(ssid))
+            c.setAlpha(230)
+            brush = self._ssid_brushes[key] = QBrush(c)
+        return brush
 
     def _color_for_ssid(self, ssid: str) -> QColor:
-        key = ssid if ssid else "__hidden__"
-        if key not in self._ssid_colors:
-            c = SSID_COLORS[self._color_idx % len(SSID_COLORS)]
-            self._ssid_colors[key] = QColor(c)
-            self._color_idx += 1
-        return self._ssid_colors[key]
+        return self._ssid_colors[ssid if ssid else "__hidden__"]
+
+    def _rows_changed(self):
+        self._refresh_dbm()
+        self._sort_keys.clear()
+
+    def _refresh_dbm(self):
+        # Same result as AccessPoint.dbm: exact iw dBm when known, else the
+        # nmcli signal approximation — computed for all rows in one pass.
+        n = len(self._aps)
+        signals = np.fromiter((a.signal for a in self._aps), dtype=np.int16, count=n)
+        exact = np.fromiter(
+            (np.nan if a.dbm_exact is None else a.dbm_exact for a in self._aps),
+            dtype=np.float64,
+            count=n,
+        )
+        dbm = np.where(np.isnan(exact), signals_to_dbm_array(signals), np.rint(exact))
+        self._dbm = dbm.astype(np.int64).tolist()
 
     def update(self, aps: List[AccessPoint]):
-        self.beginResetModel()
-        self._aps = sorted(aps, key=lambda a: -a.signal)
-        # Eagerly assign colors so ssid_colors() is always fully populated
-        # before the graph widgets request them.
-        for ap in self._aps:
-            self._color_for_ssid(ap.ssid)
-        self.endResetModel()
+        """Apply a new scan by BSSID diff instead of resetting the model.
+
+        Rows for vanished BSSIDs are removed, surviving rows are swapped in
+        place and announced via dataChanged, and new BSSIDs are appended.
+        Row order is left to the sort proxy, so existing indexes, selection
+        and scroll position survive each scan.
+        """
+        new_by_bssid = {ap.bssid: ap for ap in aps}
+
+        # ── Remove vanished rows, bottom-up in contiguous runs ─────────────
+        row = len(self._aps) - 1
+        while row >= 0:
+            if self._aps[row].bssid in new_by_bssid:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and self._aps[row].bssid not in new_by_bssid:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, last)
+            del self._aps[row + 1 : last + 1]
+            self._rows_changed()
+            self.endRemoveRows()
+
+        # ── Swap surviving rows in place ──────────────────────────────────
+        present = set()
+        for i, old in enumerate(self._aps):
+            self._aps[i] = new_by_bssid[old.bssid]
+            present.add(old.bssid)
+        self._rows_changed()
+        if self._aps:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self._aps) - 1, len(TABLE_HEADERS) - 1),
+            )
 
+        # ── Append new BSSIDs ─────────────────────────────────────────────
+        added = [ap for bssid, ap in new_by_bssid.items() if bssid not in present]
+        if added:
+            first = len(self._aps)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            self._aps.extend(added)
+            self._rows_changed()
+            self.endInsertRows()
+
+    # Flat table: valid parents have no children, so the proxy never
+    # descends into individual cells looking for child rows.
     def rowCount(self, parent=QModelIndex()):
-        return len(self._aps)
+        return 0 if parent.isValid() else len(self._aps)
 
     def columnCount(self, parent=QModelIndex()):
-        return len(TABLE_HEADERS)
+        return 0 if parent.isValid() else len(TABLE_HEADERS)
+
+    def hasChildren(self, parent=QModelIndex()):
+        return not parent.isValid()
 
     def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
         if (
@@ -52,6 +166,8 @@ class APTableModel(QAbstractTableModel):
         col = index.column()
 
         if role == Qt.ItemDataRole.DisplayRole:
+            if col == COL_DBM:
+                return f"{self._dbm[index.row()]} dBm"
             return self._display(ap, col)
 
         if role == Qt.ItemDataRole.ToolTipRole:
@@ -61,54 +177,40 @@ class APTableModel(QAbstractTableModel):
 
         if role == Qt.ItemDataRole.DecorationRole:
             if col == COL_MANUF:
-                icon = get_vendor_icon(ap.manufacturer)
-                return icon if icon is not None else get_vendor_placeholder_icon()
+                return get_vendor_decoration(ap.manufacturer)
             return None
 
         if role == Qt.ItemDataRole.ForegroundRole:
             # Dim the entire row while an AP is in its linger grace period
             if ap.is_lingering:
-                return QBrush(QColor(TABLE_LINGER_FG))
+                return _BRUSH_LINGER
             if col == COL_SSID:
                 # Color the SSID text with its network colour (replaces tinted rows)
-                c = QColor(self._color_for_ssid(ap.ssid))
-                c.setAlpha(230)
-                return QBrush(c)
+                return self._brush_for_ssid(ap.ssid)
             if col == COL_SIG:
-                return QBrush(signal_color(ap.signal))
+                return signal_brush(ap.signal)
             if col == COL_DBM:
-                return QBrush(signal_color(ap.signal))
+                return signal_brush(ap.signal)
             if col == COL_INUSE:
-                return QBrush(QColor(SIG_EXCELLENT)) if ap.in_use else None
+                return _BRUSH_EXCELLENT if ap.in_use else None
             if col == COL_GEN:
-                c = IW_GEN_COLORS.get(ap.wifi_gen)
-                return QBrush(QColor(c)) if c else None
+                return _BRUSH_GEN.get(ap.wifi_gen)
             if col == COL_UTIL:
                 pct = ap.chan_util_pct
                 if pct is not None:
                     if pct >= 75:
-                        return QBrush(QColor(SIG_POOR))
+                        return _BRUSH_POOR
                     if pct >= 50:
-                        return QBrush(QColor(SIG_WEAK))
+                        return _BRUSH_WEAK
                     if pct >= 25:
-                        return QBrush(QColor(SIG_FAIR))
-                    return QBrush(QColor(SIG_EXCELLENT))
+                        return _BRUSH_FAIR
+                    return _BRUSH_EXCELLENT
             if col == COL_SEC:
                 sec = ap.security_short
                 if sec == "Open" or sec == "":
-                    return QBrush(QColor(SIG_POOR))
+                    return _BRUSH_POOR
                 if "WPA3" in sec or "WPA2+WPA3" in sec:
-                    return QBrush(QColor(SIG_EXCELLENT))
-            return None
-
-        if role == Qt.ItemDataRole.BackgroundRole:
-            # Alternate very subtle row shading for readability
-            if index.row() % 2 == 1:
-                return (
-                    QApplication.instance()
-                    .palette()
-                    .brush(QPalette.ColorRole.AlternateBase)
-                )
+                    return _BRUSH_EXCELLENT
             return None
 
         if role == Qt.ItemDataRole.TextAlignmentRole:
@@ -128,21 +230,62 @@ class APTableModel(QAbstractTableModel):
                 return Qt.AlignmentFlag.AlignCenter
             return Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft
 
-        if role == Qt.ItemDataRole.FontRole:
-            if ap.in_use:
-                f = QFont()
-                f.setBold(True)
-                return f
-            if col == COL_SSID:
-                f = QFont()
-                f.setWeight(QFont.Weight.Medium)
-                return f
-
         if role == Qt.ItemDataRole.UserRole:
             return ap
 
+        if role == SORT_ROLE:
+            if col in _NUMERIC_COLS:
+                return self.sort_key(index.row(), col)
+            return None
+
         return None
 
+    def sort_key(self, row: int, col: int) -> Optional[float]:
+        """Numeric sort key of a cell, parsed once per column per update."""
+        keys = self._sort_keys.get(col)
+        if keys is None:
+            if col == COL_SIG:
+                keys = [ap.signal for ap in self._aps]
+            elif col == COL_DBM:
+                keys = list(self._dbm)
+            else:
+                keys = [self._sort_value(ap, col) for ap in self._aps]
+            self._sort_keys[col] = keys
+        return keys[row]
+
+    def _sort_value(self, ap: AccessPoint, col: int) -> Optional[float]:
+        """Numeric value behind a cell, read from the AP rather than its text.
+
+        Mirrors what parsing _display() would give; columns without a direct
+        field fall back to parsing the display string.
+        """
+        if col == COL_CHAN:
+            return float(ap.channel) if ap.channel else None
+        if col == COL_FREQ:
+            return float(ap.freq_mhz)
+        if col == COL_BW:
+            return float(ap.bandwidth_mhz)
+        if col == COL_RATE:
+            return float(int(ap.rate_mbps))
+        if col == COL_UTIL:
+            return float(ap.chan_util_pct or 0)
+        if col == COL_CLIENTS:
+            return float(ap.station_count or 0)
+        if col == COL_CISCO_PWR:
+            pwr = (
+                ap.cisco_tx_power_dbm
+                if ap.cisco_tx_power_dbm is not None
+                else ap.ruckus_tx_power_dbm
+                if ap.ruckus_tx_power_dbm is not None
+                else ap.tpc_tx_power_dbm
+            )
+            return round(float(pwr), 1) if pwr is not None else 0.0
+        text = self._display(ap, col) or "0"
+        try:
+            return float(text.encode().translate(None, _NON_NUMERIC))
+        except ValueError:
+            return None
+
     def _display(self, ap: AccessPoint, col: int) -> str:
         if col == COL_INUSE:
             return "▲" if ap.in_use else ""
@@ -205,10 +348,43 @@ class APTableModel(QAbstractTableModel):
             return self._aps[row]
         return None
 
+    def aps(self) -> List[AccessPoint]:
+        """All rows in source order (the model's own list — do not mutate)."""
+        return self._aps
+
     def ssid_colors(self) -> Dict[str, QColor]:
         return self._ssid_colors
 
 
+class APRowDelegate(QStyledItemDelegate):
+    """Applies the AP table's row fonts (bold connected row, medium SSID).
+
+    Done here instead of via FontRole so the view does not fetch a font
+    variant per cell; the fonts and their metrics are built once.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._font_bold = QFont()
+        self._font_bold.setBold(True)
+        self._font_medium = QFont()
+        self._font_medium.setWeight(QFont.Weight.Medium)
+        self._fm_bold = QFontMetrics(self._font_bold)
+        self._fm_medium = QFontMetrics(self._font_medium)
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        ap = index.data(Qt.ItemDataRole.UserRole)
+        if ap is None:
+            return
+        if ap.in_use:
+            option.font = self._font_bold
+            option.fontMetrics = self._fm_bold
+        elif index.column() == COL_SSID:
+            option.font = self._font_medium
+            option.fontMetrics = self._fm_medium
+
+
 class APFilterProxy(QSortFilterProxyModel):
     def __init__(self):
         super().__init__()
@@ -224,7 +400,43 @@ class APFilterProxy(QSortFilterProxyModel):
         # Known-SSID filter
         self._known_ssids: frozenset = frozenset()     # current snapshot from store
         self._known_filter: str = "off"                # "off" | "only" | "hide"
-        self.setSortRole(Qt.ItemDataRole.UserRole + 1)
+        # Last filterAcceptsRow verdict per BSSID.  Qt re-filters every row on
+        # invalidateFilter() and each inserted/changed row as it arrives, so
+        # this always covers the current source rows; rows leaving the model
+        # drop their entry, so BSSIDs gone from the scan do not pile up.
+        self._accepted: Dict[str, bool] = {}
+        self.setSortRole(SORT_ROLE)
+
+    def setSourceModel(self, model):
+        old = self.sourceModel()
+        if old is not None:
+            old.rowsAboutToBeRemoved.disconnect(self._forget_rows)
+            old.modelAboutToBeReset.disconnect(self._forget_all)
+        self._forget_all()
+        super().setSourceModel(model)  # may re-filter rows right away
+        if model is not None:
+            model.rowsAboutToBeRemoved.connect(self._forget_rows)
+            model.modelAboutToBeReset.connect(self._forget_all)
+
+    def _forget_all(self) -> None:
+        self._accepted.clear()
+
+    def _forget_rows(self, parent: QModelIndex, first: int, last: int) -> None:
+        """Drop verdicts for BSSIDs leaving the model, so the map stays bounded."""
+        src = self.sourceModel()
+        for row in range(first, last + 1):
+            ap = src.ap_at(row)
+            if ap is not None:
+                self._accepted.pop(ap.bssid, None)
+
+    def invalidateFilter(self):
+        self._forget_all()
+        super().invalidateFilter()
+
+    def visible_aps(self) -> List[AccessPoint]:
+        """APs that pass the filter, in source order, without index mapping."""
+        accepted = self._accepted
+        return [ap for ap in self.sourceModel().aps() if accepted.get(ap.bssid)]
 
     # ── Band / text ─────────────────────────────────────────────────────
     def set_band(self, band: str):
@@ -349,14 +561,15 @@ class APFilterProxy(QSortFilterProxyModel):
         ap: AccessPoint = src.ap_at(src_row)
         if ap is None:
             return False
+        ok = self._accepts(src, src_row, ap)
+        self._accepted[ap.bssid] = ok
+        return ok
+
+    def _accepts(self, src: APTableModel, src_row: int, ap: AccessPoint) -> bool:
         if self._band_filter != "All" and ap.band != self._band_filter:
             return False
-        if self._text_filter:
-            haystack = (
-                f"{ap.display_ssid} {ap.bssid} {ap.manufacturer} {ap.band}".lower()
-            )
-            if self._text_filter not in haystack:
-                return False
+        if self._text_filter and self._text_filter not in ap.search_key:
+            return False
         # AP-group filters (checked before column filters for short-circuit speed)
         if self._ap_group_include is not None or self._ap_group_excludes:
             gk = ap_group_key(ap.bssid)
@@ -371,40 +584,43 @@ class APFilterProxy(QSortFilterProxyModel):
                 return False
             if self._known_filter == "hide" and is_known:
                 return False
+        if not (self._includes or self._excludes):
+            return True
+        # Display strings fetched once per column, even when a column has
+        # both include and exclude values
+        cells: Dict[int, str] = {}
+
+        def cell(col: int) -> str:
+            text = cells.get(col)
+            if text is None:
+                text = cells[col] = (
+                    src.data(src.index(src_row, col), Qt.ItemDataRole.DisplayRole)
+                    or ""
+                )
+            return text
+
+        # Column excludes first (usually the narrower check): must not match
+        for col, vals in self._excludes.items():
+            if cell(col) in vals:
+                return False
         # Column includes: each constrained column must match one of its values
         for col, vals in self._includes.items():
-            cell = src.data(src.index(src_row, col), Qt.ItemDataRole.DisplayRole) or ""
-            if cell not in vals:
-                return False
-        # Column excludes: must not match any excluded value
-        for col, vals in self._excludes.items():
-            cell = src.data(src.index(src_row, col), Qt.ItemDataRole.DisplayRole) or ""
-            if cell in vals:
+            if cell(col) not in vals:
                 return False
         return True
 
     def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
         col = left.column()
-        numeric = {
-            COL_CHAN,
-            COL_FREQ,
-            COL_BW,
-            COL_SIG,
-            COL_DBM,
-            COL_RATE,
-            COL_UTIL,
-            COL_CLIENTS,
-            COL_CISCO_PWR,
-        }
-        lv = self.sourceModel().data(left, Qt.ItemDataRole.DisplayRole)
-        rv = self.sourceModel().data(right, Qt.ItemDataRole.DisplayRole)
-        if col in numeric:
-            try:
-                return float(re.sub(r"[^\d.\-]", "", lv or "0")) < float(
-                    re.sub(r"[^\d.\-]", "", rv or "0")
-                )
-            except Exception:
-                pass
+        src = self.sourceModel()
+        if col in _NUMERIC_COLS:
+            # Cached per-row keys: each cell is parsed once per update rather
+            # than on every one of the O(N log N) comparisons
+            lk = src.sort_key(left.row(), col)
+            rk = src.sort_key(right.row(), col)
+            if lk is not None and rk is not None:
+                return lk < rk
+        lv = src.data(left, Qt.ItemDataRole.DisplayRole)
+        rv = src.data(right, Qt.ItemDataRole.DisplayRole)
         return str(lv or "") < str(rv or "")
 
 
@@ -10,32 +10,47 @@ from .core_base import *
 # OUI / Manufacturer Lookup
 # ─────────────────────────────────────────────────────────────────────────────
 
-_oui_full: Optional[Dict[str, str]] = None
+_oui_full: Optional[Mapping[str, str]] = None
 _oui_loaded = False
+# MA-M (/28) and MA-S (/36) assignments keyed by 7 / 9 leading hex digits
+_oui_long: Mapping[str, str] = {}
 _oui_suffix_unique_vendor: Optional[Dict[str, str]] = None
 _vendor_urls: Optional[Dict[str, str]] = None
 _vendor_urls_norm: Optional[Dict[str, str]] = None
-_vendor_urls_tokens: Optional[Dict[str, set[str]]] = None
+_vendor_urls_tokens: Optional[Dict[str, frozenset[str]]] = None
+_vendor_token_index: Optional[Dict[str, List[str]]] = None  # token → vendor names
+_vendor_name_order: Optional[Dict[str, int]] = None  # vendor name → load order
 _vendor_urls_loaded = False
 _vendor_icon_cache: Dict[str, Optional[QIcon]] = {}
 _vendor_icon_placeholder: Optional[QIcon] = None
+_vendor_decoration_cache: Dict[str, QIcon] = {}  # vendor → icon or placeholder
+_vendor_canvas_pool: Dict[Tuple[int, int], QImage] = {}  # (px_w, px_h) → scratch
 VENDOR_ICON_MAX_W = 42
 VENDOR_ICON_MAX_H = 16
 
 # Path where we save the downloaded IEEE OUI database
 OUI_DATA_DIR = Path.home() / ".local" / "share" / "wavescope"
 OUI_JSON_PATH = OUI_DATA_DIR / "oui.json"
+# Merged, precedence-resolved index of all OUI sources; rebuilt when any changes
+OUI_INDEX_PATH = OUI_DATA_DIR / "oui-index.sqlite"
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent
 OUI_VENDOR_FALLBACK_JSON_PATH = _PROJECT_ROOT / "assets" / "vendors.json"
 VENDOR_URLS_JSON_PATH = _PROJECT_ROOT / "assets" / "vendor_urls.json"
 VENDOR_ICONS_DIR = _PROJECT_ROOT / "assets" / "vendor-icons"
 VENDOR_ICON_EXTS = (".png", ".ico", ".svg", ".jpg", ".jpeg", ".webp", ".gif", ".bmp")
+# Pre-rendered vendor icons, keyed by source file + render parameters
+VENDOR_ICON_CACHE_DIR = OUI_DATA_DIR / "icon-cache"
 OUI_IEEE_URL = "https://standards-oui.ieee.org/"
-OUI_IEEE_RE = re.compile(r"([0-9A-F]{2}-[0-9A-F]{2}-[0-9A-F]{2})\s+\(hex\)\s+(.+?)\n")
+OUI_IEEE_RE = re.compile(r"\s*([0-9A-F]{2}-[0-9A-F]{2}-[0-9A-F]{2})\s+\(hex\)\s+(.+)")
 
 
+_VENDOR_NORM_RE = re.compile(r"[^a-z0-9]+")
+_VENDOR_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+@lru_cache(maxsize=2048)
 def _norm_vendor_name(vendor: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "", (vendor or "").lower())
+    return _VENDOR_NORM_RE.sub("", (vendor or "").lower())
 
 
 _MANUF_DISPLAY_SUFFIXES = {
@@ -47,32 +62,38 @@ _MANUF_DISPLAY_SUFFIXES = {
 }
 
 
-def format_manufacturer_display(vendor: str) -> str:
-    """Display-only manufacturer cleanup; never modifies DB values."""
+_MANUF_WORD_RE = re.compile(
+    r"^([^A-Za-z0-9]*)([A-Za-z0-9][A-Za-z0-9'&\-/\.]*)([^A-Za-z0-9]*)$"
+)
+_MANUF_DIGIT_RE = re.compile(r"\d")
+_MANUF_UPPER_RE = re.compile(r"[A-Z]")
 
-    def _prettify_word(word: str) -> str:
-        m = re.match(
-            r"^([^A-Za-z0-9]*)([A-Za-z0-9][A-Za-z0-9'&\-/\.]*)([^A-Za-z0-9]*)$", word
-        )
-        if not m:
-            return word
-        prefix, core, suffix = m.groups()
-        if len(core) <= 4:
-            return word
-        if core != core.upper():
-            return word
-        if re.search(r"\d", core):
-            return word
-        if not re.search(r"[A-Z]", core):
-            return word
-        return f"{prefix}{core.capitalize()}{suffix}"
 
+def _prettify_manuf_word(word: str) -> str:
+    m = _MANUF_WORD_RE.match(word)
+    if not m:
+        return word
+    prefix, core, suffix = m.groups()
+    if len(core) <= 4:
+        return word
+    if core != core.upper():
+        return word
+    if _MANUF_DIGIT_RE.search(core):
+        return word
+    if not _MANUF_UPPER_RE.search(core):
+        return word
+    return f"{prefix}{core.capitalize()}{suffix}"
+
+
+@lru_cache(maxsize=1024)
+def format_manufacturer_display(vendor: str) -> str:
+    """Display-only manufacturer cleanup; never modifies DB values."""
     text = (vendor or "").strip()
     if not text:
         return ""
     parts = [p for p in text.split() if p]
     while parts:
-        tail = re.sub(r"[\.,]+$", "", parts[-1]).lower()
+        tail = parts[-1].rstrip(".,").lower()
         if tail in _MANUF_DISPLAY_SUFFIXES:
             parts.pop()
             continue
@@ -80,43 +101,50 @@ def format_manufacturer_display(vendor: str) -> str:
     cleaned = " ".join(parts).strip(" ,")
     if not cleaned:
         return text
-    return " ".join(_prettify_word(w) for w in cleaned.split())
-
-
-_VENDOR_NOISE_TOKENS = {
-    "inc",
-    "corp",
-    "corporation",
-    "company",
-    "co",
-    "co.",
-    "ltd",
-    "ltd.",
-    "limited",
-    "llc",
-    "gmbh",
-    "srl",
-    "spa",
-    "s.p.a",
-    "s.a",
-    "ag",
-    "nv",
-    "plc",
-    "group",
-    "systems",
-    "technology",
-    "technologies",
-    "electronics",
-    "communication",
-    "communications",
-    "network",
-    "networks",
-}
-
-
-def _vendor_tokens(vendor: str) -> set[str]:
-    tokens = set(re.findall(r"[a-z0-9]+", (vendor or "").lower()))
-    return {t for t in tokens if t and t not in _VENDOR_NOISE_TOKENS and len(t) > 1}
+    return " ".join(_prettify_manuf_word(w) for w in cleaned.split())
+
+
+_VENDOR_NOISE_TOKENS = frozenset(
+    {
+        "inc",
+        "corp",
+        "corporation",
+        "company",
+        "co",
+        "co.",
+        "ltd",
+        "ltd.",
+        "limited",
+        "llc",
+        "gmbh",
+        "srl",
+        "spa",
+        "s.p.a",
+        "s.a",
+        "ag",
+        "nv",
+        "plc",
+        "group",
+        "systems",
+        "technology",
+        "technologies",
+        "electronics",
+        "communication",
+        "communications",
+        "network",
+        "networks",
+    }
+)
+
+
+@lru_cache(maxsize=2048)
+def _vendor_tokens(vendor: str) -> frozenset[str]:
+    noise = _VENDOR_NOISE_TOKENS
+    return frozenset(
+        t
+        for t in _VENDOR_TOKEN_RE.findall((vendor or "").lower())
+        if len(t) > 1 and t not in noise
+    )
 
 
 def _norm_domain(domain: str) -> str:
@@ -128,14 +156,25 @@ def _norm_domain(domain: str) -> str:
     return d.rstrip("/")
 
 
+_OUI_KEY_TRANS = str.maketrans("-abcdef", ":ABCDEF")
+
+
+def _load_oui_json(path: Path) -> Dict[str, str]:
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def _load_downloaded_oui() -> Dict[str, str]:
     """Load our locally saved IEEE JSON.  Returns {} if not present."""
     if not OUI_JSON_PATH.exists():
         return {}
     try:
-        raw: Dict[str, str] = json.loads(OUI_JSON_PATH.read_text(encoding="utf-8"))
+        raw: Dict[str, str] = _load_oui_json(OUI_JSON_PATH)
         # Normalise keys to AA:BB:CC form (may be stored as AA-BB-CC)
-        return {k.replace("-", ":").upper(): v for k, v in raw.items()}
+        trans = _OUI_KEY_TRANS
+        return {k.translate(trans): v for k, v in raw.items()}
     except Exception:
         return {}
 
@@ -145,31 +184,234 @@ def _load_embedded_oui() -> Dict[str, str]:
     if not OUI_VENDOR_FALLBACK_JSON_PATH.exists():
         return {}
     try:
-        raw: Dict[str, str] = json.loads(
-            OUI_VENDOR_FALLBACK_JSON_PATH.read_text(encoding="utf-8")
-        )
-        return {k.replace("-", ":").upper(): v for k, v in raw.items() if v}
+        raw: Dict[str, str] = _load_oui_json(OUI_VENDOR_FALLBACK_JSON_PATH)
+        trans = _OUI_KEY_TRANS
+        return {k.translate(trans): v for k, v in raw.items() if v}
     except Exception:
         return {}
 
 
-def _load_oui_with_precedence() -> Dict[str, str]:
-    """Merge OUI DBs with precedence: embedded > downloaded > system."""
-    merged: Dict[str, str] = {}
-    merged.update(_load_system_oui())
-    merged.update(_load_downloaded_oui())
-    merged.update(_load_embedded_oui())
-    return merged
+def _pack_oui(prefix: str) -> Optional[int]:
+    """Pack an 'AA:BB:CC' prefix into a 24-bit int, or None if malformed."""
+    if len(prefix) != 8 or prefix[2] != ":" or prefix[5] != ":":
+        return None
+    try:
+        return int(prefix[0:2] + prefix[3:5] + prefix[6:8], 16)
+    except ValueError:
+        return None
+
 
+class _PackedOuiTable(Mapping[str, str]):
+    """Read-only OUI map stored as sorted packed keys plus a vendor list.
 
-def _build_unique_oui_suffix_vendor_index(oui_db: Dict[str, str]) -> Dict[str, str]:
+    Much smaller than a dict of ~35k short strings for the lifetime of the
+    app; lookups are a bisect over a compact ``array('I')``.
+    """
+
+    __slots__ = ("_keys", "_vals")
+
+    def __init__(self, src: Mapping[str, str]):
+        packed: Dict[int, str] = {}
+        for prefix, vendor in src.items():
+            k = _pack_oui(prefix)
+            if k is not None:
+                # Vendor names repeat heavily; share one string per name.
+                packed[k] = sys.intern(vendor)
+        order = sorted(packed)
+        self._keys = array.array("I", order)
+        self._vals = [packed[k] for k in order]
+
+    def __getitem__(self, prefix: str) -> str:
+        k = _pack_oui(prefix)
+        if k is not None:
+            i = bisect.bisect_left(self._keys, k)
+            if i < len(self._keys) and self._keys[i] == k:
+                return self._vals[i]
+        raise KeyError(prefix)
+
+    def __iter__(self):
+        for k in self._keys:
+            yield f"{k >> 16:02X}:{(k >> 8) & 0xFF:02X}:{k & 0xFF:02X}"
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class _SqliteOuiTable(Mapping[str, str]):
+    """Read-only view of one prefix length in the on-disk OUI index.
+
+    Lookups are an indexed SELECT against a memory-mapped database, so only
+    the pages for prefixes actually seen are ever read in.
+    """
+
+    __slots__ = ("_conn", "_lock", "_bits", "_len")
+
+    def __init__(self, conn: sqlite3.Connection, lock: threading.Lock, bits: int):
+        self._conn = conn
+        self._lock = lock
+        self._bits = bits
+        with lock:
+            self._len = conn.execute(
+                "SELECT COUNT(*) FROM oui WHERE bits = ?", (bits,)
+            ).fetchone()[0]
+
+    def __getitem__(self, prefix: str) -> str:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT vendor FROM oui WHERE prefix = ? AND bits = ?",
+                    (prefix, self._bits),
+                ).fetchone()
+        except sqlite3.ProgrammingError:
+            row = None  # closed by reload_oui_db() under a lookup in flight
+        if row is None:
+            raise KeyError(prefix)
+        return row[0]
+
+    def __iter__(self):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT prefix FROM oui WHERE bits = ? ORDER BY prefix", (self._bits,)
+            ).fetchall()
+        return (r[0] for r in rows)
+
+    def items(self) -> "_SqliteOuiItems":
+        return _SqliteOuiItems(self)
+
+    def rows(self) -> List[Tuple[str, str]]:
+        """Every (prefix, vendor) pair, fetched in one query."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT prefix, vendor FROM oui WHERE bits = ?", (self._bits,)
+            ).fetchall()
+
+    def __len__(self) -> int:
+        return self._len
+
+    def close(self) -> None:
+        """Close the shared connection (both prefix-length views use it)."""
+        with self._lock:
+            self._conn.close()
+
+
+class _SqliteOuiItems(ItemsView[str, str]):
+    """items() view that iterates one query instead of a SELECT per key."""
+
+    def __iter__(self):
+        return iter(self._mapping.rows())
+
+
+_OUI_INDEX_SCHEMA = 1
+
+
+def _oui_sources_signature() -> str:
+    """Identify the current OUI inputs (path, mtime, size) for the index."""
+    paths = [OUI_VENDOR_FALLBACK_JSON_PATH, OUI_JSON_PATH, *_SYSTEM_OUI_PATHS]
+    sig = [_OUI_INDEX_SCHEMA]
+    for p in paths:
+        try:
+            st = os.stat(p)
+            sig.append([str(p), st.st_mtime_ns, st.st_size])
+        except OSError:
+            pass
+    return json.dumps(sig)
+
+
+def _open_oui_index(signature: str) -> Optional[Tuple[Mapping[str, str], Mapping[str, str]]]:
+    """Open the on-disk index if it was built from the current sources."""
+    if not OUI_INDEX_PATH.exists():
+        return None
+    try:
+        conn = sqlite3.connect(
+            OUI_INDEX_PATH.as_uri() + "?mode=ro", uri=True, check_same_thread=False
+        )
+    except Exception:
+        return None
+    tables = None
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'sources'").fetchone()
+        if row is None or row[0] != signature:
+            return None
+        conn.execute("PRAGMA mmap_size = 16777216")
+        lock = threading.Lock()
+        tables = _SqliteOuiTable(conn, lock, 24), _SqliteOuiTable(conn, lock, 0)
+        return tables
+    except Exception:
+        return None
+    finally:
+        # A stale or unreadable index must not keep the file open while
+        # _write_oui_index replaces it
+        if tables is None:
+            conn.close()
+
+
+def _write_oui_index(
+    oui24: Mapping[str, str], oui_long: Mapping[str, str], signature: str
+) -> None:
+    """Persist the merged tables; written to a temp file and swapped in."""
+    try:
+        OUI_DATA_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=OUI_DATA_DIR, suffix=".sqlite")
+        os.close(fd)
+        try:
+            conn = sqlite3.connect(tmp)
+            with conn:
+                conn.execute(
+                    "CREATE TABLE oui (prefix TEXT PRIMARY KEY, bits INTEGER,"
+                    " vendor TEXT) WITHOUT ROWID"
+                )
+                conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+                conn.executemany(
+                    "INSERT INTO oui VALUES (?, 24, ?)", oui24.items()
+                )
+                # /28 and /36 keys are bare hex digits, so they never collide
+                # with the colon-separated /24 keys; bits=0 marks them.
+                conn.executemany(
+                    "INSERT OR REPLACE INTO oui VALUES (?, 0, ?)", oui_long.items()
+                )
+                conn.execute(
+                    "INSERT INTO meta VALUES ('sources', ?)", (signature,)
+                )
+            conn.close()
+            os.replace(tmp, OUI_INDEX_PATH)
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+    except Exception:
+        pass
+
+
+def _load_oui_with_precedence() -> Tuple[Mapping[str, str], Mapping[str, str]]:
+    """Merge OUI DBs with precedence: embedded > downloaded > system.
+
+    Served from the on-disk sqlite index when it matches the current source
+    files, which skips parsing ~35k JSON/text entries at startup.  Otherwise
+    the ChainMap resolves precedence without building an intermediate merged
+    dict, the result is packed into a compact read-only table, and the index
+    is rewritten for the next start.  Also returns the longer MA-M / MA-S
+    prefixes, which only the system files carry.
+    """
+    signature = _oui_sources_signature()
+    indexed = _open_oui_index(signature)
+    if indexed is not None:
+        return indexed
+    system, system_long = _load_system_oui()
+    merged = _PackedOuiTable(
+        ChainMap(_load_embedded_oui(), _load_downloaded_oui(), system)
+    )
+    _write_oui_index(merged, system_long, signature)
+    return merged, system_long
+
+
+def _build_unique_oui_suffix_vendor_index(oui_db: Mapping[str, str]) -> Dict[str, str]:
     """Build a conservative BB:CC -> vendor map from globally-administered OUIs.
 
     We only keep suffixes that map to exactly one globally-administered OUI
     prefix, to avoid broad false positives.
     """
-    buckets: Dict[str, List[str]] = {}
-    for prefix, vendor in (oui_db or {}).items():
+    # suffix → vendor while exactly one prefix maps to it, "" once ambiguous
+    seen: Dict[str, str] = {}
+    for prefix, vendor in oui_db.items():
         if not prefix or len(prefix) < 8 or not vendor:
             continue
         try:
@@ -179,17 +421,8 @@ def _build_unique_oui_suffix_vendor_index(oui_db: Dict[str, str]) -> Dict[str, s
         if first_octet & 0x02:
             continue
         suffix = prefix[3:8]
-        buckets.setdefault(suffix, []).append(prefix)
-
-    resolved: Dict[str, str] = {}
-    for suffix, prefixes in buckets.items():
-        if len(prefixes) != 1:
-            continue
-        only_prefix = prefixes[0]
-        vendor = (oui_db or {}).get(only_prefix, "")
-        if vendor:
-            resolved[suffix] = vendor
-    return resolved
+        seen[suffix] = "" if suffix in seen else vendor
+    return {suffix: vendor for suffix, vendor in seen.items() if vendor}
 
 
 def _load_vendor_urls() -> Dict[str, str]:
@@ -206,19 +439,27 @@ def _load_vendor_urls() -> Dict[str, str]:
 
 def _ensure_vendor_urls_loaded() -> None:
     global _vendor_urls, _vendor_urls_norm, _vendor_urls_tokens, _vendor_urls_loaded
+    global _vendor_token_index, _vendor_name_order
     if _vendor_urls_loaded:
         return
     _vendor_urls = _load_vendor_urls()
     _vendor_urls_norm = {}
     _vendor_urls_tokens = {}
+    _vendor_token_index = defaultdict(list)
+    _vendor_name_order = {}
     for name, domain in (_vendor_urls or {}).items():
         key = _norm_vendor_name(name)
         if key and key not in _vendor_urls_norm:
             _vendor_urls_norm[key] = domain
-        _vendor_urls_tokens[name] = _vendor_tokens(name)
+        tokens = _vendor_tokens(name)
+        _vendor_urls_tokens[name] = tokens
+        _vendor_name_order[name] = len(_vendor_name_order)
+        for t in tokens:
+            _vendor_token_index[t].append(name)
     _vendor_urls_loaded = True
 
 
+@lru_cache(maxsize=2048)
 def _resolve_vendor_domain(vendor_name: str) -> str:
     _ensure_vendor_urls_loaded()
     if not vendor_name:
@@ -254,12 +495,16 @@ def _resolve_vendor_domain(vendor_name: str) -> str:
     if not query_tokens or not _vendor_urls_tokens or not _vendor_urls:
         return ""
 
+    # Only vendors sharing at least one token can score; visit them in load
+    # order so ties resolve exactly as a full scan would.
+    candidates = set()
+    for t in query_tokens:
+        candidates.update(_vendor_token_index.get(t, ()))
     best_name = ""
     best_score = 0.0
     best_overlap = 0
-    for name, tokens in _vendor_urls_tokens.items():
-        if not tokens:
-            continue
+    for name in sorted(candidates, key=_vendor_name_order.__getitem__):
+        tokens = _vendor_urls_tokens[name]
         overlap = len(query_tokens & tokens)
         if overlap == 0:
             continue
@@ -296,7 +541,74 @@ def _resolve_vendor_icon_path(vendor_name: str) -> Optional[Path]:
     return None
 
 
+def _alpha_bbox(img: QImage) -> Optional[Tuple[int, int, int, int]]:
+    """Return (x, y, w, h) of the non-transparent area of an ARGB32 image.
+
+    Works for both straight and premultiplied ARGB32 since only alpha is read.
+
+    Reads the pixel buffer directly through NumPy instead of calling
+    pixelColor() per pixel.  Returns None for fully transparent images.
+    """
+    w, h = img.width(), img.height()
+    if w <= 0 or h <= 0:
+        return None
+    ptr = img.constBits()
+    ptr.setsize(img.sizeInBytes())
+    # ARGB32 pixels are native-endian uint32 values, so alpha is the top byte
+    # regardless of host byte order.  Rows may be padded to bytesPerLine().
+    pixels = np.frombuffer(ptr, dtype=np.uint32).reshape(h, img.bytesPerLine() // 4)
+    pixels = pixels[:, :w]
+    # Fast path: tightly-cropped assets (most PNGs) have opaque pixels on all
+    # four edges, so only the border needs to be inspected.
+    if (
+        (pixels[0] >> 24).any()
+        and (pixels[-1] >> 24).any()
+        and (pixels[:, 0] >> 24).any()
+        and (pixels[:, -1] >> 24).any()
+    ):
+        return 0, 0, w, h
+    opaque = (pixels >> 24) > 0
+    rows = np.flatnonzero(opaque.any(axis=1))
+    if rows.size == 0:
+        return None
+    cols = np.flatnonzero(opaque.any(axis=0))
+    min_y, max_y = int(rows[0]), int(rows[-1])
+    min_x, max_x = int(cols[0]), int(cols[-1])
+    return min_x, min_y, max_x - min_x + 1, max_y - min_y + 1
+
+
+def _vendor_icon_cache_path(path: Path, dpr: float) -> Optional[Path]:
+    """Disk-cache location for the rendered icon of *path* at *dpr*.
+
+    The key includes the source mtime so updated assets invalidate
+    themselves.  Returns None if the source file cannot be stat'ed.
+    """
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    key = f"{path}|{mtime_ns}|{dpr:g}|{VENDOR_ICON_MAX_W}|{VENDOR_ICON_MAX_H}"
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return VENDOR_ICON_CACHE_DIR / f"{digest}.png"
+
+
+_ARGB32_FORMATS = (
+    QImage.Format.Format_ARGB32,
+    QImage.Format.Format_ARGB32_Premultiplied,
+)
+
+
 def _build_vendor_icon(path: Path) -> Optional[QIcon]:
+    app = QApplication.instance()
+    dpr = float(app.devicePixelRatio() if app is not None else 1.0)
+
+    cache_path = _vendor_icon_cache_path(path, dpr)
+    if cache_path is not None and cache_path.exists():
+        cached = QPixmap(str(cache_path))
+        if not cached.isNull():
+            cached.setDevicePixelRatio(dpr)
+            return QIcon(cached)
+
     # Prefer QIcon pixmap selection first so containers like .ico can pick
     # the best embedded frame for our target size.
     target_w = VENDOR_ICON_MAX_W
@@ -310,28 +622,13 @@ def _build_vendor_icon(path: Path) -> Optional[QIcon]:
     if pixmap.isNull():
         return None
 
-    img = pixmap.toImage().convertToFormat(QImage.Format.Format_ARGB32)
-    min_x = img.width()
-    min_y = img.height()
-    max_x = -1
-    max_y = -1
-    for y in range(img.height()):
-        for x in range(img.width()):
-            if img.pixelColor(x, y).alpha() > 0:
-                if x < min_x:
-                    min_x = x
-                if y < min_y:
-                    min_y = y
-                if x > max_x:
-                    max_x = x
-                if y > max_y:
-                    max_y = y
-
-    if max_x >= min_x and max_y >= min_y:
-        img = img.copy(QRect(min_x, min_y, max_x - min_x + 1, max_y - min_y + 1))
+    img = pixmap.toImage()
+    if img.format() not in _ARGB32_FORMATS:
+        img = img.convertToFormat(QImage.Format.Format_ARGB32)
+    bbox = _alpha_bbox(img)
+    if bbox is not None and bbox != (0, 0, img.width(), img.height()):
+        img = img.copy(QRect(*bbox))
 
-    app = QApplication.instance()
-    dpr = float(app.devicePixelRatio() if app is not None else 1.0)
     px_w = max(1, int(round(target_w * dpr)))
     px_h = max(1, int(round(target_h * dpr)))
 
@@ -366,13 +663,29 @@ def _build_vendor_icon(path: Path) -> Optional[QIcon]:
             Qt.TransformationMode.FastTransformation,
         )
 
-    canvas_img = QImage(px_w, px_h, QImage.Format.Format_ARGB32)
-    canvas_img.fill(Qt.GlobalColor.transparent)
-    painter = QPainter(canvas_img)
-    x = (px_w - scaled_img.width()) // 2
-    y = (px_h - scaled_img.height()) // 2
-    painter.drawImage(x, y, scaled_img)
-    painter.end()
+    if scaled_img.width() == px_w and scaled_img.height() == px_h:
+        # Already fills the canvas exactly: no need to paint it onto another.
+        canvas_img = scaled_img
+    else:
+        # Scratch canvas reused across icons of the same size; QPixmap.fromImage
+        # below copies the pixels, so the next icon can safely overwrite it.
+        canvas_img = _vendor_canvas_pool.get((px_w, px_h))
+        if canvas_img is None:
+            canvas_img = QImage(px_w, px_h, QImage.Format.Format_ARGB32)
+            _vendor_canvas_pool[(px_w, px_h)] = canvas_img
+        canvas_img.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(canvas_img)
+        x = (px_w - scaled_img.width()) // 2
+        y = (px_h - scaled_img.height()) // 2
+        painter.drawImage(x, y, scaled_img)
+        painter.end()
+
+    if cache_path is not None:
+        try:
+            VENDOR_ICON_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            canvas_img.save(str(cache_path), "PNG")
+        except Exception:
+            pass
 
     canvas = QPixmap.fromImage(canvas_img)
     canvas.setDevicePixelRatio(dpr)
@@ -410,48 +723,86 @@ def get_vendor_icon(vendor_name: str) -> Optional[QIcon]:
     return None
 
 
-def _load_system_oui() -> Dict[str, str]:
-    """Fall back to wireshark/ieee-data system files if IEEE JSON not downloaded."""
-    candidates = [
-        "/usr/share/wireshark/manuf",
-        "/usr/share/ieee-data/oui.txt",
-        "/usr/share/misc/oui.txt",
-        "/usr/share/nmap/nmap-mac-prefixes",
-    ]
-    for path in candidates:
+def get_vendor_decoration(vendor_name: str) -> QIcon:
+    """Vendor icon for table cells, falling back to the blank placeholder.
+
+    Resolved once per vendor string, so a repaint costs a single dict hit.
+    Must run on the GUI thread (it may build pixmaps).
+    """
+    icon = _vendor_decoration_cache.get(vendor_name)
+    if icon is None:
+        icon = get_vendor_icon(vendor_name)
+        if icon is None:
+            icon = get_vendor_placeholder_icon()
+        _vendor_decoration_cache[vendor_name] = icon
+    return icon
+
+
+_SYSTEM_OUI_PATHS = (
+    "/usr/share/wireshark/manuf",
+    "/usr/share/ieee-data/oui.txt",
+    "/usr/share/misc/oui.txt",
+    "/usr/share/nmap/nmap-mac-prefixes",
+)
+
+# One tab-separated record per line: first field is the MAC prefix, the last
+# field is the vendor name.  Comment and continuation lines do not match.
+_SYSTEM_OUI_LINE_RE = re.compile(
+    rb"^[ \t]*([^#\s][^\t\r\n]*)\t(?:[^\r\n]*\t)?[ \t]*([^\t\r\n]*[^\s])[ \t\r]*$",
+    re.MULTILINE,
+)
+
+
+def _load_system_oui() -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Fall back to wireshark/ieee-data system files if IEEE JSON not downloaded.
+
+    Returns ({"AA:BB:CC": vendor}, {hex_prefix: vendor}); the second dict
+    holds /28 and /36 blocks (e.g. wireshark's "00:1B:C5:00:00:00/36")
+    keyed by their 7 or 9 leading hex digits.
+    """
+    for path in _SYSTEM_OUI_PATHS:
         if not os.path.exists(path):
             continue
         try:
             db: Dict[str, str] = {}
-            with open(path, "r", errors="ignore") as fh:
-                for line in fh:
-                    line = line.strip()
-                    if not line or line.startswith("#"):
-                        continue
-                    parts = line.split("\t")
-                    if len(parts) >= 2:
-                        mac_raw = parts[0].strip()
-                        vendor = (
-                            parts[-1].strip() if len(parts) > 2 else parts[1].strip()
-                        )
-                        mac = mac_raw.replace("-", ":").upper()
-                        if len(mac) >= 8:
-                            db[mac[:8]] = vendor
+            db_long: Dict[str, str] = {}
+            with open(path, "rb") as fh, mmap.mmap(
+                fh.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mm:
+                for m in _SYSTEM_OUI_LINE_RE.finditer(mm):
+                    mac = m.group(1).decode("utf-8", "ignore").strip()
+                    mac = mac.replace("-", ":").upper()
+                    vendor = m.group(2).decode("utf-8", "ignore").strip()
+                    mac, _, bits = mac.partition("/")
+                    if bits in ("28", "36"):
+                        hexd = mac.replace(":", "")
+                        db_long[hexd[: int(bits) // 4]] = vendor
+                    elif len(mac) >= 8:
+                        db[mac[:8]] = vendor
             if db:
-                return db
+                return db, db_long
         except Exception:
             pass
-    return {}
+    return {}, {}
 
 
 def reload_oui_db():
     """Force reload of the OUI database (call after a fresh download)."""
-    global _oui_full, _oui_loaded, _oui_suffix_unique_vendor, _vendor_urls_loaded
-    _oui_full = _load_oui_with_precedence()
+    global _oui_full, _oui_long, _oui_loaded, _oui_suffix_unique_vendor
+    global _vendor_urls_loaded
+    old_tables = (_oui_full, _oui_long)
+    _oui_full, _oui_long = _load_oui_with_precedence()
+    for table in old_tables:
+        if isinstance(table, _SqliteOuiTable):
+            table.close()
     _oui_loaded = True
     _oui_suffix_unique_vendor = None
     _vendor_urls_loaded = False
     _vendor_icon_cache.clear()
+    _vendor_decoration_cache.clear()
+    _manufacturer_for_prefix.cache_clear()
+    _manufacturer_for_long_prefix.cache_clear()
+    _resolve_vendor_domain.cache_clear()
 
 
 def ap_group_display_label(group_key: str, manufacturer: str) -> str:
@@ -479,16 +830,40 @@ def ap_group_display_label(group_key: str, manufacturer: str) -> str:
     return f"{first_word}:{parts[3]}:{parts[4]}:{first_nibble}#"
 
 
-def get_manufacturer(bssid: str) -> str:
-    global _oui_full, _oui_loaded, _oui_suffix_unique_vendor
+def _ensure_oui_loaded() -> None:
+    global _oui_full, _oui_long, _oui_loaded
     if not _oui_loaded:
-        _oui_full = _load_oui_with_precedence()
+        _oui_full, _oui_long = _load_oui_with_precedence()
         _oui_loaded = True
+
+
+def get_manufacturer(bssid: str) -> str:
     if not bssid:
         return ""
-    mac = bssid.upper().replace("-", ":")
-    prefix = mac[:8]
-    if _oui_full and prefix in _oui_full:
+    _ensure_oui_loaded()
+    # Longest match first: MA-S (/36) and MA-M (/28) blocks are sub-allocated
+    # from a /24 whose own entry is just the registration authority.
+    if _oui_long:
+        hexd = bssid.replace(":", "").replace("-", "").upper()
+        vendor = _manufacturer_for_long_prefix(hexd[:9])
+        if vendor:
+            return vendor
+    # The /24 result depends only on the OUI, so cache per prefix: every
+    # BSSID from the same vendor shares one entry.
+    return _manufacturer_for_prefix(bssid[:8].upper().replace("-", ":"))
+
+
+@lru_cache(maxsize=4096)
+def _manufacturer_for_long_prefix(hex9: str) -> str:
+    """MA-S (/36) or MA-M (/28) vendor for the first 9 hex digits, else ''."""
+    return _oui_long.get(hex9) or _oui_long.get(hex9[:7]) or ""
+
+
+@lru_cache(maxsize=4096)
+def _manufacturer_for_prefix(prefix: str) -> str:
+    global _oui_suffix_unique_vendor
+    _ensure_oui_loaded()
+    if _oui_full is not None and prefix in _oui_full:
         return _oui_full[prefix]
 
     # Some AP radios use locally administered BSSIDs (U/L bit set), which
@@ -499,7 +874,7 @@ def get_manufacturer(bssid: str) -> str:
         if first_octet & 0x02:
             ga_octet = first_octet & 0xFD
             ga_prefix = f"{ga_octet:02X}{prefix[2:]}"
-            if _oui_full and ga_prefix in _oui_full:
+            if _oui_full is not None and ga_prefix in _oui_full:
                 return _oui_full[ga_prefix]
 
             # Conservative fallback for locally-administered addresses where
@@ -509,7 +884,7 @@ def get_manufacturer(bssid: str) -> str:
             if not (first_octet & 0x01):
                 if _oui_suffix_unique_vendor is None:
                     _oui_suffix_unique_vendor = _build_unique_oui_suffix_vendor_index(
-                        _oui_full or {}
+                        _oui_full if _oui_full is not None else {}
                     )
                 suffix = prefix[3:8]
                 vendor = (_oui_suffix_unique_vendor or {}).get(suffix, "")
@@ -539,11 +914,18 @@ class OuiDownloadThread(QThread):
             )
             with urllib.request.urlopen(req, timeout=30) as resp:
                 self.progress.emit("Downloading OUI data (may take a few seconds)…")
-                raw = resp.read().decode("utf-8", errors="replace")
-
-            self.progress.emit("Parsing entries…")
-            matches = OUI_IEEE_RE.findall(raw)
-            db = {m[0].replace("-", ":"): m[1].strip() for m in matches}
+                # Parse line by line as the data streams in rather than
+                # buffering and decoding the whole ~4 MB file first.
+                db: Dict[str, str] = {}
+                match = OUI_IEEE_RE.match
+                for line in io.TextIOWrapper(
+                    resp, encoding="utf-8", errors="replace"
+                ):
+                    if "(hex)" not in line:
+                        continue
+                    m = match(line)
+                    if m:
+                        db[m.group(1).replace("-", ":")] = m.group(2).strip()
 
             if not db:
                 self.finished.emit(False, "No OUI entries found in downloaded data.")
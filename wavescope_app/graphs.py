@@ -4,6 +4,9 @@ Contains channel/history plot widgets, custom axis items,
 and the vector-drawn 5 GHz allocation dialog.
 """
 
+import pyqtgraph as pg
+from pyqtgraph import PlotWidget, mkPen, mkBrush
+
 from .core import *
 from .theme import (
     BAND_SUBBAND_HEADERS,
@@ -68,20 +71,68 @@ from .theme import (
 )
 
 
-def _channel_shape_unit(xs: np.ndarray, fc: float, bw: float) -> np.ndarray:
+def _channel_shape_unit(
+    xs: np.ndarray, fc, bw, out: Optional[np.ndarray] = None
+) -> np.ndarray:
     """
     Returns a 0..1 flat-top shape with cosine rolloff shoulders.
     Multiply by (amplitude - floor) and shift by floor for dBm display.
+
+    Clamping the rolloff phase to [0, 1] yields 1 on the flat top and 0
+    past the edges, so the whole shape is one in-place pass over *out*.
+    *fc* and *bw* may be scalars or arrays broadcastable against *xs*.
+    """
+    half = np.asarray(bw, dtype=float) / 2.0
+    shoulder = np.maximum(half * 0.12, 5.0)  # 12 % of half-BW, min 5 MHz
+    t = np.subtract(xs, fc, out=out)
+    np.abs(t, out=t)
+    t -= half - shoulder
+    t /= shoulder
+    np.clip(t, 0.0, 1.0, out=t)
+    t *= np.pi
+    np.cos(t, out=t)
+    t += 1.0
+    t *= 0.5
+    return t
+
+
+def _channel_shapes(
+    xs: np.ndarray, fcs: List[float], bws: List[float]
+) -> List[Tuple[slice, np.ndarray]]:
+    """Shapes for many APs in one vectorised pass over their support windows.
+
+    Each shape is zero outside fc ± bw/2, so only the grid samples strictly
+    inside those windows are evaluated: the windows are laid back to back
+    in one flat array and the kernel runs once for every AP.  Returns
+    (window, unit_act) per AP, where *window* slices the matching samples
+    out of *xs* and *unit_act* is a view into the flat result.
     """
-    half = bw / 2.0
-    shoulder = max(half * 0.12, 5.0)  # 12 % of half-BW, min 5 MHz
-    d = np.abs(xs - fc)
-    in_flat = d <= (half - shoulder)
-    in_roll = (~in_flat) & (d <= half)
-    t = np.where(in_roll, (d - (half - shoulder)) / shoulder, 0.0)
-    return np.where(
-        in_flat, 1.0, np.where(in_roll, 0.5 * (1.0 + np.cos(np.pi * t)), 0.0)
-    )
+    if not fcs:
+        return []
+    fc = np.asarray(fcs, dtype=float)
+    bw = np.asarray(bws, dtype=float)
+    lo = np.searchsorted(xs, fc - bw / 2.0, side="right")
+    hi = np.searchsorted(xs, fc + bw / 2.0, side="left")
+    lengths = np.maximum(hi - lo, 0)
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+    # Flat position j of window i maps to grid index lo[i] + (j - starts[i])
+    idx = np.arange(int(ends[-1])) - np.repeat(starts - lo, lengths)
+    x = xs[idx]
+    unit = _channel_shape_unit(x, np.repeat(fc, lengths), np.repeat(bw, lengths))
+    return [
+        (slice(first, first + e - s), unit[s:e])
+        for first, s, e in zip(lo.tolist(), starts.tolist(), ends.tolist())
+    ]
+
+
+@lru_cache(maxsize=None)
+def _bold_font(point_size: int) -> QFont:
+    """Shared bold label font; built lazily since QFont needs a QApplication."""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(True)
+    return font
 
 
 # ─── Color-coded dBm axis ────────────────────────────────────────────────────
@@ -96,12 +147,18 @@ class DbmAxisItem(pg.AxisItem):
     """
 
     _BANDS = [
-        (-50, 0, SIG_EXCELLENT),  # excellent — green
-        (-60, -50, SIG_GOOD),  # good      — lime
-        (-70, -60, SIG_FAIR),  # fair      — amber
-        (-80, -70, SIG_WEAK),  # weak      — orange
-        (-200, -80, SIG_POOR),  # poor      — red
+        (-50, 0, pg.mkPen(QColor(SIG_EXCELLENT))),  # excellent — green
+        (-60, -50, pg.mkPen(QColor(SIG_GOOD))),  # good      — lime
+        (-70, -60, pg.mkPen(QColor(SIG_FAIR))),  # fair      — amber
+        (-80, -70, pg.mkPen(QColor(SIG_WEAK))),  # weak      — orange
+        (-200, -80, pg.mkPen(QColor(SIG_POOR))),  # poor      — red
     ]
+    _FALLBACK_DARK = pg.mkPen(QColor(GRAPH_AXIS_DARK))
+    _FALLBACK_LIGHT = pg.mkPen(QColor(GRAPH_AXIS_LIGHT))
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._fallback_pen = self._FALLBACK_DARK
 
     def _dbm_color(self, text: str):
         try:
@@ -109,9 +166,13 @@ class DbmAxisItem(pg.AxisItem):
         except ValueError:
             pass
         else:
-            for lo, hi, hex_c in self._BANDS:
+            for lo, hi, pen in self._BANDS:
                 if lo <= v < hi:
-                    return pg.mkColor(hex_c)
+                    return pen
+        return self._fallback_pen
+
+    def drawPicture(self, p, axisSpec, tickSpecs, textSpecs):
+        # Palette lightness is constant for the whole paint pass
         is_dark = (
             QApplication.instance()
             .palette()
@@ -119,9 +180,7 @@ class DbmAxisItem(pg.AxisItem):
             .lightness()
             < 128
         )
-        return pg.mkColor(GRAPH_AXIS_DARK if is_dark else GRAPH_AXIS_LIGHT)
-
-    def drawPicture(self, p, axisSpec, tickSpecs, textSpecs):
+        self._fallback_pen = self._FALLBACK_DARK if is_dark else self._FALLBACK_LIGHT
         p.save()
         p.setRenderHint(p.RenderHint.Antialiasing, False)
         p.setRenderHint(p.RenderHint.TextAntialiasing, True)
@@ -139,19 +198,30 @@ class DbmAxisItem(pg.AxisItem):
         p.restore()
 
 
-_UNII_CHAN_COLORS = UNII_CHAN_COLORS
-_UNII_NAME_COLORS = UNII_NAME_COLORS
-_UNII6_CHAN_COLORS = UNII6_CHAN_COLORS
+def _pens_from_colors(colors: Dict) -> Dict:
+    """Map each key of a hex-colour table to a ready-made QPen."""
+    return {k: pg.mkPen(QColor(hex_c)) for k, hex_c in colors.items()}
+
+
+_UNII_CHAN_PENS = _pens_from_colors(UNII_CHAN_COLORS)
+_UNII_NAME_PENS = _pens_from_colors(UNII_NAME_COLORS)
+_UNII6_CHAN_PENS = _pens_from_colors(UNII6_CHAN_COLORS)
 _BAND_SUBBAND_HEADERS = BAND_SUBBAND_HEADERS
 
 
 class FiveGhzBottomAxisItem(pg.AxisItem):
     """X-axis for the 5 GHz panel — tick labels colour-coded by U-NII sub-band."""
 
-    _CHAN_COLORS = _UNII_CHAN_COLORS
+    _CHAN_PENS = _UNII_CHAN_PENS
     _DRAW_DFS_SEGMENT = True
     _DFS_FREQ_RANGE = (5260.0, 5720.0)  # ch52 .. ch144 centers
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Tick labels are a small closed set: key pens by the label text itself
+        self._text_to_pen: Dict[str, QPen] = dict(_UNII_NAME_PENS)
+        self._text_to_pen.update((str(ch), pen) for ch, pen in self._CHAN_PENS.items())
+
     def drawPicture(self, p, axisSpec, tickSpecs, textSpecs):
         p.save()
         p.setRenderHint(p.RenderHint.Antialiasing, False)
@@ -184,13 +254,7 @@ class FiveGhzBottomAxisItem(pg.AxisItem):
             p.setFont(self.style["tickFont"])
         default_pen = self.style.get("pen") or pg.mkPen(GRAPH_AXIS_DARK)
         for rect, flags, text in textSpecs:
-            clean_text = text.strip()
-            try:
-                ch = int(clean_text)
-                hex_c = self._CHAN_COLORS.get(ch)
-            except ValueError:
-                hex_c = _UNII_NAME_COLORS.get(clean_text)
-            p.setPen(pg.mkPen(hex_c) if hex_c else default_pen)
+            p.setPen(self._text_to_pen.get(text.strip(), default_pen))
             p.drawText(rect, int(flags), text)
         p.restore()
 
@@ -198,7 +262,7 @@ class FiveGhzBottomAxisItem(pg.AxisItem):
 class SixGhzBottomAxisItem(FiveGhzBottomAxisItem):
     """X-axis for the 6 GHz panel — tick labels colour-coded by U-NII sub-band."""
 
-    _CHAN_COLORS = _UNII6_CHAN_COLORS
+    _CHAN_PENS = _UNII6_CHAN_PENS
     _DRAW_DFS_SEGMENT = False
 
 
@@ -242,6 +306,13 @@ class ChannelGraphWidget(QWidget):
         "5 GHz": 5,
         "6 GHz": 8,  # wider: 1200 MHz span vs 840 for 5 GHz
     }
+    # band → ({freq: chan}, bottom-axis ticks); see _band_axis()
+    _band_axis_cache: Dict[
+        str, Tuple[Dict[float, int], List[Tuple[float, str]]]
+    ] = {}
+    # Shape sample grid: ~2 samples per device pixel of panel width
+    _XS_MIN_SAMPLES = 256
+    _XS_MAX_SAMPLES = 2000
     # Tick stride per band — subsample dense channel grids for readability
     _BAND_TICK_STRIDE: Dict[str, int] = {
         "2.4 GHz": 1,  # 14 channels → show all
@@ -287,18 +358,25 @@ class ChannelGraphWidget(QWidget):
         # band → PlotWidget (rebuilt whenever active band set changes)
         self._plots: Dict[str, PlotWidget] = {}
         self._active_bands: List[str] = []
-        # bssid → {color, zero, fill, curve, label}
+        # bssid → {color, text, pw, zero, fill, curve, label}; kept across
+        # redraws and updated in place (see _redraw)
         self._items: Dict[str, dict] = {}
+        # band → static overlay items (DFS strip, band name) on that panel
+        self._overlays: Dict[str, list] = {}
         self._aps: List[AccessPoint] = []
         self._ssid_colors: Dict[str, QColor] = {}
         self._band = "All"
         self._highlighted: Optional[str] = None
         self._theme_bg = GRAPH_BG_DARK
         self._theme_fg = GRAPH_FG_DARK
-        self._band_channels: Dict[str, Dict[float, int]] = {}  # band → {freq_mhz: chan}
+        # band → (sorted channel centre freqs, matching channel numbers)
+        self._band_channels: Dict[str, Tuple[np.ndarray, List[int]]] = {}
+        self._band_xs: Dict[str, np.ndarray] = {}  # band → sample grid
         self._view_ranges: Dict[
             str, Tuple[Tuple[float, float], Tuple[float, float]]
         ] = {}
+        # Everything a scan update feeds into _redraw, as of the last draw
+        self._last_signature: Optional[tuple] = None
 
     # ── Public API ────────────────────────────────────────────────────────
 
@@ -306,25 +384,50 @@ class ChannelGraphWidget(QWidget):
         self._theme_bg = bg
         self._theme_fg = fg
         for i, (band, pw) in enumerate(self._plots.items()):
+            for item in self._overlays.pop(band, []):
+                pw.removeItem(item)
             pw.setBackground(bg)
             if i == 0:
                 pw.setLabel("left", "Signal (dBm)", color=fg, size="10pt")
             for ax in ("left", "bottom"):
                 pw.getAxis(ax).setTextPen(fg)
                 pw.getAxis(ax).setPen(fg)
-        # Redraw so band-label TextItems inside the plot pick up the new fg
+        # Redraw so the band-label overlays are rebuilt with the new fg
         self._redraw()
 
-    def set_band(self, band: str):
+    def set_band(self, band: str, redraw: bool = True):
         self._band = band
-        self._redraw()
+        if redraw:
+            self._redraw()
 
     def set_ssid_colors(self, colors: Dict[str, QColor]):
         self._ssid_colors = colors
 
     def update_aps(self, aps: List[AccessPoint], colors: Dict[str, QColor]):
+        signature = (
+            self._band,
+            id(colors),
+            tuple(
+                (
+                    a.bssid,
+                    a.dbm,
+                    a.band,
+                    a.channel,
+                    a.freq_mhz,
+                    a.bandwidth_mhz,
+                    a.iw_center_freq,
+                    a.ssid,
+                    a.display_ssid,
+                )
+                for a in aps
+            ),
+        )
         self._aps = aps
         self._ssid_colors = colors
+        if signature == self._last_signature:
+            # Idle scan: same APs, same shapes — nothing to redraw
+            return
+        self._last_signature = signature
         self._redraw()
 
     def highlight_bssid(self, bssid: Optional[str]):
@@ -378,6 +481,9 @@ class ChannelGraphWidget(QWidget):
             pw.setParent(None)
             pw.deleteLater()
         self._plots.clear()
+        # Pooled items belonged to the deleted panels
+        self._items.clear()
+        self._overlays.clear()
 
         for i, band in enumerate(bands):
             pw = self._make_plot(band, i == 0)
@@ -390,9 +496,10 @@ class ChannelGraphWidget(QWidget):
 
     def _draw_band_overlays(
         self, band: str, pw: "PlotWidget", xmin: float, xmax: float
-    ):
-        """Band name label in the top-right corner."""
+    ) -> list:
+        """Band name label in the top-right corner.  Returns the added items."""
         floor = float(CHAN_DBM_FLOOR)
+        added: list = []
 
         # 5 GHz DFS highlight (ch52..144): draw directly on the plot floor so it
         # is visible in the canvas, not only in the axis widget area.
@@ -409,6 +516,7 @@ class ChannelGraphWidget(QWidget):
                 )
                 dfs_line.setZValue(20)
                 pw.addItem(dfs_line)
+                added.append(dfs_line)
 
                 # Small label to explain the highlighted DFS range.
                 dfs_lbl_color = QColor(dfs_color)
@@ -418,26 +526,29 @@ class ChannelGraphWidget(QWidget):
                     anchor=(0.5, 1.0),
                     color=dfs_lbl_color,
                 )
-                dfs_font = QFont()
-                dfs_font.setPointSize(7)
-                dfs_font.setBold(True)
-                dfs_lbl.setFont(dfs_font)
+                dfs_lbl.setFont(_bold_font(7))
                 dfs_lbl.setPos((dfs_lo + dfs_hi) / 2.0, floor + 0.1)
                 dfs_lbl.setZValue(21)
                 pw.addItem(dfs_lbl)
+                added.append(dfs_lbl)
 
         # -- band name label, just inside top-right corner --
         band_color = QColor(self._theme_fg)
         band_color.setAlpha(180)
         band_lbl = pg.TextItem(text=band, anchor=(1.0, 0.0), color=band_color)
-        bfont = QFont()
-        bfont.setPointSize(8)
-        bfont.setBold(True)
-        band_lbl.setFont(bfont)
+        band_lbl.setFont(_bold_font(8))
         # anchor (1.0, 0.0) pins top-right of text to this point → text hangs downward
         band_lbl.setPos(xmax, float(CHAN_DBM_CEIL) - 1.0)
         band_lbl.setZValue(5)
         pw.addItem(band_lbl)
+        added.append(band_lbl)
+        return added
+
+    @staticmethod
+    def _remove_ap_items(items: dict) -> None:
+        pw = items["pw"]
+        for key in ("fill", "zero", "curve", "label"):
+            pw.removeItem(items[key])
 
     def _on_label_click(self, bssid: str):
         self._highlighted = None if self._highlighted == bssid else bssid
@@ -476,31 +587,73 @@ class ChannelGraphWidget(QWidget):
             return
         view_pos = pw.plotItem.vb.mapSceneToView(pos)
         freq = view_pos.x()
-        channels = self._band_channels.get(band, {})
-        if not channels:
+        freqs, chans = self._band_channels.get(band, (None, None))
+        if not chans:
             return
-        nearest_f = min(channels, key=lambda f: abs(f - freq))
+        # Nearest centre is one of the two neighbours of the insertion point
+        idx = int(np.searchsorted(freqs, freq))
+        if idx == len(chans) or (idx > 0 and freq - freqs[idx - 1] <= freqs[idx] - freq):
+            idx -= 1
+        nearest_f = float(freqs[idx])
         if abs(nearest_f - freq) < 25:
             QToolTip.showText(
                 QCursor.pos(),
-                f"Channel {channels[nearest_f]}  ·  {int(nearest_f)} MHz",
+                f"Channel {chans[idx]}  ·  {int(nearest_f)} MHz",
                 pw,
             )
         else:
             QToolTip.hideText()
 
+    def _sample_count(self, pw: "PlotWidget") -> int:
+        """Shape samples for a panel, scaled to its on-screen width.
+
+        Rounded to a multiple of 64 so small resizes keep the cached grid.
+        """
+        px = pw.width() * pw.devicePixelRatioF()
+        n = int(2 * px) // 64 * 64
+        return max(self._XS_MIN_SAMPLES, min(self._XS_MAX_SAMPLES, n))
+
     def _needed_bands(self, visible: List[AccessPoint]) -> List[str]:
         if self._band != "All":
             return [self._band] if self._band in self._BAND_EXTENTS else []
         present = {a.band for a in visible if a.band in self._BAND_EXTENTS}
         return [b for b in self._BANDS_ORDER if b in present]
 
+    @classmethod
+    def _band_axis(
+        cls, band: str
+    ) -> Tuple[Dict[float, int], List[Tuple[float, str]]]:
+        """({freq: chan}, bottom-axis ticks) for a band — fixed, so built once."""
+        cached = cls._band_axis_cache.get(band)
+        if cached is not None:
+            return cached
+        xmin, xmax = cls._BAND_EXTENTS[band]
+        tick_src = cls._BAND_TICKS[band]
+        channels = {float(f): c for c, f in tick_src.items() if xmin <= f <= xmax}
+        # Build channel ticks
+        stride = cls._BAND_TICK_STRIDE.get(band, 1)
+        sorted_chan = sorted(tick_src.items(), key=lambda x: x[1])
+        ticks = [
+            (f, str(c))
+            for i, (c, f) in enumerate(sorted_chan)
+            if xmin <= f <= xmax and i % stride == 0
+        ]
+        mixed_ticks: List[Tuple[float, str]] = []
+        if ticks:
+            subband_ticks = [
+                (((x0 + x1) / 2.0), "\n" + lbl)
+                for x0, x1, _c, lbl in _BAND_SUBBAND_HEADERS.get(band, [])
+                if xmin <= ((x0 + x1) / 2.0) <= xmax
+            ]
+            mixed_ticks = sorted(ticks + subband_ticks, key=lambda t: t[0])
+        cached = cls._band_axis_cache[band] = (channels, mixed_ticks)
+        return cached
+
     def _redraw(self):
-        self._items = {}
         visible = [a for a in self._aps if self._band == "All" or a.band == self._band]
         needed = self._needed_bands(visible)
 
-        # Capture current per-band view ranges before any clear/rebuild so zoom/pan
+        # Capture current per-band view ranges before any rebuild so zoom/pan
         # persists across refreshes.
         for band, pw in self._plots.items():
             try:
@@ -515,9 +668,6 @@ class ChannelGraphWidget(QWidget):
         if needed != self._active_bands:
             self._rebuild_panels(needed)
 
-        for pw in self._plots.values():
-            pw.clear()
-
         # If no bands are needed at all (unknown band selected) bail out.
         # Do NOT bail when visible is empty — we still need correct axes.
         if not needed:
@@ -525,27 +675,45 @@ class ChannelGraphWidget(QWidget):
 
         floor = CHAN_DBM_FLOOR
         y_ticks = [(v, str(v)) for v in range(floor, CHAN_DBM_CEIL + 1, 10)]
+        drawn: set = set()
 
         for band, pw in self._plots.items():
             band_aps = [a for a in visible if a.band == band]
             xmin, xmax = self._BAND_EXTENTS[band]
-            xs = np.linspace(xmin, xmax, 2000)
+            n_samples = self._sample_count(pw)
+            xs = self._band_xs.get(band)
+            if xs is None or len(xs) != n_samples:
+                xs = self._band_xs[band] = np.linspace(xmin, xmax, n_samples)
+
+            centers = [get_ap_draw_center(ap) for ap in band_aps]
+            shapes = _channel_shapes(
+                xs, centers, [max(ap.bandwidth_mhz, 20) for ap in band_aps]
+            )
+            # Shared baseline; each AP takes a view of its window
             floor_ys = np.full_like(xs, float(floor))
-            tick_src = self._BAND_TICKS[band]
 
-            for ap in band_aps:
-                color = self._ssid_colors.get(ap.ssid, QColor(FALLBACK_GRAY))
-                # Use the bonded-block center for 5 GHz (not just primary channel)
-                draw_center = get_ap_draw_center(ap)
-                unit = _channel_shape_unit(xs, draw_center, max(ap.bandwidth_mhz, 20))
-                active = unit > 1e-6
-                if not np.any(active):
+            for ap, draw_center, (win, unit_act) in zip(band_aps, centers, shapes):
+                if not unit_act.size:
                     continue
-                xs_act = xs[active]
-                unit_act = unit[active]
-                ys = floor + (ap.dbm - floor) * unit
+                color = self._ssid_colors.get(ap.ssid, QColor(FALLBACK_GRAY))
+                xs_act = xs[win]
                 ys_act = floor + (ap.dbm - floor) * unit_act
-                floor_ys_act = np.full_like(xs_act, float(floor))
+                floor_ys_act = floor_ys[win]
+                drawn.add(ap.bssid)
+
+                items = self._items.get(ap.bssid)
+                if items is not None and items["pw"] is pw:
+                    # Reuse the pooled items; the fill tracks its two curves
+                    items["zero"].setData(xs_act, floor_ys_act)
+                    items["curve"].setData(xs_act, ys_act)
+                    items["color"] = color
+                    if items["text"] != ap.display_ssid:
+                        items["text"] = ap.display_ssid
+                        items["label"].setText(ap.display_ssid)
+                    items["label"].setPos(draw_center, ap.dbm)
+                    continue
+                if items is not None:
+                    self._remove_ap_items(items)
 
                 bc = QColor(color)
                 bc.setAlpha(55)
@@ -565,15 +733,14 @@ class ChannelGraphWidget(QWidget):
                     color=color,
                     anchor=(0.5, 1.1),
                 )
-                lf = QFont()
-                lf.setPointSize(8)
-                lf.setBold(True)
-                label.setFont(lf)
+                label.setFont(_bold_font(8))
                 label.setPos(draw_center, ap.dbm)
                 pw.addItem(label)
 
                 self._items[ap.bssid] = {
                     "color": color,
+                    "text": ap.display_ssid,
+                    "pw": pw,
                     "zero": zero_item,
                     "fill": fill_item,
                     "curve": curve_item,
@@ -581,28 +748,19 @@ class ChannelGraphWidget(QWidget):
                 }
 
             pw.getAxis("left").setTicks([y_ticks])
-            self._band_channels[band] = {
-                float(f): c for c, f in tick_src.items() if xmin <= f <= xmax
-            }
-            # Build channel ticks
-            stride = self._BAND_TICK_STRIDE.get(band, 1)
-            sorted_chan = sorted(tick_src.items(), key=lambda x: x[1])
-            ticks = [
-                (f, str(c))
-                for i, (c, f) in enumerate(sorted_chan)
-                if xmin <= f <= xmax and i % stride == 0
-            ]
-            if ticks:
-                subband_ticks = [
-                    (((x0 + x1) / 2.0), "\n" + lbl)
-                    for x0, x1, _c, lbl in _BAND_SUBBAND_HEADERS.get(band, [])
-                    if xmin <= ((x0 + x1) / 2.0) <= xmax
-                ]
-                mixed_ticks = sorted(ticks + subband_ticks, key=lambda t: t[0])
+            channels, mixed_ticks = self._band_axis(band)
+            if band not in self._band_channels:
+                by_freq = sorted(channels.items())
+                self._band_channels[band] = (
+                    np.array([f for f, _c in by_freq], dtype=np.float64),
+                    [c for _f, c in by_freq],
+                )
+            if mixed_ticks:
                 pw.getAxis("bottom").setTicks([mixed_ticks])
 
-            # ── Band-specific spectrum annotations ─────────────────────────
-            self._draw_band_overlays(band, pw, xmin, xmax)
+            # ── Band-specific spectrum annotations (static per panel) ──────
+            if band not in self._overlays:
+                self._overlays[band] = self._draw_band_overlays(band, pw, xmin, xmax)
 
             # Restore last user zoom/pan if available, otherwise use defaults.
             vr = self._view_ranges.get(band)
@@ -614,6 +772,10 @@ class ChannelGraphWidget(QWidget):
                 pw.setXRange(xmin, xmax, padding=0.01)
                 pw.setYRange(floor, CHAN_DBM_CEIL, padding=0.0)
 
+        # Drop items for APs that vanished or were filtered out
+        for bssid in [b for b in self._items if b not in drawn]:
+            self._remove_ap_items(self._items.pop(bssid))
+
         self._apply_highlight()
 
 
@@ -665,9 +827,11 @@ class SignalHistoryWidget(QWidget):
         self._splitter.setSizes([320, 1200])
         self._plot.scene().sigMouseMoved.connect(self._on_mouse_hover)
 
-        self._history: Dict[str, deque] = defaultdict(
-            lambda: deque(maxlen=HISTORY_SECONDS)
-        )
+        # Per-BSSID ring buffers of (elapsed time, dBm); _history_n counts
+        # total pushes so the oldest slot is at _history_n % HISTORY_SECONDS.
+        self._history_t: Dict[str, np.ndarray] = {}
+        self._history_s: Dict[str, np.ndarray] = {}
+        self._history_n: Dict[str, int] = {}
         self._curves: Dict[str, pg.PlotDataItem] = {}
         self._curve_data: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
         self._ssid_colors: Dict[str, QColor] = {}
@@ -697,12 +861,34 @@ class SignalHistoryWidget(QWidget):
         now = time.time()
         elapsed = now - self._t0
         for ap in aps:
-            self._ssid_map[ap.bssid] = ap.display_ssid
-            self._history[ap.bssid].append((elapsed, ap.dbm))  # store dBm
+            bssid = ap.bssid
+            self._ssid_map[bssid] = ap.display_ssid
+            n = self._history_n.get(bssid)
+            if n is None:
+                n = 0
+                self._history_t[bssid] = np.empty(HISTORY_SECONDS)
+                self._history_s[bssid] = np.empty(HISTORY_SECONDS)
+            head = n % HISTORY_SECONDS
+            self._history_t[bssid][head] = elapsed
+            self._history_s[bssid][head] = ap.dbm  # store dBm
+            self._history_n[bssid] = n + 1
         self._redraw(elapsed)
 
+    def _history_arrays(self, bssid: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Return a BSSID's (times, dBm) history in chronological order."""
+        n = self._history_n[bssid]
+        t_buf = self._history_t[bssid]
+        s_buf = self._history_s[bssid]
+        if n <= HISTORY_SECONDS:
+            return t_buf[:n], s_buf[:n]
+        head = n % HISTORY_SECONDS
+        return (
+            np.concatenate((t_buf[head:], t_buf[:head])),
+            np.concatenate((s_buf[head:], s_buf[:head])),
+        )
+
     def _redraw(self, now_t: float):
-        visible_bssids = set(self._history.keys())
+        visible_bssids = set(self._history_n.keys())
         if self._filter_bssids is not None:
             visible_bssids &= self._filter_bssids
 
@@ -727,13 +913,11 @@ class SignalHistoryWidget(QWidget):
             self._ssid_list.addItem(item)
 
         for bssid in visible_bssids:
-            pts = list(self._history[bssid])
-            if len(pts) < 2:
+            if self._history_n[bssid] < 2:
                 continue
-            ts = np.array([now_t - p[0] for p in pts])  # seconds ago (positive = older)
-            ss = np.array([p[1] for p in pts])
-            # Flip so most recent is on the right
-            ts = -ts  # negative = past
+            t_buf, ss = self._history_arrays(bssid)
+            # Seconds ago, flipped so most recent is on the right (negative = past)
+            ts = t_buf - now_t
 
             ssid = self._ssid_map.get(bssid, bssid)
             color = self._ssid_colors.get(ssid, QColor(FALLBACK_GRAY))
@@ -22,6 +22,10 @@ class MainWindow(MainWindowLogicMixin, MainWindowUIMixin, QMainWindow):
         # Cache for fields that must never regress to 0 / "" / None once known
         self._sticky_cache: Dict[str, dict] = {}  # bssid.lower() → {field: last_good}
         self._conn_counter_prev: Dict[str, Dict[str, int]] = {}
+        # Last applied band filter / refresh interval — re-selecting the same
+        # value is a no-op (see _on_band_change / _on_interval_change).
+        self._current_band: Optional[str] = None
+        self._current_interval: Optional[int] = None
         self._scanner = WiFiScanner(interval_sec=2, linger_secs=60.0)
         self._scanner.data_ready.connect(self._on_data)
         self._scanner.scan_error.connect(self._on_error)
@@ -35,6 +39,12 @@ class MainWindow(MainWindowLogicMixin, MainWindowUIMixin, QMainWindow):
         self._proxy.set_known_ssids(self._known_store.as_frozenset())
 
         self._setup_ui()
+        # Coalesces channel-graph redraws: filter edits, band switches and scan
+        # results arriving in quick succession collapse into a single redraw.
+        self._graph_refresh_timer = QTimer(self)
+        self._graph_refresh_timer.setSingleShot(True)
+        self._graph_refresh_timer.setInterval(20)
+        self._graph_refresh_timer.timeout.connect(self._do_graph_refresh)
         # Apply initial theme styling to the details/connection cards so the
         # first-launch appearance matches what the user sees after any theme switch.
         self._apply_details_theme(True)
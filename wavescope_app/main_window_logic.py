@@ -4,6 +4,8 @@ Contains data-flow, event handlers, selection logic, theming,
 and detail/connection rendering methods for the main window.
 """
 
+import pyqtgraph as pg
+
 from .core import *
 from .core_vendor import _resolve_vendor_icon_path
 from .graphs import ChannelAllocationsDialog
@@ -46,22 +48,25 @@ from .theme import (
     FALLBACK_GRAY,
 )
 
+# Placeholder cell values that make no sense as "Show only" / "Hide" filters.
+# String literals are already interned by the compiler, so membership checks
+# against these sets hash once instead of scanning a tuple per menu entry.
+_SHOW_FILTER_SENTINELS = frozenset({"-", "?", "Unknown"})
+_HIDE_FILTER_SENTINELS = frozenset({"-", "?"})
+
 
 class MainWindowLogicMixin:
     def _visible_aps(self) -> List[AccessPoint]:
         """Return the AccessPoint objects currently visible in the filtered table."""
-        result: List[AccessPoint] = []
-        for row in range(self._proxy.rowCount()):
-            src_idx = self._proxy.mapToSource(self._proxy.index(row, 0))
-            ap = self._model.ap_at(src_idx.row())
-            if ap is not None:
-                result.append(ap)
-        return result
+        return self._proxy.visible_aps()
+
+    def _do_graph_refresh(self):
+        """Redraw the channel graph from the currently visible APs."""
+        self._channel_graph.update_aps(self._visible_aps(), self._model.ssid_colors())
 
     def _on_filter_changed(self):
         """Called whenever the proxy filter changes — sync the channel graph."""
-        visible = self._visible_aps()
-        self._channel_graph.update_aps(visible, self._model.ssid_colors())
+        self._graph_refresh_timer.start()
         shown = self._proxy.rowCount()
         self._lbl_count.setText(f"  {shown}/{len(self._aps)} APs")
 
@@ -91,7 +96,7 @@ class MainWindowLogicMixin:
     def _restore_selection_bssids(
         self, selected_bssids: set[str], focused_bssid: Optional[str]
     ) -> None:
-        """Restore table selection by BSSID after a model reset."""
+        """Restore table selection by BSSID after a model update."""
         sm = self._table.selectionModel()
         if sm is None:
             return
@@ -209,7 +214,8 @@ class MainWindowLogicMixin:
         If the table is narrower than the viewport, distribute the extra space
         across columns so it still fills cleanly. If the content is wider than
         the viewport, keep the natural widths and let the horizontal scrollbar
-        handle the overflow instead of compressing columns.
+        handle the overflow instead of compressing columns.  Columns the user
+        has resized by hand keep their width and take no share of the extra.
         """
         model = self._table.model()
         if model is None:
@@ -229,9 +235,16 @@ class MainWindowLogicMixin:
 
         fm = self._table.fontMetrics()
         hfm = hdr.fontMetrics()
+        user_sized = self._user_sized_cols
+        auto_cols = [c for c in range(col_count) if c not in user_sized]
+        if not auto_cols:
+            return
 
         required: List[int] = []
         for col in range(col_count):
+            if col in user_sized:
+                required.append(hdr.sectionSize(col))
+                continue
             header_text = str(
                 model.headerData(
                     col, Qt.Orientation.Horizontal, Qt.ItemDataRole.DisplayRole
@@ -240,37 +253,40 @@ class MainWindowLogicMixin:
             )
             w = hfm.horizontalAdvance(header_text) + 28
 
-            for row in range(row_count):
-                idx = model.index(row, col)
-                text = str(model.data(idx, Qt.ItemDataRole.DisplayRole) or "")
-                if text:
-                    w = max(w, fm.horizontalAdvance(text) + 24)
+            # Columns repeat a handful of values (band, security, channel…);
+            # shape each distinct string once.
+            display = Qt.ItemDataRole.DisplayRole
+            texts = {
+                str(model.data(model.index(row, col), display) or "")
+                for row in range(row_count)
+            }
+            texts.discard("")
+            for text in texts:
+                w = max(w, fm.horizontalAdvance(text) + 24)
 
             required.append(max(min_w, w))
 
         widths = required[:]
 
-        # If there's remaining room, distribute it across all columns
+        # If there's remaining room, distribute it across the auto-sized columns
         total = sum(widths)
         if total < viewport_w:
             extra = viewport_w - total
-            weight_sum = sum(required) or col_count
-            adds = [int(extra * (w / weight_sum)) for w in required]
-            widths = [w + a for w, a in zip(widths, adds)]
+            weight_sum = sum(required[c] for c in auto_cols) or len(auto_cols)
+            for c in auto_cols:
+                widths[c] += int(extra * (required[c] / weight_sum))
 
             # Rounding fix-up: spread leftover pixels across columns
             rem = viewport_w - sum(widths)
             if rem > 0:
-                order = sorted(
-                    range(col_count), key=lambda i: required[i], reverse=True
-                )
+                order = sorted(auto_cols, key=lambda i: required[i], reverse=True)
                 for i in range(rem):
-                    widths[order[i % col_count]] += 1
+                    widths[order[i % len(order)]] += 1
 
         self._suspend_col_resize_tracking = True
         try:
-            for col, w in enumerate(widths):
-                self._table.setColumnWidth(col, max(min_w, w))
+            for col in auto_cols:
+                self._table.setColumnWidth(col, max(min_w, widths[col]))
         finally:
             self._suspend_col_resize_tracking = False
 
@@ -282,7 +298,7 @@ class MainWindowLogicMixin:
         # a real value was seen before (e.g. bandwidth_mhz=0 for 6 GHz when
         # nmcli loses the parse):  keep the last known-good value.
         for ap in aps:
-            key = ap.bssid.lower()
+            key = ap.bssid_lower
             cache = self._sticky_cache.setdefault(key, {})
             for field in self._STICKY_NONZERO_FIELDS:
                 val = getattr(ap, field)
@@ -295,7 +311,7 @@ class MainWindowLogicMixin:
         # pmf is set to "No" / "Optional" / "Required" by iw for every AP it
         # sees; a blank pmf means iw missed this AP on this cycle.
         for ap in aps:
-            key = ap.bssid.lower()
+            key = ap.bssid_lower
             if ap.pmf != "":
                 # iw enriched this AP — refresh cache, reset miss counter
                 self._iw_cache[key] = {
@@ -306,13 +322,14 @@ class MainWindowLogicMixin:
                 # iw missed this AP but we have recent data — restore it
                 for f, v in self._iw_cache[key].items():
                     setattr(ap, f, v)
+                ap.invalidate_derived()
                 self._iw_miss[key] = self._iw_miss.get(key, 0) + 1
 
         # ── connected counter deltas (retry/fail rates) ───────────────────
         for ap in aps:
             if not ap.in_use:
                 continue
-            key = ap.bssid.lower()
+            key = ap.bssid_lower
             prev = self._conn_counter_prev.get(key)
             if (
                 prev
@@ -349,9 +366,10 @@ class MainWindowLogicMixin:
         self._model.update(aps)
         if selected_bssids:
             self._restore_selection_bssids(selected_bssids, focused_bssid)
-        # model.update() emits modelReset (not layoutChanged), so the proxy's
-        # layoutChanged won't fire — update the graph explicitly here.
-        self._channel_graph.update_aps(self._visible_aps(), self._model.ssid_colors())
+        # model.update() diffs rows in place, which only triggers the proxy's
+        # layoutChanged when the sort order moves — schedule the graph refresh
+        # explicitly so signal changes always reach the graph.
+        self._graph_refresh_timer.start()
         self._history_graph.set_ssid_colors(self._model.ssid_colors())
         self._history_graph.push(aps)
         self._auto_size_table_columns()
@@ -420,12 +438,10 @@ class MainWindowLogicMixin:
             plot_bg, plot_fg = GRAPH_BG_LIGHT, GRAPH_FG_LIGHT
             is_dark = False
         else:  # auto — match system dark/light, use our own palette
-            from PyQt6.QtCore import Qt as _Qt
-
             cs = app.styleHints().colorScheme()
-            if cs == _Qt.ColorScheme.Dark:
+            if cs == Qt.ColorScheme.Dark:
                 is_dark = True
-            elif cs == _Qt.ColorScheme.Light:
+            elif cs == Qt.ColorScheme.Light:
                 is_dark = False
             else:  # Unknown — probe style's default palette
                 sp = app.style().standardPalette()
@@ -505,13 +521,20 @@ class MainWindowLogicMixin:
         self._auto_size_table_columns()
 
     def _on_band_change(self, band: str):
-        self._proxy.set_band(
-            band
-        )  # → invalidateFilter → layoutChanged → _on_filter_changed
-        self._channel_graph.set_band(band)
+        if band == self._current_band:
+            return
+        self._current_band = band
+        # The graph redraw is deferred to the coalescing refresh timer, which
+        # set_band → invalidateFilter → layoutChanged → _on_filter_changed starts.
+        self._channel_graph.set_band(band, redraw=False)
+        self._proxy.set_band(band)
+        self._graph_refresh_timer.start()
 
     def _on_interval_change(self, idx: int):
         secs = REFRESH_INTERVALS[idx]
+        if secs == self._current_interval:
+            return
+        self._current_interval = secs
         self._scanner.set_interval(secs)
 
     def _on_linger_change(self, secs: int):
@@ -574,13 +597,24 @@ class MainWindowLogicMixin:
             self._table.clearSelection()
             self._history_graph.filter_bssids(None)
             return
-        # Find the row for this bssid and select it
+        # Find the row for this bssid and select it.  Selection signals are
+        # blocked so _on_selection_change doesn't redo the details/filter work
+        # below a second time; the graph has already applied its highlight.
         for row in range(self._model.rowCount()):
             ap = self._model.ap_at(row)
             if ap and ap.bssid == bssid:
                 proxy_row = self._proxy.mapFromSource(self._model.index(row, 0)).row()
                 if proxy_row >= 0:
-                    self._table.selectRow(proxy_row)
+                    sm = self._table.selectionModel()
+                    sm.blockSignals(True)
+                    try:
+                        self._table.selectRow(proxy_row)
+                    finally:
+                        sm.blockSignals(False)
+                    # Blocked currentChanged no longer scrolls the view for us
+                    self._table.scrollTo(self._proxy.index(proxy_row, 0))
+                    self._table.viewport().update()
+                    self._show_details(ap)
                 break
         self._history_graph.filter_bssids({bssid})
 
@@ -601,12 +635,18 @@ class MainWindowLogicMixin:
         ap = self._model.ap_at(src_idx.row())
         if ap:
             self._show_details(ap)
-            selected_bssids = set()
-            for pi in indexes:
-                si = self._proxy.mapToSource(pi)
-                a = self._model.ap_at(si.row())
-                if a:
-                    selected_bssids.add(a.bssid)
+            if len(indexes) == 1:
+                # Common single-row click — no need to map the rows again
+                selected_bssids = {ap.bssid}
+            else:
+                selected_bssids = {
+                    a.bssid
+                    for a in (
+                        self._model.ap_at(self._proxy.mapToSource(pi).row())
+                        for pi in indexes
+                    )
+                    if a
+                }
             self._history_graph.filter_bssids(selected_bssids)
             # Highlight single selection in channel graph
             single_bssid = ap.bssid if len(selected_bssids) == 1 else None
@@ -652,7 +692,7 @@ class MainWindowLogicMixin:
         # Show only
         show_menu = menu.addMenu("👁  Show only")
         for fcol, fval, fname in filterable:
-            if fval and fval not in ("-", "?", "Unknown"):
+            if fval and fval not in _SHOW_FILTER_SENTINELS:
                 short = fval[:32] + ("…" if len(fval) > 32 else "")
                 a = show_menu.addAction(f"{fname}: {short}")
                 a.triggered.connect(
@@ -672,7 +712,7 @@ class MainWindowLogicMixin:
         # Hide / exclude
         hide_menu = menu.addMenu("🚫  Hide")
         for fcol, fval, fname in filterable:
-            if fval and fval not in ("-", "?"):
+            if fval and fval not in _HIDE_FILTER_SENTINELS:
                 short = fval[:32] + ("…" if len(fval) > 32 else "")
                 a = hide_menu.addAction(f"{fname}: {short}")
                 a.triggered.connect(
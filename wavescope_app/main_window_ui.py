@@ -8,13 +8,29 @@ from .graphs import ChannelGraphWidget, SignalHistoryWidget
 from .ap_sidebar import APGroupSidebar
 from .known_ssids import KnownSSIDStore, KnownSSIDDialog
 
+# ── Shared toolbar button styles ─────────────────────────────────────────
+_QSS_TOOL_BTN = (
+    f"QPushButton {{ color:{BTN_ACCENT}; border:1px solid {BTN_BORDER};"
+    f" border-radius:3px; padding:2px 8px; background:transparent; }}"
+    f"QPushButton:hover {{ background:{BTN_HOVER_BG}; }}"
+)
+_QSS_TOOL_BTN_CHECKABLE = _QSS_TOOL_BTN + (
+    f"QPushButton:checked {{ color:{BTN_CHECKED_TEXT};"
+    f" border-color:{BTN_CHECKED_BORDER}; background:{BTN_CHECKED_BG}; }}"
+)
+_QSS_CLEAR_FILTERS_BTN = (
+    f"QPushButton{{color:{BTN_CHECKED_TEXT};border:1px solid {BTN_CHECKED_TEXT};"
+    f"border-radius:3px;padding:1px 6px;font-size:9pt;}}"
+    f"QPushButton:hover{{background:{BTN_CHECKED_BG};}}"
+)
+
 
 class MainWindowUIMixin:
     def _setup_ui(self):
         # ── Toolbar ────────────────────────────────────────────────────────
         tb = QToolBar("Main Toolbar")
         tb.setMovable(False)
-        tb.setIconSize(pg.QtCore.QSize(16, 16))
+        tb.setIconSize(QSize(16, 16))
         self.addToolBar(tb)
 
         # ── Shared style helpers ────────────────────────────────────────
@@ -22,19 +38,6 @@ class MainWindowUIMixin:
         _GROUP_BDR = "#1c2e44"
         _GROUP_LBL = "#3a5880"
 
-        def _btn_ss(checkable=False) -> str:
-            s = (
-                f"QPushButton {{ color:{BTN_ACCENT}; border:1px solid {BTN_BORDER};"
-                f" border-radius:3px; padding:2px 8px; background:transparent; }}"
-                f"QPushButton:hover {{ background:{BTN_HOVER_BG}; }}"
-            )
-            if checkable:
-                s += (
-                    f"QPushButton:checked {{ color:{BTN_CHECKED_TEXT};"
-                    f" border-color:{BTN_CHECKED_BORDER}; background:{BTN_CHECKED_BG}; }}"
-                )
-            return s
-
         def _make_group(label: str, widgets: list) -> QFrame:
             """Wrap *widgets* in a labelled rounded-rect pill."""
             frame = QFrame()
@@ -65,7 +68,7 @@ class MainWindowUIMixin:
         # ── SCAN group widgets ──────────────────────────────────────────
         self._btn_pause = QPushButton("⏸ Pause")
         self._btn_pause.setCheckable(True)
-        self._btn_pause.setStyleSheet(_btn_ss(checkable=True))
+        self._btn_pause.setStyleSheet(_QSS_TOOL_BTN_CHECKABLE)
         self._btn_pause.toggled.connect(self._on_pause)
 
         self._interval_combo = QComboBox()
@@ -88,7 +91,7 @@ class MainWindowUIMixin:
 
         # ⚙ Tools drop-down (OUI + Capture — less-frequent actions)
         self._btn_tools = QPushButton("⚙ Tools ▾")
-        self._btn_tools.setStyleSheet(_btn_ss())
+        self._btn_tools.setStyleSheet(_QSS_TOOL_BTN)
         self._btn_tools.setToolTip("OUI database and packet capture")
         _tools_menu = QMenu(self)
         _tools_menu.addAction("📖  Update OUI Database", self._on_update_oui)
@@ -105,7 +108,7 @@ class MainWindowUIMixin:
         self._btn_sidebar.setCheckable(True)
         self._btn_sidebar.setChecked(True)
         self._btn_sidebar.setToolTip("Show / hide the Access Point sidebar")
-        self._btn_sidebar.setStyleSheet(_btn_ss(checkable=True))
+        self._btn_sidebar.setStyleSheet(_QSS_TOOL_BTN_CHECKABLE)
         self._btn_sidebar.toggled.connect(self._on_sidebar_toggle)
 
         # ── FILTER group widgets ────────────────────────────────────────
@@ -134,7 +137,7 @@ class MainWindowUIMixin:
 
         self._btn_known_edit = QPushButton("Edit…")
         self._btn_known_edit.setToolTip("Open the Known SSIDs manager")
-        self._btn_known_edit.setStyleSheet(_btn_ss())
+        self._btn_known_edit.setStyleSheet(_QSS_TOOL_BTN)
         self._btn_known_edit.setSizePolicy(
             QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Preferred
         )
@@ -171,11 +174,7 @@ class MainWindowUIMixin:
         self._lbl_filters.hide()
 
         self._btn_clear_filters = QPushButton("✕ Clear filters")
-        self._btn_clear_filters.setStyleSheet(
-            f"QPushButton{{color:{BTN_CHECKED_TEXT};border:1px solid {BTN_CHECKED_TEXT};"
-            f"border-radius:3px;padding:1px 6px;font-size:9pt;}}"
-            f"QPushButton:hover{{background:{BTN_CHECKED_BG};}}"
-        )
+        self._btn_clear_filters.setStyleSheet(_QSS_CLEAR_FILTERS_BTN)
         self._btn_clear_filters.clicked.connect(self._on_clear_col_filters)
         self._btn_clear_filters.hide()
 
@@ -225,11 +224,14 @@ class MainWindowUIMixin:
         # ── AP Table ───────────────────────────────────────────────────────
         self._table = QTableView()
         self._table.setModel(self._proxy)
+        self._table.setItemDelegate(APRowDelegate(self._table))
         self._table.setIconSize(QSize(VENDOR_ICON_MAX_W, VENDOR_ICON_MAX_H))
         self._table.setSortingEnabled(True)
         self._table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self._table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self._table.setAlternatingRowColors(False)
+        # Subtle AlternateBase row shading; done by the view so it follows the
+        # sorted (proxy) row order rather than the source model's row order.
+        self._table.setAlternatingRowColors(True)
         self._table.verticalHeader().hide()
         hdr = self._table.horizontalHeader()
         hdr.setMinimumSectionSize(36)